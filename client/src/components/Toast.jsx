@@ -1,121 +1,121 @@
-import React, { useState, useEffect } from 'react'
-
-const Toast = ({ message, type = 'info', duration = 5000, onClose }) => {
-  const [isVisible, setIsVisible] = useState(true)
-  const [isLeaving, setIsLeaving] = useState(false)
-
-  useEffect(() => {
-    const timer = setTimeout(() => {
-      handleClose()
-    }, duration)
-
-    return () => clearTimeout(timer)
-  }, [duration])
-
-  const handleClose = () => {
-    setIsLeaving(true)
-    setTimeout(() => {
-      setIsVisible(false)
-      onClose?.()
-    }, 300)
-  }
-
-  const getToastStyles = () => {
-    const baseStyles = "fixed top-4 right-4 z-50 max-w-sm w-full bg-white shadow-lg rounded-lg pointer-events-auto ring-1 ring-black ring-opacity-5 overflow-hidden transform transition-all duration-300 ease-in-out"
-    
-    if (isLeaving) {
-      return `${baseStyles} translate-x-full opacity-0`
-    }
-    
-    return `${baseStyles} translate-x-0 opacity-100`
-  }
-
-  const getIconAndColors = () => {
-    switch (type) {
-      case 'success':
-        return {
-          icon: (
-            <svg className="w-5 h-5 text-green-400" fill="currentColor" viewBox="0 0 20 20">
-              <path fillRule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zm3.707-9.293a1 1 0 00-1.414-1.414L9 10.586 7.707 9.293a1 1 0 00-1.414 1.414l2 2a1 1 0 001.414 0l4-4z" clipRule="evenodd" />
-            </svg>
-          ),
-          bgColor: "bg-green-50",
-          borderColor: "border-green-200",
-          textColor: "text-green-800",
-          iconBg: "bg-green-100"
-        }
-      case 'error':
-        return {
-          icon: (
-            <svg className="w-5 h-5 text-red-400" fill="currentColor" viewBox="0 0 20 20">
-              <path fillRule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zM8.707 7.293a1 1 0 00-1.414 1.414L8.586 10l-1.293 1.293a1 1 0 101.414 1.414L10 11.414l1.293 1.293a1 1 0 001.414-1.414L11.414 10l1.293-1.293a1 1 0 00-1.414-1.414L10 8.586 8.707 7.293z" clipRule="evenodd" />
-            </svg>
-          ),
-          bgColor: "bg-red-50",
-          borderColor: "border-red-200",
-          textColor: "text-red-800",
-          iconBg: "bg-red-100"
-        }
-      case 'warning':
-        return {
-          icon: (
-            <svg className="w-5 h-5 text-yellow-400" fill="currentColor" viewBox="0 0 20 20">
-              <path fillRule="evenodd" d="M8.257 3.099c.765-1.36 2.722-1.36 3.486 0l5.58 9.92c.75 1.334-.213 2.98-1.742 2.98H4.42c-1.53 0-2.493-1.646-1.743-2.98l5.58-9.92zM11 13a1 1 0 11-2 0 1 1 0 012 0zm-1-8a1 1 0 00-1 1v3a1 1 0 002 0V6a1 1 0 00-1-1z" clipRule="evenodd" />
-            </svg>
-          ),
-          bgColor: "bg-yellow-50",
-          borderColor: "border-yellow-200",
-          textColor: "text-yellow-800",
-          iconBg: "bg-yellow-100"
-        }
-      default:
-        return {
-          icon: (
-            <svg className="w-5 h-5 text-blue-400" fill="currentColor" viewBox="0 0 20 20">
-              <path fillRule="evenodd" d="M18 10a8 8 0 11-16 0 8 8 0 0116 0zm-7-4a1 1 0 11-2 0 1 1 0 012 0zM9 9a1 1 0 000 2v3a1 1 0 001 1h1a1 1 0 100-2v-3a1 1 0 00-1-1H9z" clipRule="evenodd" />
-            </svg>
-          ),
-          bgColor: "bg-blue-50",
-          borderColor: "border-blue-200",
-          textColor: "text-blue-800",
-          iconBg: "bg-blue-100"
-        }
-    }
-  }
-
-  if (!isVisible) return null
-
-  const { icon, bgColor, borderColor, textColor, iconBg } = getIconAndColors()
-
-  return (
-    <div className={getToastStyles()}>
-      <div className={`p-4 border-l-4 ${borderColor} ${bgColor}`}>
-        <div className="flex items-start">
-          <div className={`flex-shrink-0 ${iconBg} rounded-full p-1`}>
-            {icon}
-          </div>
-          <div className="ml-3 w-0 flex-1">
-            <p className={`text-sm font-medium ${textColor}`}>
-              {message}
-            </p>
-          </div>
-          <div className="ml-4 flex-shrink-0 flex">
-            <button
-              className={`${bgColor} rounded-md inline-flex ${textColor} hover:opacity-75 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500`}
-              onClick={handleClose}
-            >
-              <span className="sr-only">Close</span>
-              <svg className="h-5 w-5" viewBox="0 0 20 20" fill="currentColor">
-                <path fillRule="evenodd" d="M4.293 4.293a1 1 0 011.414 0L10 8.586l4.293-4.293a1 1 0 111.414 1.414L11.414 10l4.293 4.293a1 1 0 01-1.414 1.414L10 11.414l-4.293 4.293a1 1 0 01-1.414-1.414L8.586 10 4.293 5.707a1 1 0 010-1.414z" clipRule="evenodd" />
-              </svg>
-            </button>
-          </div>
-        </div>
-      </div>
-    </div>
-  )
-}
-
-export default Toast
-
-
+import React, { useState, useEffect } from 'react'
+
+const Toast = ({ message, type = 'info', duration = 5000, onClose }) => {
+  const [isVisible, setIsVisible] = useState(true)
+  const [isLeaving, setIsLeaving] = useState(false)
+
+  useEffect(() => {
+    const timer = setTimeout(() => {
+      handleClose()
+    }, duration)
+
+    return () => clearTimeout(timer)
+  }, [duration])
+
+  const handleClose = () => {
+    setIsLeaving(true)
+    setTimeout(() => {
+      setIsVisible(false)
+      onClose?.()
+    }, 300)
+  }
+
+  const getToastStyles = () => {
+    const baseStyles = "fixed top-4 right-4 z-50 max-w-sm w-full bg-white shadow-lg rounded-lg pointer-events-auto ring-1 ring-black ring-opacity-5 overflow-hidden transform transition-all duration-300 ease-in-out"
+    
+    if (isLeaving) {
+      return `${baseStyles} translate-x-full opacity-0`
+    }
+    
+    return `${baseStyles} translate-x-0 opacity-100`
+  }
+
+  const getIconAndColors = () => {
+    switch (type) {
+      case 'success':
+        return {
+          icon: (
+            <svg className="w-5 h-5 text-green-400" fill="currentColor" viewBox="0 0 20 20">
+              <path fillRule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zm3.707-9.293a1 1 0 00-1.414-1.414L9 10.586 7.707 9.293a1 1 0 00-1.414 1.414l2 2a1 1 0 001.414 0l4-4z" clipRule="evenodd" />
+            </svg>
+          ),
+          bgColor: "bg-green-50",
+          borderColor: "border-green-200",
+          textColor: "text-green-800",
+          iconBg: "bg-green-100"
+        }
+      case 'error':
+        return {
+          icon: (
+            <svg className="w-5 h-5 text-red-400" fill="currentColor" viewBox="0 0 20 20">
+              <path fillRule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zM8.707 7.293a1 1 0 00-1.414 1.414L8.586 10l-1.293 1.293a1 1 0 101.414 1.414L10 11.414l1.293 1.293a1 1 0 001.414-1.414L11.414 10l1.293-1.293a1 1 0 00-1.414-1.414L10 8.586 8.707 7.293z" clipRule="evenodd" />
+            </svg>
+          ),
+          bgColor: "bg-red-50",
+          borderColor: "border-red-200",
+          textColor: "text-red-800",
+          iconBg: "bg-red-100"
+        }
+      case 'warning':
+        return {
+          icon: (
+            <svg className="w-5 h-5 text-yellow-400" fill="currentColor" viewBox="0 0 20 20">
+              <path fillRule="evenodd" d="M8.257 3.099c.765-1.36 2.722-1.36 3.486 0l5.58 9.92c.75 1.334-.213 2.98-1.742 2.98H4.42c-1.53 0-2.493-1.646-1.743-2.98l5.58-9.92zM11 13a1 1 0 11-2 0 1 1 0 012 0zm-1-8a1 1 0 00-1 1v3a1 1 0 002 0V6a1 1 0 00-1-1z" clipRule="evenodd" />
+            </svg>
+          ),
+          bgColor: "bg-yellow-50",
+          borderColor: "border-yellow-200",
+          textColor: "text-yellow-800",
+          iconBg: "bg-yellow-100"
+        }
+      default:
+        return {
+          icon: (
+            <svg className="w-5 h-5 text-blue-400" fill="currentColor" viewBox="0 0 20 20">
+              <path fillRule="evenodd" d="M18 10a8 8 0 11-16 0 8 8 0 0116 0zm-7-4a1 1 0 11-2 0 1 1 0 012 0zM9 9a1 1 0 000 2v3a1 1 0 001 1h1a1 1 0 100-2v-3a1 1 0 00-1-1H9z" clipRule="evenodd" />
+            </svg>
+          ),
+          bgColor: "bg-blue-50",
+          borderColor: "border-blue-200",
+          textColor: "text-blue-800",
+          iconBg: "bg-blue-100"
+        }
+    }
+  }
+
+  if (!isVisible) return null
+
+  const { icon, bgColor, borderColor, textColor, iconBg } = getIconAndColors()
+
+  return (
+    <div className={getToastStyles()}>
+      <div className={`p-4 border-l-4 ${borderColor} ${bgColor}`}>
+        <div className="flex items-start">
+          <div className={`flex-shrink-0 ${iconBg} rounded-full p-1`}>
+            {icon}
+          </div>
+          <div className="ml-3 w-0 flex-1">
+            <p className={`text-sm font-medium ${textColor}`}>
+              {message}
+            </p>
+          </div>
+          <div className="ml-4 flex-shrink-0 flex">
+            <button
+              className={`${bgColor} rounded-md inline-flex ${textColor} hover:opacity-75 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500`}
+              onClick={handleClose}
+            >
+              <span className="sr-only">Close</span>
+              <svg className="h-5 w-5" viewBox="0 0 20 20" fill="currentColor">
+                <path fillRule="evenodd" d="M4.293 4.293a1 1 0 011.414 0L10 8.586l4.293-4.293a1 1 0 111.414 1.414L11.414 10l4.293 4.293a1 1 0 01-1.414 1.414L10 11.414l-4.293 4.293a1 1 0 01-1.414-1.414L8.586 10 4.293 5.707a1 1 0 010-1.414z" clipRule="evenodd" />
+              </svg>
+            </button>
+          </div>
+        </div>
+      </div>
+    </div>
+  )
+}
+
+export default Toast
+
+
@@ -1,57 +1,57 @@
-import React, { createContext, useContext, useState, useEffect } from 'react'
-
-const ThemeContext = createContext()
-
-export const useTheme = () => {
-  const context = useContext(ThemeContext)
-  if (!context) {
-    throw new Error('useTheme must be used within a ThemeProvider')
-  }
-  return context
-}
-
-export const ThemeProvider = ({ children }) => {
-  const [isDarkMode, setIsDarkMode] = useState(false)
-
-  useEffect(() => {
-    // Check if user has a theme preference in localStorage
-    const savedTheme = localStorage.getItem('theme')
-    
-    if (savedTheme) {
-      const isDark = savedTheme === 'dark'
-      setIsDarkMode(isDark)
-      updateDocumentClass(isDark)
-    } else {
-      // Check system preference
-      const prefersDark = window.matchMedia('(prefers-color-scheme: dark)').matches
-      setIsDarkMode(prefersDark)
-      updateDocumentClass(prefersDark)
-    }
-  }, [])
-
-  const updateDocumentClass = (isDark) => {
-    if (isDark) {
-      document.documentElement.classList.add('dark')
-    } else {
-      document.documentElement.classList.remove('dark')
-    }
-  }
-
-  const toggleTheme = () => {
-    const newIsDarkMode = !isDarkMode
-    setIsDarkMode(newIsDarkMode)
-    localStorage.setItem('theme', newIsDarkMode ? 'dark' : 'light')
-    updateDocumentClass(newIsDarkMode)
-  }
-
-  const value = {
-    isDarkMode,
-    toggleTheme
-  }
-
-  return (
-    <ThemeContext.Provider value={value}>
-      {children}
-    </ThemeContext.Provider>
-  )
-}
+import React, { createContext, useContext, useState, useEffect } from 'react'
+
+const ThemeContext = createContext()
+
+export const useTheme = () => {
+  const context = useContext(ThemeContext)
+  if (!context) {
+    throw new Error('useTheme must be used within a ThemeProvider')
+  }
+  return context
+}
+
+export const ThemeProvider = ({ children }) => {
+  const [isDarkMode, setIsDarkMode] = useState(false)
+
+  useEffect(() => {
+    // Check if user has a theme preference in localStorage
+    const savedTheme = localStorage.getItem('theme')
+    
+    if (savedTheme) {
+      const isDark = savedTheme === 'dark'
+      setIsDarkMode(isDark)
+      updateDocumentClass(isDark)
+    } else {
+      // Check system preference
+      const prefersDark = window.matchMedia('(prefers-color-scheme: dark)').matches
+      setIsDarkMode(prefersDark)
+      updateDocumentClass(prefersDark)
+    }
+  }, [])
+
+  const updateDocumentClass = (isDark) => {
+    if (isDark) {
+      document.documentElement.classList.add('dark')
+    } else {
+      document.documentElement.classList.remove('dark')
+    }
+  }
+
+  const toggleTheme = () => {
+    const newIsDarkMode = !isDarkMode
+    setIsDarkMode(newIsDarkMode)
+    localStorage.setItem('theme', newIsDarkMode ? 'dark' : 'light')
+    updateDocumentClass(newIsDarkMode)
+  }
+
+  const value = {
+    isDarkMode,
+    toggleTheme
+  }
+
+  return (
+    <ThemeContext.Provider value={value}>
+      {children}
+    </ThemeContext.Provider>
+  )
+}
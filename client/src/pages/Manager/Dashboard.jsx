@@ -3,6 +3,9 @@ import { useAuth } from '../../contexts/AuthContext'
 import { useToast } from '../../contexts/ToastContext'
 import apiService from '../../services/apiService'
 
+// Requests shown per list; counts come from /leave/stats
+const PAGE_SIZE = 20
+
 const ManagerDashboard = () => {
   const { user } = useAuth()
   const { showSuccess, showError, showWarning, showInfo } = useToast()
@@ -18,6 +21,7 @@ const ManagerDashboard = () => {
     pendingCount: 0,
     approvedThisMonth: 0,
     rejectedThisMonth: 0,
+    processedCount: 0,
     teamMembers: 0
   })
 
@@ -26,33 +30,35 @@ const ManagerDashboard = () => {
     loadDashboardData()
   }, [])
 
-  const loadDashboardData = async () => {
+  // Reload when a request is submitted to or processed by this manager. A
+  // new submission only changes the pending list; decisions and resyncs
+  // (event is null) change both.
+  useEffect(() => {
+    return apiService.subscribeToLeaveEvents((event) =>
+      loadDashboardData({ processed: !event || event.type !== 'submitted' })
+    )
+  }, [])
+
+  const loadDashboardData = async ({ processed = true } = {}) => {
     try {
       setLoading(true)
       
-      // Load pending leaves
-      const pending = await apiService.getPendingApprovals()
+      const [pending, processedPage, stats] = await Promise.all([
+        apiService.getPendingApprovals({ limit: PAGE_SIZE }),
+        processed ? apiService.getProcessedApprovals({ limit: PAGE_SIZE }) : null,
+        apiService.getLeaveStats('team')
+      ])
       setPendingLeaves(pending)
+      if (processedPage) {
+        setProcessedLeaves(processedPage)
+      }
       
-      // Load processed leaves
-      const processed = await apiService.getProcessedApprovals()
-      setProcessedLeaves(processed)
-      
-      // Calculate stats from processed leaves
-      const approvedThisMonth = processed.filter(leave => 
-        leave.status === 'approved' && 
-        new Date(leave.action_timestamp).getMonth() === new Date().getMonth()
-      ).length
-      
-      const rejectedThisMonth = processed.filter(leave => 
-        leave.status === 'rejected' && 
-        new Date(leave.action_timestamp).getMonth() === new Date().getMonth()
-      ).length
-      
+      // Counted server-side across the full history, not just the loaded page
       setDashboardStats({
-        pendingCount: pending.length,
-        approvedThisMonth: approvedThisMonth,
-        rejectedThisMonth: rejectedThisMonth,
+        pendingCount: stats.by_status.pending || 0,
+        approvedThisMonth: stats.processed_this_month.approved,
+        rejectedThisMonth: stats.processed_this_month.rejected,
+        processedCount: (stats.by_status.approved || 0) + (stats.by_status.rejected || 0),
         teamMembers: 0 // Would need backend endpoint to calculate
       })
       
@@ -66,7 +72,7 @@ const ManagerDashboard = () => {
   const loadPendingLeaves = async () => {
     try {
       setLoading(true)
-      const leaves = await apiService.getPendingApprovals()
+      const leaves = await apiService.getPendingApprovals({ limit: PAGE_SIZE })
       setPendingLeaves(leaves)
     } catch (error) {
       console.error('Failed to load pending leaves:', error)
@@ -78,7 +84,7 @@ const ManagerDashboard = () => {
   const loadProcessedLeaves = async () => {
     try {
       setLoading(true)
-      const leaves = await apiService.getProcessedApprovals()
+      const leaves = await apiService.getProcessedApprovals({ limit: PAGE_SIZE })
       setProcessedLeaves(leaves)
     } catch (error) {
       console.error('Failed to load processed leaves:', error)
@@ -220,7 +226,7 @@ const ManagerDashboard = () => {
                 : 'border-transparent text-gray-500 hover:text-gray-700 hover:border-gray-300'
             }`}
           >
-            Pending Requests ({pendingLeaves.length})
+            Pending Requests ({dashboardStats.pendingCount})
           </button>
           <button
             onClick={() => {
@@ -233,7 +239,7 @@ const ManagerDashboard = () => {
                 : 'border-transparent text-gray-500 hover:text-gray-700 hover:border-gray-300'
             }`}
           >
-            Processed Requests ({processedLeaves.length})
+            Processed Requests ({dashboardStats.processedCount})
           </button>
         </nav>
       </div>
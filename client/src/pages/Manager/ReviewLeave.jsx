@@ -1,8 +1,8 @@
-import React from 'react';
-
-const ReviewLeave = () => {
-  // This can be expanded for more detailed review features if needed
-  return null;
-};
-
-export default ReviewLeave;
+import React from 'react';
+
+const ReviewLeave = () => {
+  // This can be expanded for more detailed review features if needed
+  return null;
+};
+
+export default ReviewLeave;
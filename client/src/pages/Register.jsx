@@ -1,332 +1,332 @@
-import React, { useState } from 'react'
-import { Link, useNavigate } from 'react-router-dom'
-import { useAuth } from '../contexts/AuthContext'
-import ThemeToggle from '../components/ThemeToggle'
-
-const Register = () => {
-	const [formData, setFormData] = useState({
-		username: '',
-		full_name: '',
-		email: '',
-		password: '',
-		confirmPassword: '',
-		role: 'employee',
-		department: '',
-	})
-	const [errors, setErrors] = useState({})
-	const [isLoading, setIsLoading] = useState(false)
-	const { register } = useAuth()
-	const navigate = useNavigate()
-
-	const handleChange = (e) => {
-		const { name, value } = e.target
-		setFormData(prev => ({
-			...prev,
-			[name]: value
-		}))
-		// Clear error when user starts typing
-		if (errors[name]) {
-			setErrors(prev => ({
-				...prev,
-				[name]: ''
-			}))
-		}
-	}
-
-	const validateForm = () => {
-		const newErrors = {}
-		
-		if (!formData.username) {
-			newErrors.username = 'Username is required'
-		} else if (formData.username.length < 3) {
-			newErrors.username = 'Username must be at least 3 characters'
-		}
-		
-		if (!formData.full_name) {
-			newErrors.full_name = 'Full name is required'
-		} else if (formData.full_name.length < 2) {
-			newErrors.full_name = 'Full name must be at least 2 characters'
-		}
-		
-		if (!formData.email) {
-			newErrors.email = 'Email is required'
-		} else if (!/\S+@\S+\.\S+/.test(formData.email)) {
-			newErrors.email = 'Email is invalid'
-		}
-		
-		if (!formData.password) {
-			newErrors.password = 'Password is required'
-		} else if (formData.password.length < 6) {
-			newErrors.password = 'Password must be at least 6 characters'
-		}
-		
-		if (!formData.confirmPassword) {
-			newErrors.confirmPassword = 'Please confirm your password'
-		} else if (formData.password !== formData.confirmPassword) {
-			newErrors.confirmPassword = 'Passwords do not match'
-		}
-		
-		if (!formData.role) {
-			newErrors.role = 'Role is required'
-		}
-		
-		if (!formData.department) {
-			newErrors.department = 'Department is required'
-		}
-		
-		setErrors(newErrors)
-		return Object.keys(newErrors).length === 0
-	}
-
-	const handleSubmit = async (e) => {
-		e.preventDefault()
-		
-		if (!validateForm()) return
-		
-		setIsLoading(true)
-		
-		try {
-			// Prepare data for backend (exclude confirmPassword)
-			const { confirmPassword, ...registerData } = formData
-			
-			const result = await register(registerData)
-			if (result?.success) {
-				navigate('/')
-			} else {
-				setErrors({ general: result?.error || 'Registration failed. Please try again.' })
-			}
-		} catch (error) {
-			console.error('Registration error:', error)
-			setErrors({ general: 'Registration failed. Please try again.' })
-		} finally {
-			setIsLoading(false)
-		}
-	}
-
-	return (
-		<div className="min-h-screen flex items-center justify-center bg-gradient-to-br from-slate-50 via-blue-50 to-indigo-100 dark:from-gray-900 dark:via-gray-800 dark:to-gray-900 py-12 px-4 sm:px-6 lg:px-8">
-			{/* Theme Toggle - Fixed Position */}
-			<div className="fixed top-4 right-4 z-50">
-				<ThemeToggle />
-			</div>
-			<div className="max-w-md w-full space-y-8">
-				<div>
-					<Link to="/" className="flex justify-center">
-						<div className="mx-auto h-12 w-12 flex items-center justify-center rounded-full bg-gradient-to-r from-indigo-600 to-blue-600">
-							<svg className="h-8 w-8 text-white" fill="none" viewBox="0 0 24 24" stroke="currentColor">
-								<path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M9 12h6m-6 4h6m2 5H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z" />
-							</svg>
-						</div>
-					</Link>
-					<h2 className="mt-6 text-center text-3xl font-extrabold text-gray-900 dark:text-white">
-						Create your account
-					</h2>
-					<p className="mt-2 text-center text-sm text-gray-600 dark:text-gray-300">
-						Or{' '}
-						<Link to="/" className="font-medium text-indigo-600 hover:text-indigo-500 dark:text-indigo-400 dark:hover:text-indigo-300">
-							return to home page
-						</Link>
-					</p>
-				</div>
-				
-				<div className="bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl shadow-xl p-8 border border-gray-200/50 dark:border-gray-700/50">
-					<form className="space-y-6" onSubmit={handleSubmit}>
-						{errors.general && (
-							<div className="rounded-lg bg-red-50 dark:bg-red-900/20 p-4 border border-red-200 dark:border-red-800">
-								<div className="text-sm text-red-700 dark:text-red-400">{errors.general}</div>
-							</div>
-						)}
-					
-					<div className="space-y-4">
-						<div>
-							<label htmlFor="username" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
-								Username
-							</label>
-							<input
-								id="username"
-								name="username"
-								type="text"
-								autoComplete="username"
-								required
-								value={formData.username}
-								onChange={handleChange}
-								className={`mt-1 appearance-none relative block w-full px-3 py-2 border ${
-									errors.username ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'
-								} placeholder-gray-500 dark:placeholder-gray-400 text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 focus:z-10 sm:text-sm`}
-								placeholder="Choose a username"
-							/>
-							{errors.username && (
-								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.username}</p>
-							)}
-						</div>
-
-						<div>
-							<label htmlFor="full_name" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
-								Full Name
-							</label>
-							<input
-								id="full_name"
-								name="full_name"
-								type="text"
-								autoComplete="name"
-								required
-								value={formData.full_name}
-								onChange={handleChange}
-								className={`mt-1 appearance-none relative block w-full px-3 py-2 border ${
-									errors.full_name ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'
-								} placeholder-gray-500 dark:placeholder-gray-400 text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 focus:z-10 sm:text-sm`}
-								placeholder="Enter your full name"
-							/>
-							{errors.full_name && (
-								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.full_name}</p>
-							)}
-						</div>
-						
-						<div>
-							<label htmlFor="email" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
-								Email address
-							</label>
-							<input
-								id="email"
-								name="email"
-								type="email"
-								autoComplete="email"
-								required
-								value={formData.email}
-								onChange={handleChange}
-								className={`mt-1 appearance-none relative block w-full px-3 py-2 border ${
-									errors.email ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'
-								} placeholder-gray-500 dark:placeholder-gray-400 text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 focus:z-10 sm:text-sm`}
-								placeholder="Enter your email"
-							/>
-							{errors.email && (
-								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.email}</p>
-							)}
-						</div>
-
-						<div>
-							<label htmlFor="department" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
-								Department
-							</label>
-							<select
-								id="department"
-								name="department"
-								value={formData.department}
-								onChange={handleChange}
-								className={`mt-1 block w-full px-3 py-2 border ${errors.department ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'} text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm`}
-								required
-							>
-								<option value="">Select Department</option>
-								<option value="Engineering">Engineering</option>
-								<option value="Marketing">Marketing</option>
-								<option value="Sales">Sales</option>
-								<option value="HR">Human Resources</option>
-								<option value="Finance">Finance</option>
-								<option value="Operations">Operations</option>
-							</select>
-							{errors.department && (
-								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.department}</p>
-							)}
-						</div>
-
-						<div>
-							<label htmlFor="role" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
-								Role
-							</label>
-							<select
-								id="role"
-								name="role"
-								value={formData.role}
-								onChange={handleChange}
-								className={`mt-1 block w-full px-3 py-2 border ${errors.role ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'} text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm`}
-								required
-							>
-								<option value="employee">Employee</option>
-								<option value="manager">Manager</option>
-							</select>
-							{errors.role && (
-								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.role}</p>
-							)}
-						</div>
-						
-						<div>
-							<label htmlFor="password" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
-								Password
-							</label>
-							<input
-								id="password"
-								name="password"
-								type="password"
-								autoComplete="new-password"
-								required
-								value={formData.password}
-								onChange={handleChange}
-								className={`mt-1 appearance-none relative block w-full px-3 py-2 border ${
-									errors.password ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'
-								} placeholder-gray-500 dark:placeholder-gray-400 text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 focus:z-10 sm:text-sm`}
-								placeholder="Create a password"
-							/>
-							{errors.password && (
-								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.password}</p>
-							)}
-						</div>
-						
-						<div>
-							<label htmlFor="confirmPassword" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
-								Confirm Password
-							</label>
-							<input
-								id="confirmPassword"
-								name="confirmPassword"
-								type="password"
-								autoComplete="new-password"
-								required
-								value={formData.confirmPassword}
-								onChange={handleChange}
-								className={`mt-1 appearance-none relative block w-full px-3 py-2 border ${
-									errors.confirmPassword ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'
-								} placeholder-gray-500 dark:placeholder-gray-400 text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 focus:z-10 sm:text-sm`}
-								placeholder="Confirm your password"
-							/>
-							{errors.confirmPassword && (
-								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.confirmPassword}</p>
-							)}
-						</div>
-
-					</div>
-
-					<div>
-						<button
-							type="submit"
-							disabled={isLoading}
-							className="group relative w-full flex justify-center py-2 px-4 border border-transparent text-sm font-medium rounded-md text-white bg-indigo-600 hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500 disabled:opacity-50 disabled:cursor-not-allowed transition-colors"
-						>
-							{isLoading ? (
-								<svg className="animate-spin -ml-1 mr-3 h-5 w-5 text-white" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24">
-									<circle className="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" strokeWidth="4"></circle>
-									<path className="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path>
-								</svg>
-							) : null}
-							{isLoading ? 'Creating account...' : 'Create account'}
-						</button>
-					</div>
-
-					<div className="text-center">
-						<p className="text-sm text-gray-600 dark:text-gray-300">
-							By creating an account, you agree to our terms and conditions
-						</p>
-					</div>
-					</form>
-					
-					<div className="text-center mt-4">
-						<Link to="/login" className="font-medium text-indigo-600 hover:text-indigo-500 dark:text-indigo-400 dark:hover:text-indigo-300">
-							Already a user? Sign in
-						</Link>
-					</div>
-				</div>
-			</div>
-		</div>
-	)
-}
-
-export default Register
+import React, { useState } from 'react'
+import { Link, useNavigate } from 'react-router-dom'
+import { useAuth } from '../contexts/AuthContext'
+import ThemeToggle from '../components/ThemeToggle'
+
+const Register = () => {
+	const [formData, setFormData] = useState({
+		username: '',
+		full_name: '',
+		email: '',
+		password: '',
+		confirmPassword: '',
+		role: 'employee',
+		department: '',
+	})
+	const [errors, setErrors] = useState({})
+	const [isLoading, setIsLoading] = useState(false)
+	const { register } = useAuth()
+	const navigate = useNavigate()
+
+	const handleChange = (e) => {
+		const { name, value } = e.target
+		setFormData(prev => ({
+			...prev,
+			[name]: value
+		}))
+		// Clear error when user starts typing
+		if (errors[name]) {
+			setErrors(prev => ({
+				...prev,
+				[name]: ''
+			}))
+		}
+	}
+
+	const validateForm = () => {
+		const newErrors = {}
+		
+		if (!formData.username) {
+			newErrors.username = 'Username is required'
+		} else if (formData.username.length < 3) {
+			newErrors.username = 'Username must be at least 3 characters'
+		}
+		
+		if (!formData.full_name) {
+			newErrors.full_name = 'Full name is required'
+		} else if (formData.full_name.length < 2) {
+			newErrors.full_name = 'Full name must be at least 2 characters'
+		}
+		
+		if (!formData.email) {
+			newErrors.email = 'Email is required'
+		} else if (!/\S+@\S+\.\S+/.test(formData.email)) {
+			newErrors.email = 'Email is invalid'
+		}
+		
+		if (!formData.password) {
+			newErrors.password = 'Password is required'
+		} else if (formData.password.length < 6) {
+			newErrors.password = 'Password must be at least 6 characters'
+		}
+		
+		if (!formData.confirmPassword) {
+			newErrors.confirmPassword = 'Please confirm your password'
+		} else if (formData.password !== formData.confirmPassword) {
+			newErrors.confirmPassword = 'Passwords do not match'
+		}
+		
+		if (!formData.role) {
+			newErrors.role = 'Role is required'
+		}
+		
+		if (!formData.department) {
+			newErrors.department = 'Department is required'
+		}
+		
+		setErrors(newErrors)
+		return Object.keys(newErrors).length === 0
+	}
+
+	const handleSubmit = async (e) => {
+		e.preventDefault()
+		
+		if (!validateForm()) return
+		
+		setIsLoading(true)
+		
+		try {
+			// Prepare data for backend (exclude confirmPassword)
+			const { confirmPassword, ...registerData } = formData
+			
+			const result = await register(registerData)
+			if (result?.success) {
+				navigate('/')
+			} else {
+				setErrors({ general: result?.error || 'Registration failed. Please try again.' })
+			}
+		} catch (error) {
+			console.error('Registration error:', error)
+			setErrors({ general: 'Registration failed. Please try again.' })
+		} finally {
+			setIsLoading(false)
+		}
+	}
+
+	return (
+		<div className="min-h-screen flex items-center justify-center bg-gradient-to-br from-slate-50 via-blue-50 to-indigo-100 dark:from-gray-900 dark:via-gray-800 dark:to-gray-900 py-12 px-4 sm:px-6 lg:px-8">
+			{/* Theme Toggle - Fixed Position */}
+			<div className="fixed top-4 right-4 z-50">
+				<ThemeToggle />
+			</div>
+			<div className="max-w-md w-full space-y-8">
+				<div>
+					<Link to="/" className="flex justify-center">
+						<div className="mx-auto h-12 w-12 flex items-center justify-center rounded-full bg-gradient-to-r from-indigo-600 to-blue-600">
+							<svg className="h-8 w-8 text-white" fill="none" viewBox="0 0 24 24" stroke="currentColor">
+								<path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M9 12h6m-6 4h6m2 5H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z" />
+							</svg>
+						</div>
+					</Link>
+					<h2 className="mt-6 text-center text-3xl font-extrabold text-gray-900 dark:text-white">
+						Create your account
+					</h2>
+					<p className="mt-2 text-center text-sm text-gray-600 dark:text-gray-300">
+						Or{' '}
+						<Link to="/" className="font-medium text-indigo-600 hover:text-indigo-500 dark:text-indigo-400 dark:hover:text-indigo-300">
+							return to home page
+						</Link>
+					</p>
+				</div>
+				
+				<div className="bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl shadow-xl p-8 border border-gray-200/50 dark:border-gray-700/50">
+					<form className="space-y-6" onSubmit={handleSubmit}>
+						{errors.general && (
+							<div className="rounded-lg bg-red-50 dark:bg-red-900/20 p-4 border border-red-200 dark:border-red-800">
+								<div className="text-sm text-red-700 dark:text-red-400">{errors.general}</div>
+							</div>
+						)}
+					
+					<div className="space-y-4">
+						<div>
+							<label htmlFor="username" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
+								Username
+							</label>
+							<input
+								id="username"
+								name="username"
+								type="text"
+								autoComplete="username"
+								required
+								value={formData.username}
+								onChange={handleChange}
+								className={`mt-1 appearance-none relative block w-full px-3 py-2 border ${
+									errors.username ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'
+								} placeholder-gray-500 dark:placeholder-gray-400 text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 focus:z-10 sm:text-sm`}
+								placeholder="Choose a username"
+							/>
+							{errors.username && (
+								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.username}</p>
+							)}
+						</div>
+
+						<div>
+							<label htmlFor="full_name" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
+								Full Name
+							</label>
+							<input
+								id="full_name"
+								name="full_name"
+								type="text"
+								autoComplete="name"
+								required
+								value={formData.full_name}
+								onChange={handleChange}
+								className={`mt-1 appearance-none relative block w-full px-3 py-2 border ${
+									errors.full_name ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'
+								} placeholder-gray-500 dark:placeholder-gray-400 text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 focus:z-10 sm:text-sm`}
+								placeholder="Enter your full name"
+							/>
+							{errors.full_name && (
+								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.full_name}</p>
+							)}
+						</div>
+						
+						<div>
+							<label htmlFor="email" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
+								Email address
+							</label>
+							<input
+								id="email"
+								name="email"
+								type="email"
+								autoComplete="email"
+								required
+								value={formData.email}
+								onChange={handleChange}
+								className={`mt-1 appearance-none relative block w-full px-3 py-2 border ${
+									errors.email ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'
+								} placeholder-gray-500 dark:placeholder-gray-400 text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 focus:z-10 sm:text-sm`}
+								placeholder="Enter your email"
+							/>
+							{errors.email && (
+								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.email}</p>
+							)}
+						</div>
+
+						<div>
+							<label htmlFor="department" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
+								Department
+							</label>
+							<select
+								id="department"
+								name="department"
+								value={formData.department}
+								onChange={handleChange}
+								className={`mt-1 block w-full px-3 py-2 border ${errors.department ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'} text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm`}
+								required
+							>
+								<option value="">Select Department</option>
+								<option value="Engineering">Engineering</option>
+								<option value="Marketing">Marketing</option>
+								<option value="Sales">Sales</option>
+								<option value="HR">Human Resources</option>
+								<option value="Finance">Finance</option>
+								<option value="Operations">Operations</option>
+							</select>
+							{errors.department && (
+								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.department}</p>
+							)}
+						</div>
+
+						<div>
+							<label htmlFor="role" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
+								Role
+							</label>
+							<select
+								id="role"
+								name="role"
+								value={formData.role}
+								onChange={handleChange}
+								className={`mt-1 block w-full px-3 py-2 border ${errors.role ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'} text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm`}
+								required
+							>
+								<option value="employee">Employee</option>
+								<option value="manager">Manager</option>
+							</select>
+							{errors.role && (
+								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.role}</p>
+							)}
+						</div>
+						
+						<div>
+							<label htmlFor="password" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
+								Password
+							</label>
+							<input
+								id="password"
+								name="password"
+								type="password"
+								autoComplete="new-password"
+								required
+								value={formData.password}
+								onChange={handleChange}
+								className={`mt-1 appearance-none relative block w-full px-3 py-2 border ${
+									errors.password ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'
+								} placeholder-gray-500 dark:placeholder-gray-400 text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 focus:z-10 sm:text-sm`}
+								placeholder="Create a password"
+							/>
+							{errors.password && (
+								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.password}</p>
+							)}
+						</div>
+						
+						<div>
+							<label htmlFor="confirmPassword" className="block text-sm font-medium text-gray-700 dark:text-gray-300">
+								Confirm Password
+							</label>
+							<input
+								id="confirmPassword"
+								name="confirmPassword"
+								type="password"
+								autoComplete="new-password"
+								required
+								value={formData.confirmPassword}
+								onChange={handleChange}
+								className={`mt-1 appearance-none relative block w-full px-3 py-2 border ${
+									errors.confirmPassword ? 'border-red-300 dark:border-red-600' : 'border-gray-300 dark:border-gray-600'
+								} placeholder-gray-500 dark:placeholder-gray-400 text-gray-900 dark:text-white bg-white dark:bg-gray-700 rounded-md focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 focus:z-10 sm:text-sm`}
+								placeholder="Confirm your password"
+							/>
+							{errors.confirmPassword && (
+								<p className="mt-1 text-sm text-red-600 dark:text-red-400">{errors.confirmPassword}</p>
+							)}
+						</div>
+
+					</div>
+
+					<div>
+						<button
+							type="submit"
+							disabled={isLoading}
+							className="group relative w-full flex justify-center py-2 px-4 border border-transparent text-sm font-medium rounded-md text-white bg-indigo-600 hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500 disabled:opacity-50 disabled:cursor-not-allowed transition-colors"
+						>
+							{isLoading ? (
+								<svg className="animate-spin -ml-1 mr-3 h-5 w-5 text-white" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24">
+									<circle className="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" strokeWidth="4"></circle>
+									<path className="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path>
+								</svg>
+							) : null}
+							{isLoading ? 'Creating account...' : 'Create account'}
+						</button>
+					</div>
+
+					<div className="text-center">
+						<p className="text-sm text-gray-600 dark:text-gray-300">
+							By creating an account, you agree to our terms and conditions
+						</p>
+					</div>
+					</form>
+					
+					<div className="text-center mt-4">
+						<Link to="/login" className="font-medium text-indigo-600 hover:text-indigo-500 dark:text-indigo-400 dark:hover:text-indigo-300">
+							Already a user? Sign in
+						</Link>
+					</div>
+				</div>
+			</div>
+		</div>
+	)
+}
+
+export default Register
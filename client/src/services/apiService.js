@@ -11,6 +11,29 @@ class ApiService {
 
   // Helper method to make requests with authentication
   async request(endpoint, options = {}) {
+    const { data } = await this.send(endpoint, options);
+    return data;
+  }
+
+  // Every item of a paged list endpoint: follows the X-Next-Cursor header
+  // until the last page. With a limit, only the first page is fetched.
+  async requestAllPages(endpoint, { limit } = {}) {
+    const items = [];
+    let after = null;
+    do {
+      const params = new URLSearchParams();
+      if (limit) params.set('limit', limit);
+      if (after) params.set('after', after);
+      const query = params.toString();
+      const { data, headers } = await this.send(query ? `${endpoint}?${query}` : endpoint);
+      items.push(...data);
+      after = limit ? null : headers.get('X-Next-Cursor');
+    } while (after);
+    return items;
+  }
+
+  // Like request(), but also returns the response headers
+  async send(endpoint, options = {}) {
     const token = localStorage.getItem('token');
     
     const config = {
@@ -61,7 +84,7 @@ class ApiService {
         throw new Error(errorMessage);
       }
 
-      return data;
+      return { data, headers: response.headers };
     } catch (error) {
       // Only log critical errors in production
       if (import.meta.env.DEV) {
@@ -141,16 +164,27 @@ class ApiService {
     });
   }
 
-  async getMyLeaveRequests() {
-    return this.request('/leave/my-requests');
+  async getMyLeaveRequests({ limit } = {}) {
+    return this.requestAllPages('/leave/my-requests', { limit });
   }
 
-  async getPendingApprovals() {
-    return this.request('/leave/pending-approvals');
+  // Entitled/used/pending/available days per leave type for a year
+  async getLeaveBalance(year) {
+    const query = year ? `?year=${year}` : '';
+    return this.request(`/leave/balance${query}`);
   }
 
-  async getProcessedApprovals() {
-    return this.request('/leave/processed-approvals');
+  // Dashboard totals computed by the server; scope is 'mine' or 'team'
+  async getLeaveStats(scope = 'mine') {
+    return this.request(`/leave/stats?scope=${scope}`);
+  }
+
+  async getPendingApprovals({ limit } = {}) {
+    return this.requestAllPages('/leave/pending-approvals', { limit });
+  }
+
+  async getProcessedApprovals({ limit } = {}) {
+    return this.requestAllPages('/leave/processed-approvals', { limit });
   }
 
   async approveLeave(leaveId, actionData) {
@@ -166,6 +200,62 @@ class ApiService {
       body: actionData,
     });
   }
+
+  // Live updates: calls onChange whenever a leave the user submitted or
+  // manages changes (or events may have been missed). Returns an unsubscribe
+  // function. The stream is opened with a short-lived ticket rather than the
+  // access token, since the URL ends up in server logs; EventSource's own
+  // reconnects fail once the ticket has expired, so a closed stream is
+  // reopened here with a fresh one.
+  subscribeToLeaveEvents(onChange) {
+    if (!localStorage.getItem('token') || typeof EventSource === 'undefined') {
+      return () => {};
+    }
+
+    let source = null;
+    let retryTimer = null;
+    let unsubscribed = false;
+
+    const reopenLater = () => {
+      if (!unsubscribed) {
+        retryTimer = setTimeout(open, 5000);
+      }
+    };
+
+    const open = async () => {
+      let ticket;
+      try {
+        ({ ticket } = await this.request('/leave/stream-ticket', { method: 'POST' }));
+      } catch {
+        reopenLater();
+        return;
+      }
+      if (unsubscribed) {
+        return;
+      }
+
+      source = new EventSource(
+        `${this.baseURL}/leave/stream?ticket=${encodeURIComponent(ticket)}`
+      );
+      source.addEventListener('leave', (event) => onChange(JSON.parse(event.data)));
+      source.addEventListener('resync', () => onChange(null));
+      source.onerror = () => {
+        if (source.readyState === EventSource.CLOSED) {
+          reopenLater();
+        }
+      };
+    };
+
+    open();
+
+    return () => {
+      unsubscribed = true;
+      clearTimeout(retryTimer);
+      if (source) {
+        source.close();
+      }
+    };
+  }
 }
 
 // Create and export a singleton instance
@@ -1,127 +1,169 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi import Request, Response
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from app.routes import leave, auth
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-app = FastAPI(
-    title="Leave Approval System API", 
-    version="1.0.0",
-    docs_url="/api/docs",
-    redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
-)
-
-# AMP Email CORS Middleware
-@app.middleware("http")
-async def add_amp_cors_headers(request: Request, call_next):
-    response = await call_next(request)
-    
-    # Add AMP-specific CORS headers
-    if request.url.path.startswith("/leave/"):
-        # Get the source origin from AMP request
-        amp_source_origin = request.query_params.get("__amp_source_origin")
-        if amp_source_origin:
-            # Decode the email address (URL encoded)
-            import urllib.parse
-            decoded_origin = urllib.parse.unquote(amp_source_origin)
-            response.headers["AMP-Access-Control-Allow-Source-Origin"] = decoded_origin
-        else:
-            # Fallback for non-AMP requests
-            response.headers["AMP-Access-Control-Allow-Source-Origin"] = request.headers.get("Origin", "*")
-        
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
-        response.headers["Access-Control-Allow-Headers"] = "*"
-        response.headers["Access-Control-Expose-Headers"] = "*"
-        response.headers["Access-Control-Allow-Credentials"] = "true"
-    
-    return response
-
-# Get URLs from environment for CORS configuration
-FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
-
-# Enhanced CORS configuration for AMP emails
-# Based on working configuration that properly handles AMP email rendering
-origins = [
-    # Development origins
-    "http://localhost:3000",
-    "http://localhost:5173",  # Vite default port
-    "http://127.0.0.1:5173",
-    "http://127.0.0.1:3000",
-    # Google/Gmail AMP email origins
-    "https://mail.google.com",
-    "https://gmail.com", 
-    "https://amp.gmail.dev",
-    # Google domains pattern support
-    "https://accounts.google.com",
-    "https://mail.google.com",
-    "https://googlemail.com",
-    # Production frontend URL from environment
-    FRONTEND_URL,
-]
-
-# Remove duplicates and None values
-origins = list(set(filter(None, origins)))
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=[
-        "Content-Type",
-        "Authorization", 
-        "X-Requested-With",
-        "Accept",
-        "Origin",
-        "AMP-CORS-REQUEST-HEADERS",  # Critical for AMP emails
-        "AMP-Same-Origin",           # Critical for AMP emails
-        "*"  # Allow all headers for AMP compatibility
-    ],
-    expose_headers=[
-        "AMP-Access-Control-Allow-Source-Origin",
-        "AMP-CORS-REQUEST-HEADERS",
-        "Access-Control-Expose-Headers",
-        "*"  # Expose all headers for AMP compatibility
-    ],
-)
-
-app.include_router(auth.router, prefix="/auth", tags=["auth"])
-app.include_router(leave.router, prefix="/leave", tags=["leave"])
-
-# Static frontend serving (expects built files copied to ./static/client)
-STATIC_CLIENT_DIR = os.path.join(os.path.dirname(__file__), "static", "client")
-if os.path.isdir(STATIC_CLIENT_DIR):
-    app.mount("/assets", StaticFiles(directory=os.path.join(STATIC_CLIENT_DIR, "assets")), name="assets")
-
-@app.get("/")
-def root():
-    # Serve SPA index if available, otherwise API info
-    index_path = os.path.join(STATIC_CLIENT_DIR, "index.html")
-    if os.path.isfile(index_path):
-        return FileResponse(index_path)
-    return {
-        "message": "Leave Application System API", 
-        "version": "1.0.0",
-        "status": "running",
-        "docs": "/api/docs"
-    }
-
-@app.get("/health")
-def health_check():
-    """Health check endpoint for Railway and monitoring"""
-    return {"status": "healthy", "service": "leave-amp-api"}
-
-# SPA fallback for client-side routes
-@app.get("/{full_path:path}")
-def spa_fallback(full_path: str):
-    index_path = os.path.join(STATIC_CLIENT_DIR, "index.html")
-    if os.path.isfile(index_path):
-        return FileResponse(index_path)
-    return {"detail": "Not Found"}
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi import Request, Response
+from fastapi.staticfiles import StaticFiles
+from fastapi.responses import FileResponse
+from contextlib import asynccontextmanager
+from app.routes import leave, auth
+from app.models.db import init_db, close_db
+from app.utils.responses import MongoJSONResponse
+from app.utils.outbox import outbox_worker
+from app.utils.events import leave_events
+from app.utils.smtp import close_smtp_pool
+from app.utils.email_templates import load_email_templates
+from app.utils.auth import shutdown_bcrypt_pool
+from app.utils.metrics import METRICS_TOKEN, MetricsMiddleware, render_metrics
+from app.utils.log import configure_logging
+import hmac
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+configure_logging()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Each gunicorn worker runs its own event loop and Mongo connection pool
+    await init_db()
+    load_email_templates()
+    if os.getenv("OUTBOX_WORKER_ENABLED", "true").lower() == "true":
+        outbox_worker.start()
+    leave_events.start()
+    yield
+    await leave_events.stop()
+    await outbox_worker.stop()
+    close_smtp_pool()
+    shutdown_bcrypt_pool()
+    await close_db()
+
+app = FastAPI(
+    title="Leave Approval System API", 
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=MongoJSONResponse,
+    docs_url="/api/docs",
+    redoc_url="/api/redoc",
+    openapi_url="/api/openapi.json"
+)
+
+# AMP Email CORS Middleware
+@app.middleware("http")
+async def add_amp_cors_headers(request: Request, call_next):
+    response = await call_next(request)
+    
+    # Add AMP-specific CORS headers
+    if request.url.path.startswith("/leave/"):
+        # Get the source origin from AMP request
+        amp_source_origin = request.query_params.get("__amp_source_origin")
+        if amp_source_origin:
+            # Decode the email address (URL encoded)
+            import urllib.parse
+            decoded_origin = urllib.parse.unquote(amp_source_origin)
+            response.headers["AMP-Access-Control-Allow-Source-Origin"] = decoded_origin
+        else:
+            # Fallback for non-AMP requests
+            response.headers["AMP-Access-Control-Allow-Source-Origin"] = request.headers.get("Origin", "*")
+        
+        response.headers["Access-Control-Allow-Origin"] = "*"
+        response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
+        response.headers["Access-Control-Allow-Headers"] = "*"
+        response.headers["Access-Control-Expose-Headers"] = "*"
+        response.headers["Access-Control-Allow-Credentials"] = "true"
+    
+    return response
+
+# Get URLs from environment for CORS configuration
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
+
+# Enhanced CORS configuration for AMP emails
+# Based on working configuration that properly handles AMP email rendering
+origins = [
+    # Development origins
+    "http://localhost:3000",
+    "http://localhost:5173",  # Vite default port
+    "http://127.0.0.1:5173",
+    "http://127.0.0.1:3000",
+    # Google/Gmail AMP email origins
+    "https://mail.google.com",
+    "https://gmail.com", 
+    "https://amp.gmail.dev",
+    # Google domains pattern support
+    "https://accounts.google.com",
+    "https://mail.google.com",
+    "https://googlemail.com",
+    # Production frontend URL from environment
+    FRONTEND_URL,
+]
+
+# Remove duplicates and None values
+origins = list(set(filter(None, origins)))
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=origins,
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=[
+        "Content-Type",
+        "Authorization", 
+        "X-Requested-With",
+        "Accept",
+        "Origin",
+        "AMP-CORS-REQUEST-HEADERS",  # Critical for AMP emails
+        "AMP-Same-Origin",           # Critical for AMP emails
+        "*"  # Allow all headers for AMP compatibility
+    ],
+    expose_headers=[
+        "X-Next-Cursor",  # Pagination
+        "X-Total-Count",
+        "AMP-Access-Control-Allow-Source-Origin",
+        "AMP-CORS-REQUEST-HEADERS",
+        "Access-Control-Expose-Headers",
+        "*"  # Expose all headers for AMP compatibility
+    ],
+)
+
+# Outermost, so the latency covers the other middleware too
+app.add_middleware(MetricsMiddleware)
+
+app.include_router(auth.router, prefix="/auth", tags=["auth"])
+app.include_router(leave.router, prefix="/leave", tags=["leave"])
+
+# Static frontend serving (expects built files copied to ./static/client)
+STATIC_CLIENT_DIR = os.path.join(os.path.dirname(__file__), "static", "client")
+if os.path.isdir(STATIC_CLIENT_DIR):
+    app.mount("/assets", StaticFiles(directory=os.path.join(STATIC_CLIENT_DIR, "assets")), name="assets")
+
+@app.get("/")
+def root():
+    # Serve SPA index if available, otherwise API info
+    index_path = os.path.join(STATIC_CLIENT_DIR, "index.html")
+    if os.path.isfile(index_path):
+        return FileResponse(index_path)
+    return {
+        "message": "Leave Application System API", 
+        "version": "1.0.0",
+        "status": "running",
+        "docs": "/api/docs"
+    }
+
+@app.get("/health")
+def health_check():
+    """Health check endpoint for Railway and monitoring"""
+    return {"status": "healthy", "service": "leave-amp-api"}
+
+@app.get("/metrics", include_in_schema=False)
+def metrics(request: Request):
+    """Prometheus metrics, summed over all gunicorn workers"""
+    if METRICS_TOKEN and not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {METRICS_TOKEN}"):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
+
+# SPA fallback for client-side routes
+@app.get("/{full_path:path}")
+def spa_fallback(full_path: str):
+    index_path = os.path.join(STATIC_CLIENT_DIR, "index.html")
+    if os.path.isfile(index_path):
+        return FileResponse(index_path)
+    return {"detail": "Not Found"}
@@ -0,0 +1,73 @@
+"""
+Data migrations from app/migrations/versions.py.
+
+Usage (from server/):
+    python -m app.migrations                     # list migrations and progress, exit 1 if any pending
+    python -m app.migrations --apply             # run pending migrations in order, resuming interrupted ones
+    python -m app.migrations --apply 0002_leave_native_dates   # run just these
+    python -m app.migrations --apply --dry-run   # count what would change, write nothing
+"""
+import argparse
+import asyncio
+import sys
+from pymongo.errors import PyMongoError
+from app.migrations.runner import MIGRATION_BATCH_SIZE, get_checkpoint, run_migration
+from app.migrations.versions import MIGRATIONS
+
+def _describe(migration, checkpoint) -> str:
+    if checkpoint is None:
+        state = "pending"
+    elif checkpoint.get("status") == "done":
+        state = f"done     ({checkpoint.get('modified', 0)} updated, finished {checkpoint['finished_at']:%Y-%m-%d %H:%M})"
+    else:
+        state = f"partial  ({checkpoint.get('scanned', 0)} scanned, last _id {checkpoint.get('last_id')})"
+    return f"{migration.name:<28} {state}\n    {migration.description}"
+
+async def _main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="List or run data migrations")
+    parser.add_argument("names", nargs="*", help="migrations to run (default: all pending)")
+    parser.add_argument("--apply", action="store_true", help="run migrations")
+    parser.add_argument("--batch-size", type=int, default=MIGRATION_BATCH_SIZE, help="documents per bulk write and checkpoint")
+    parser.add_argument("--restart", action="store_true", help="ignore checkpoints and rerun from the start, even if done")
+    parser.add_argument("--dry-run", action="store_true", help="with --apply, count changes without writing")
+    args = parser.parse_args(argv)
+
+    known = {migration.name for migration in MIGRATIONS}
+    unknown = [name for name in args.names if name not in known]
+    if unknown:
+        print(f"Unknown migration(s): {', '.join(unknown)}")
+        return 2
+    selected = [migration for migration in MIGRATIONS if not args.names or migration.name in args.names]
+
+    from app.models.db import db, close_db
+
+    try:
+        checkpoints = {migration.name: await get_checkpoint(db, migration) for migration in selected}
+        if not args.apply:
+            for migration in selected:
+                print(_describe(migration, checkpoints[migration.name]))
+            pending = [c for c in checkpoints.values() if c is None or c.get("status") != "done"]
+            return 1 if pending else 0
+
+        for migration in selected:
+            checkpoint = checkpoints[migration.name]
+            if checkpoint and checkpoint.get("status") == "done" and not args.restart:
+                print(f"{migration.name}: already done")
+                continue
+            totals = await run_migration(
+                db, migration, batch_size=args.batch_size, restart=args.restart, dry_run=args.dry_run
+            )
+            verb = "would update" if args.dry_run else "updated"
+            print(
+                f"{migration.name}: {verb} {totals['modified']} of {totals['scanned']} document(s), "
+                f"{totals['skipped']} skipped, in {totals['seconds']:.1f}s ({totals['docs_per_second']} docs/s)"
+            )
+        return 0
+    except PyMongoError as e:
+        print(f"Migration failed: {str(e)} (rerun to resume from the last checkpoint)")
+        return 2
+    finally:
+        await close_db()
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main()))
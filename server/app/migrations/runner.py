@@ -0,0 +1,176 @@
+"""
+Batched, resumable data migrations.
+
+A migration streams the documents matching its filter in _id order,
+turns each into an update with its transform, and writes them with one
+bulk_write per batch (in a transaction, together with any after_batch
+writes). After every batch the last _id is saved to the `migrations`
+collection, so an interrupted run picks up where it stopped.
+"""
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, List, Optional, Tuple
+from pymongo import UpdateOne
+
+MIGRATION_BATCH_SIZE = int(os.getenv("MIGRATION_BATCH_SIZE", 1000))
+CHECKPOINT_COLLECTION = "migrations"
+
+@dataclass(frozen=True)
+class Migration:
+    name: str
+    description: str
+    collection: str
+    # Documents still to migrate; must stop matching once migrated so a
+    # rerun is a no-op
+    filter: dict = field(hash=False)
+    # document -> update, or None to leave it alone (counted as skipped)
+    transform: Optional[Callable[[dict], Optional[dict]]] = field(default=None, hash=False)
+    # Same, for a whole batch at once (one result per document); used instead
+    # of transform when the work vectorizes
+    transform_batch: Optional[Callable[[List[dict]], List[Optional[dict]]]] = field(default=None, hash=False)
+    projection: Optional[dict] = field(default=None, hash=False)
+    # Awaited with ([(document, update)], session) in the same transaction as
+    # the batch's write, for writes that follow from it in other collections
+    after_batch: Optional[Callable[[List[Tuple[dict, dict]], object], Awaitable[None]]] = field(default=None, hash=False)
+    # Fields whose values as read must still hold when a document is
+    # written. With after_batch, a batch where any document changed in
+    # between is rolled back, read again and redone.
+    match_fields: Tuple[str, ...] = field(default=(), hash=False)
+
+class _BatchChanged(Exception):
+    pass
+
+def _update_filter(migration: Migration, doc: dict) -> dict:
+    # Re-check the filter so a document changed since it was read is left alone
+    return {"_id": doc["_id"], **migration.filter, **{name: doc.get(name) for name in migration.match_fields}}
+
+async def get_checkpoint(database, migration: Migration) -> Optional[dict]:
+    return await database[CHECKPOINT_COLLECTION].find_one({"_id": migration.name})
+
+async def run_migration(
+    database,
+    migration: Migration,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+    restart: bool = False,
+    dry_run: bool = False,
+    report: Callable[[str], None] = print,
+) -> dict:
+    """
+    Run one migration to completion, resuming from its checkpoint
+
+    Args:
+        batch_size: documents per bulk_write (and per checkpoint)
+        restart: ignore the checkpoint and scan from the first document
+        dry_run: count what would change without writing anything
+        report: receives a progress line after every batch
+
+    Returns:
+        Totals: {"scanned", "modified", "skipped", "seconds", "docs_per_second"};
+        the counts include earlier runs when resuming, the timings don't
+    """
+    checkpoints = database[CHECKPOINT_COLLECTION]
+    checkpoint = None if restart else await get_checkpoint(database, migration)
+    totals = {"scanned": 0, "modified": 0, "skipped": 0}
+    query = dict(migration.filter)
+    if checkpoint and checkpoint.get("status") == "running" and checkpoint.get("last_id") is not None:
+        totals = {key: checkpoint.get(key, 0) for key in totals}
+        query = {"$and": [migration.filter, {"_id": {"$gt": checkpoint["last_id"]}}]}
+        report(f"{migration.name}: resuming after {checkpoint['last_id']}")
+
+    if not dry_run:
+        await checkpoints.update_one(
+            {"_id": migration.name},
+            {"$set": {"status": "running", "started_at": datetime.now(timezone.utc), **totals},
+             "$unset": {"finished_at": ""}},
+            upsert=True
+        )
+
+    from app.models.db import run_in_transaction
+
+    collection = database[migration.collection]
+    started = time.monotonic()
+    scanned_this_run = 0
+
+    def transform(batch) -> List[Tuple[dict, dict]]:
+        if migration.transform_batch is not None:
+            results = migration.transform_batch(batch)
+        else:
+            results = [migration.transform(doc) for doc in batch]
+        return [(doc, update) for doc, update in zip(batch, results) if update is not None]
+
+    def write(changed):
+        async def apply(session) -> int:
+            result = await collection.bulk_write(
+                [UpdateOne(_update_filter(migration, doc), update) for doc, update in changed],
+                ordered=False,
+                session=session
+            )
+            if migration.after_batch is not None:
+                # Follow-up writes are computed from the documents as read,
+                # so they only hold if every one of them was written as read.
+                # Without a transaction (standalone mongod) there is nothing
+                # to roll back to, and the batch goes through as it is.
+                if result.modified_count != len(changed) and session is not None:
+                    raise _BatchChanged()
+                await migration.after_batch(changed, session)
+            return result.modified_count
+        return apply
+
+    async def flush(batch):
+        nonlocal scanned_this_run
+        last_id = batch[-1]["_id"]
+        scanned = len(batch)
+        changed = transform(batch)
+        if changed and dry_run:
+            totals["modified"] += len(changed)
+        elif changed:
+            while True:
+                try:
+                    totals["modified"] += await run_in_transaction(write(changed), database.client)
+                    break
+                except _BatchChanged:
+                    # Rolled back; the documents still to migrate are read again
+                    batch = await collection.find(
+                        {"$and": [migration.filter, {"_id": {"$in": [doc["_id"] for doc in batch]}}]},
+                        migration.projection
+                    ).sort("_id", 1).to_list()
+                    changed = transform(batch)
+                    if not changed:
+                        break
+        totals["skipped"] += scanned - len(changed)
+        totals["scanned"] += scanned
+        scanned_this_run += scanned
+
+        if not dry_run:
+            await checkpoints.update_one(
+                {"_id": migration.name},
+                {"$set": {"last_id": last_id, "updated_at": datetime.now(timezone.utc), **totals}}
+            )
+        elapsed = time.monotonic() - started
+        rate = scanned_this_run / elapsed if elapsed > 0 else 0
+        report(
+            f"{migration.name}: {totals['scanned']} scanned, {totals['modified']} updated, "
+            f"{totals['skipped']} skipped ({rate:.0f} docs/s)"
+        )
+
+    batch = []
+    cursor = collection.find(query, migration.projection).sort("_id", 1).batch_size(batch_size)
+    async for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            await flush(batch)
+            batch = []
+    if batch:
+        await flush(batch)
+
+    elapsed = time.monotonic() - started
+    totals["seconds"] = round(elapsed, 3)
+    totals["docs_per_second"] = round(scanned_this_run / elapsed) if elapsed > 0 else 0
+    if not dry_run:
+        await checkpoints.update_one(
+            {"_id": migration.name},
+            {"$set": {"status": "done", "finished_at": datetime.now(timezone.utc)}, "$unset": {"last_id": ""}}
+        )
+    return totals
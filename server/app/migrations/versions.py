@@ -0,0 +1,114 @@
+"""
+Registered migrations, applied in list order. Names are permanent: they
+key the checkpoints, so add new entries at the end rather than renaming.
+"""
+from typing import Dict, List, Optional, Tuple
+from app.migrations.runner import Migration
+from app.utils.balances import BALANCE_BACKFILL_MIGRATION, COUNTED_FIELD, apply_balance_updates, balance_adjustment, balance_update
+from app.utils.changes import stamp_update
+from app.utils.conflicts import leave_interval
+from app.utils.workdays import work_calendars
+
+def _backfill_days(leave: dict) -> Optional[dict]:
+    try:
+        start, end = leave_interval(leave["start_date"], leave["end_date"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return stamp_update({"$set": {"days": work_calendars.count(start.date(), end.date(), leave.get("region"))}})
+
+def _native_dates(leave: dict) -> Optional[dict]:
+    try:
+        start, end = leave_interval(leave["start_date"], leave["end_date"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return stamp_update({"$set": {"start": start, "end": end}})
+
+def _recompute_days(leaves: List[dict]) -> List[Optional[dict]]:
+    # One busday_count per region per batch rather than one per leave
+    by_region: Dict[str, List[int]] = {}
+    for index, leave in enumerate(leaves):
+        by_region.setdefault(work_calendars.resolve(leave.get("region")), []).append(index)
+
+    updates: List[Optional[dict]] = [None] * len(leaves)
+    for region, indexes in by_region.items():
+        counts = work_calendars.count_many(
+            [leaves[i]["start"] for i in indexes],
+            [leaves[i]["end"] for i in indexes],
+            region,
+        )
+        for index, days in zip(indexes, counts.tolist()):
+            if leaves[index].get("days") != days:
+                updates[index] = stamp_update({"$set": {"days": days}})
+    return updates
+
+async def _adjust_balances(changed: List[Tuple[dict, dict]], session):
+    # Pending and approved leave already count against a balance with the
+    # old day count; move it by the difference. The runner only gets here
+    # when every leave was written with the status and days read, in the
+    # same transaction.
+    await apply_balance_updates([
+        balance_adjustment(leave, leave["days"], update["$set"]["days"])
+        for leave, update in changed
+        if leave.get("days") is not None
+    ], session=session)
+
+def _count_in_balance(leave: dict) -> dict:
+    return {"$set": {COUNTED_FIELD: True}}
+
+async def _add_to_balances(changed: List[Tuple[dict, dict]], session):
+    # Each leave's days go into the bucket for the status it was marked
+    # with; the runner checked that status still held, in this transaction
+    await apply_balance_updates([
+        balance_update({**leave, COUNTED_FIELD: True}, None, leave["status"])
+        for leave, _ in changed
+    ], session=session)
+
+MIGRATIONS: List[Migration] = [
+    # Replaces POST /leave/debug/fix-leave-days
+    Migration(
+        name="0001_leave_days",
+        description="Backfill days on leave requests created before it was stored",
+        collection="leave_requests",
+        filter={"days": {"$exists": False}},
+        transform=_backfill_days,
+        projection={"start_date": 1, "end_date": 1, "region": 1},
+    ),
+    # Requests created before overlap checks have only the string dates,
+    # so the interval indexes and the calendar don't see them
+    Migration(
+        name="0002_leave_native_dates",
+        description="Add BSON start/end dates from the start_date/end_date strings",
+        collection="leave_requests",
+        filter={"$or": [{"start": {"$exists": False}}, {"end": {"$exists": False}}]},
+        transform=_native_dates,
+        projection={"start_date": 1, "end_date": 1},
+    ),
+    # Days become working days: weekends and the region's holidays no longer
+    # count. Rerun with --restart after editing app/data/holidays.
+    Migration(
+        name="0003_leave_working_days",
+        description="Recompute days as working days from the holiday calendars",
+        collection="leave_requests",
+        filter={"start": {"$exists": True}, "end": {"$exists": True}},
+        transform_batch=_recompute_days,
+        projection={"start": 1, "end": 1, "days": 1, "region": 1, "status": 1,
+                    "employee_id": 1, "leave_type": 1, "start_date": 1, COUNTED_FIELD: 1},
+        after_batch=_adjust_balances,
+        match_fields=("status", "days"),
+    ),
+    # The ledger started empty: leave submitted before it existed isn't in
+    # any balance, and approving it would take days out of pending that
+    # were never put there. Submits are checked against balances only
+    # once this is done.
+    Migration(
+        name=BALANCE_BACKFILL_MIGRATION,
+        description="Add pending and approved leave from before the balance ledger to leave_balances",
+        collection="leave_requests",
+        filter={"status": {"$in": ["pending", "approved"]}, COUNTED_FIELD: {"$ne": True}},
+        transform=_count_in_balance,
+        projection={"status": 1, "employee_id": 1, "leave_type": 1, "start_date": 1, "end_date": 1,
+                    "days": 1, "region": 1},
+        after_batch=_add_to_balances,
+        match_fields=("status", "days"),
+    ),
+]
@@ -1,44 +1,107 @@
-from pymongo import MongoClient
-from pymongo.collection import Collection
-from bson import ObjectId
-import os
-from dotenv import load_dotenv
-from pymongo import ASCENDING
-from pymongo.errors import PyMongoError
-
-load_dotenv()
-
-MONGODB_URI = os.getenv("MONGODB_URI")
-
-if not MONGODB_URI:
-    raise ValueError("MONGODB_URI environment variable is not set!")
-
-try:
-    client = MongoClient(
-        MONGODB_URI,
-        serverSelectionTimeoutMS=5000,  # 5 second timeout
-        connectTimeoutMS=10000,
-        socketTimeoutMS=10000,
-    )
-    # Test connection
-    client.admin.command('ping')
-    db = client.get_default_database()
-    print("✅ MongoDB connected successfully!")
-except Exception as e:
-    print(f"❌ MongoDB connection failed: {str(e)}")
-    raise
-
-users_collection: Collection = db["users"]
-leaves_collection: Collection = db["leave_requests"]
-tokens_collection: Collection = db["approval_tokens"]
-password_resets_collection: Collection = db["password_resets"]
-
-# Ensure unique indexes for users
-try:
-    users_collection.create_index([("email", ASCENDING)], unique=True, name="unique_email")
-    users_collection.create_index([("username", ASCENDING)], unique=True, name="unique_username")
-    # Optional TTL index could be added; for now we keep manual expiry checks
-    password_resets_collection.create_index([("email", ASCENDING)], name="reset_email_idx")
-except PyMongoError as e:
-    # Index creation failures should not crash app startup; they will be logged by the server
-    print(f"Index creation warning: {str(e)}")
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.collection import AsyncCollection
+from bson import ObjectId
+import logging
+import os
+from typing import Optional
+from dotenv import load_dotenv
+from pymongo.errors import PyMongoError, OperationFailure
+from app.utils.metrics import MongoCommandMetrics, MongoPoolMetrics
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+MONGODB_URI = os.getenv("MONGODB_URI")
+
+if not MONGODB_URI:
+    raise ValueError("MONGODB_URI environment variable is not set!")
+
+# Sized for many concurrent in-flight requests per worker; the async driver
+# multiplexes coroutines over this pool instead of parking threads on sockets.
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", 100))
+
+# The async client connects lazily, so creating it at import time does no I/O.
+# Connectivity is checked in init_db() once the event loop is running.
+client = AsyncMongoClient(
+    MONGODB_URI,
+    serverSelectionTimeoutMS=5000,  # 5 second timeout
+    connectTimeoutMS=10000,
+    socketTimeoutMS=10000,
+    maxPoolSize=MONGODB_MAX_POOL_SIZE,
+    tz_aware=True,  # datetimes come back as UTC-aware, comparable with datetime.now(timezone.utc)
+    # Command timings, slow-query logging and pool checkout wait for /metrics
+    event_listeners=[MongoCommandMetrics(), MongoPoolMetrics()],
+)
+db = client.get_default_database()
+
+users_collection: AsyncCollection = db["users"]
+leaves_collection: AsyncCollection = db["leave_requests"]
+# Legacy random approval tokens; new tokens are HMAC-signed and never stored
+tokens_collection: AsyncCollection = db["approval_tokens"]
+# Ledger of used/revoked signed approval tokens, expired by TTL
+used_tokens_collection: AsyncCollection = db["used_approval_tokens"]
+password_resets_collection: AsyncCollection = db["password_resets"]
+outbox_collection: AsyncCollection = db["email_outbox"]
+# Per (employee, year, leave type) running totals, kept in step with leave transitions
+balances_collection: AsyncCollection = db["leave_balances"]
+
+# Set once we learn the deployment is a standalone mongod (no transactions)
+_transactions_supported = True
+
+async def init_db():
+    """
+    Verify connectivity and ensure indexes. Called once per worker on startup.
+    """
+    try:
+        await client.admin.command('ping')
+        logger.info("MongoDB connected")
+    except Exception as e:
+        logger.error("MongoDB connection failed: %s", e)
+        raise
+
+    # Indexes are declared in app/models/indexes.py. Deploys normally apply
+    # them via `python -m app.models.indexes --apply`; on startup we apply
+    # (default), only report drift, or skip, per INDEXES_ON_STARTUP.
+    mode = os.getenv("INDEXES_ON_STARTUP", "apply").lower()
+    if mode == "off":
+        return
+    from app.models.indexes import ensure_indexes, check_index_drift, format_drift
+    try:
+        if mode == "check":
+            drift = await check_index_drift(db)
+        else:
+            drift = await ensure_indexes(db)
+        if drift:
+            logger.log(logging.WARNING if mode == "check" else logging.INFO, "Index drift (%s):\n%s", mode, format_drift(drift))
+    except PyMongoError as e:
+        # Index creation failures should not crash app startup; they will be logged by the server
+        logger.warning("Index creation failed: %s", e)
+
+async def close_db():
+    """
+    Close the client's connection pool. Called once per worker on shutdown.
+    """
+    await client.close()
+
+async def run_in_transaction(callback, mongo_client: Optional[AsyncMongoClient] = None):
+    """
+    Run `callback(session)` inside a multi-document transaction, on the
+    app's client unless another is given.
+
+    Falls back to running without a session on a standalone mongod, which
+    does not support transactions (local development only; Atlas and any
+    replica set take the transactional path).
+    """
+    global _transactions_supported
+    if _transactions_supported:
+        async with (mongo_client or client).start_session() as session:
+            try:
+                return await session.with_transaction(callback)
+            except OperationFailure as e:
+                # 20 = IllegalOperation: "Transaction numbers are only allowed on a replica set member or mongos"
+                if e.code != 20:
+                    raise
+                _transactions_supported = False
+                logger.warning("MongoDB transactions unavailable (standalone server); writing without a transaction")
+    return await callback(None)
@@ -0,0 +1,213 @@
+"""
+Declarative index registry for every collection.
+
+INDEXES is the single source of truth. ensure_indexes() compares it with
+what the server has and creates, rebuilds or (optionally) drops indexes
+so the two match; running it again is a no-op.
+
+Usage (from server/):
+    python -m app.models.indexes            # report drift, exit 1 if any
+    python -m app.models.indexes --apply    # create/rebuild to match
+    python -m app.models.indexes --apply --prune   # also drop unknown indexes
+"""
+import argparse
+import asyncio
+import sys
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+@dataclass(frozen=True)
+class IndexSpec:
+    collection: str
+    name: str
+    keys: Tuple[Tuple[str, int], ...]
+    unique: bool = False
+    # TTL: documents expire this many seconds after the date in the (single) key field
+    expire_after_seconds: Optional[int] = None
+    partial_filter: Optional[dict] = field(default=None, hash=False)
+
+    def model(self) -> IndexModel:
+        options = {"name": self.name}
+        if self.unique:
+            options["unique"] = True
+        if self.expire_after_seconds is not None:
+            options["expireAfterSeconds"] = self.expire_after_seconds
+        if self.partial_filter is not None:
+            options["partialFilterExpression"] = self.partial_filter
+        return IndexModel(list(self.keys), **options)
+
+    def matches(self, info: dict) -> bool:
+        return (
+            tuple((k, int(d)) for k, d in info["key"]) == self.keys
+            and bool(info.get("unique", False)) == self.unique
+            and info.get("expireAfterSeconds") == self.expire_after_seconds
+            and info.get("partialFilterExpression") == self.partial_filter
+        )
+
+INDEXES: List[IndexSpec] = [
+    # users
+    IndexSpec("users", "unique_email", (("email", ASCENDING),), unique=True),
+    IndexSpec("users", "unique_username", (("username", ASCENDING),), unique=True),
+
+    # leave_requests: list endpoints page by (sort field, _id), so each index
+    # ends in that pair to serve the keyset range scan without a sort stage
+    # manager's pending queue
+    IndexSpec("leave_requests", "manager_pending_idx",
+              (("manager_id", ASCENDING), ("status", ASCENDING), ("is_action_taken", ASCENDING),
+               ("created_at", DESCENDING), ("_id", DESCENDING))),
+    # employee's own requests
+    IndexSpec("leave_requests", "employee_idx",
+              (("employee_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING))),
+    # manager's processed history, newest first
+    IndexSpec("leave_requests", "manager_processed_idx",
+              (("manager_id", ASCENDING), ("is_action_taken", ASCENDING),
+               ("action_timestamp", DESCENDING), ("_id", DESCENDING))),
+    # overlap probes: start <= new_end AND end >= new_start, per employee
+    # or across a department
+    IndexSpec("leave_requests", "employee_interval_idx",
+              (("employee_id", ASCENDING), ("start", ASCENDING), ("end", ASCENDING))),
+    IndexSpec("leave_requests", "department_interval_idx",
+              (("employee_department", ASCENDING), ("start", ASCENDING), ("end", ASCENDING))),
+    # /leave/changes: one range scan per poll, per scope
+    IndexSpec("leave_requests", "employee_changes_idx",
+              (("employee_id", ASCENDING), ("updated_at", ASCENDING), ("_id", ASCENDING))),
+    IndexSpec("leave_requests", "manager_changes_idx",
+              (("manager_id", ASCENDING), ("updated_at", ASCENDING), ("_id", ASCENDING))),
+
+    # leave_balances: one document per (employee, year, leave type)
+    IndexSpec("leave_balances", "balance_key_idx",
+              (("employee_id", ASCENDING), ("year", ASCENDING), ("leave_type", ASCENDING)), unique=True),
+
+    # approval_tokens: legacy random tokens, kept until in-flight emails expire
+    IndexSpec("approval_tokens", "token_idx", (("token", ASCENDING),)),
+    IndexSpec("approval_tokens", "leave_idx", (("leave_id", ASCENDING),)),
+    IndexSpec("approval_tokens", "approval_token_ttl_idx", (("expires_at", ASCENDING),), expire_after_seconds=0),
+
+    # used_approval_tokens: single-use ledger for signed tokens
+    IndexSpec("used_approval_tokens", "used_token_ttl_idx", (("expires_at", ASCENDING),), expire_after_seconds=0),
+
+    # password_resets: one OTP per email, gone once it expires
+    IndexSpec("password_resets", "reset_email_idx", (("email", ASCENDING),)),
+    IndexSpec("password_resets", "reset_ttl_idx", (("expires_at", ASCENDING),), expire_after_seconds=0),
+
+    # email_outbox: delivery workers poll for due messages; sent rows expire
+    IndexSpec("email_outbox", "outbox_due_idx", (("status", ASCENDING), ("next_attempt_at", ASCENDING))),
+    IndexSpec("email_outbox", "outbox_ttl_idx", (("expires_at", ASCENDING),), expire_after_seconds=0),
+    # the manager's open digest, looked up on every submit in digest mode;
+    # unique so two submits racing to open one can't both insert
+    IndexSpec("email_outbox", "outbox_open_digest_idx", (("payload.manager_id", ASCENDING),), unique=True,
+              partial_filter={"kind": "leave_digest", "status": "pending"}),
+]
+
+async def check_index_drift(database, specs: List[IndexSpec] = INDEXES) -> List[dict]:
+    """
+    Compare the registry with the server's indexes
+
+    Returns:
+        One entry per difference: {"collection", "name", "problem", ...}
+        where problem is "missing", "changed" or "unknown"
+    """
+    drift = []
+    by_collection = {}
+    for spec in specs:
+        by_collection.setdefault(spec.collection, []).append(spec)
+
+    for collection_name, collection_specs in by_collection.items():
+        existing = await database[collection_name].index_information()
+        wanted = {spec.name for spec in collection_specs}
+        claimed = set()
+        for spec in collection_specs:
+            info = existing.get(spec.name)
+            if info is None:
+                # Same keys under another name counts as changed, not missing
+                renamed = next((n for n, i in existing.items() if n not in wanted and spec.matches(i)), None)
+                if renamed:
+                    claimed.add(renamed)
+                    drift.append({"collection": collection_name, "name": spec.name, "problem": "changed", "existing": renamed})
+                else:
+                    drift.append({"collection": collection_name, "name": spec.name, "problem": "missing"})
+            elif not spec.matches(info):
+                drift.append({"collection": collection_name, "name": spec.name, "problem": "changed", "existing": spec.name})
+        for name in existing:
+            if name != "_id_" and name not in wanted and name not in claimed:
+                drift.append({"collection": collection_name, "name": name, "problem": "unknown"})
+
+    return drift
+
+async def ensure_indexes(database, specs: List[IndexSpec] = INDEXES, prune: bool = False) -> List[dict]:
+    """
+    Bring the server's indexes in line with the registry
+
+    Missing indexes are created and changed ones rebuilt (TTL changes use
+    collMod, no rebuild). Unknown indexes are only dropped when prune=True.
+
+    Returns:
+        The drift that was found before applying
+    """
+    drift = await check_index_drift(database, specs)
+    specs_by_key = {(spec.collection, spec.name): spec for spec in specs}
+
+    for entry in drift:
+        collection = database[entry["collection"]]
+        spec = specs_by_key.get((entry["collection"], entry["name"]))
+        if entry["problem"] == "missing":
+            await collection.create_indexes([spec.model()])
+        elif entry["problem"] == "changed":
+            existing = (await collection.index_information())[entry["existing"]]
+            ttl_only = (
+                entry["existing"] == spec.name
+                and tuple((k, int(d)) for k, d in existing["key"]) == spec.keys
+                and bool(existing.get("unique", False)) == spec.unique
+                and spec.expire_after_seconds is not None
+                and "expireAfterSeconds" in existing
+            )
+            if ttl_only:
+                await database.command("collMod", entry["collection"], index={
+                    "name": spec.name, "expireAfterSeconds": spec.expire_after_seconds
+                })
+            else:
+                await collection.drop_index(entry["existing"])
+                await collection.create_indexes([spec.model()])
+        elif entry["problem"] == "unknown" and prune:
+            await collection.drop_index(entry["name"])
+
+    return drift
+
+def format_drift(drift: List[dict]) -> str:
+    if not drift:
+        return "Indexes match the registry"
+    lines = []
+    for entry in drift:
+        line = f"{entry['problem']:>8}  {entry['collection']}.{entry['name']}"
+        if entry["problem"] == "changed" and entry["existing"] != entry["name"]:
+            line += f" (currently named {entry['existing']})"
+        lines.append(line)
+    return "\n".join(lines)
+
+async def _main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check or apply MongoDB indexes from the registry")
+    parser.add_argument("--apply", action="store_true", help="create or rebuild indexes to match the registry")
+    parser.add_argument("--prune", action="store_true", help="with --apply, also drop indexes not in the registry")
+    args = parser.parse_args(argv)
+
+    from app.models.db import db, close_db
+
+    try:
+        if args.apply:
+            drift = await ensure_indexes(db, prune=args.prune)
+            print(format_drift(drift))
+            print("Indexes applied")
+            return 0
+        drift = await check_index_drift(db)
+        print(format_drift(drift))
+        return 1 if any(entry["problem"] != "unknown" for entry in drift) else 0
+    except OperationFailure as e:
+        print(f"Index operation failed: {str(e)}")
+        return 2
+    finally:
+        await close_db()
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main()))
@@ -1,91 +1,132 @@
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
-from typing import Optional, Annotated
-from bson import ObjectId
-from datetime import datetime
-
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
-
-    @classmethod
-    def validate(cls, v):
-        if not ObjectId.is_valid(v):
-            raise ValueError('Invalid objectid')
-        return ObjectId(v)
-
-    @classmethod
-    def __get_pydantic_json_schema__(cls, field_schema):
-        field_schema.update(type="string")
-
-class User(BaseModel):
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str}
-    )
-    
-    id: Optional[PyObjectId] = Field(default=None, alias="_id")
-    email: EmailStr
-    hashed_password: str
-    full_name: str
-    is_manager: bool = False
-    is_hr: bool = False
-
-class LeaveRequestCreate(BaseModel):
-    start_date: str
-    end_date: str
-    leave_type: str
-    reason: str
-    manager_email: str
-
-class LeaveRequest(BaseModel):
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str}
-    )
-    
-    id: Optional[PyObjectId] = Field(default=None, alias="_id")
-    employee_id: Optional[PyObjectId] = None
-    manager_id: Optional[PyObjectId] = None
-    start_date: str
-    end_date: str
-    leave_type: str
-    reason: str
-    manager_email: str
-    status: str = "pending"
-    is_action_taken: bool = False
-    approver_id: Optional[PyObjectId] = None
-    action_timestamp: Optional[str] = None
-    created_at: Optional[str] = None
-
-class LeaveActionRequest(BaseModel):
-    comments: Optional[str] = None
-
-class Token(BaseModel):
-    access_token: str
-    token_type: str
-
-class UserCreate(BaseModel):
-    username: str
-    email: EmailStr
-    password: str
-    full_name: str
-    role: str = "employee"
-    department: str
-
-class ApprovalToken(BaseModel):
-    token: str
-    leave_id: str
-    manager_id: str
-    action: str  # "approve" or "reject"
-    expires_at: datetime
-    is_used: bool = False
-    created_at: datetime
-
-class ForgotPasswordRequest(BaseModel):
-    email: EmailStr
-
-class ResetPasswordRequest(BaseModel):
-    email: EmailStr
-    otp: str
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, PlainSerializer, PlainValidator, WithJsonSchema
+from typing import Optional, Annotated, List
+from bson import ObjectId
+from datetime import datetime
+
+def _validate_object_id(value):
+    if isinstance(value, ObjectId):
+        return value
+    if isinstance(value, str) and ObjectId.is_valid(value):
+        return ObjectId(value)
+    raise ValueError('Invalid objectid')
+
+# ObjectId in Python, 24-char hex string in JSON and in the OpenAPI schema
+PyObjectId = Annotated[
+    ObjectId,
+    PlainValidator(_validate_object_id),
+    PlainSerializer(str, return_type=str),
+    WithJsonSchema({"type": "string", "example": "5f8d0d55b54764421b7156c9"}),
+]
+
+class User(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    
+    id: Optional[PyObjectId] = Field(default=None, alias="_id")
+    email: EmailStr
+    hashed_password: str
+    full_name: str
+    is_manager: bool = False
+    is_hr: bool = False
+
+class LeaveRequestCreate(BaseModel):
+    start_date: str
+    end_date: str
+    leave_type: str
+    reason: str
+    manager_email: str
+
+class LeaveRequest(BaseModel):
+    """
+    A leave request as returned by the list endpoints
+    """
+    model_config = ConfigDict(populate_by_name=True)
+    
+    id: Optional[PyObjectId] = Field(default=None, alias="_id")
+    employee_id: Optional[PyObjectId] = None
+    manager_id: Optional[PyObjectId] = None
+    start_date: str
+    end_date: str
+    leave_type: str
+    reason: str
+    manager_email: str
+    status: str = "pending"
+    is_action_taken: bool = False
+    approver_id: Optional[PyObjectId] = None
+    action_timestamp: Optional[str] = None
+    created_at: Optional[str] = None
+    days: Optional[int] = None
+    employee_name: Optional[str] = None
+    employee_email: Optional[str] = None
+    employee_department: Optional[str] = None
+    comments: Optional[str] = None
+    processed_via: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    version: Optional[int] = None
+
+# Fetch only what LeaveRequest exposes; the list responses are validated and rendered through it
+LEAVE_REQUEST_PROJECTION = {
+    (field.alias or name): 1 for name, field in LeaveRequest.model_fields.items()
+}
+
+class LeaveBalance(BaseModel):
+    """
+    Days for one (employee, year, leave type); entitled and available are
+    None when the leave type has no entitlement
+    """
+    employee_id: PyObjectId
+    year: int
+    leave_type: str
+    entitled: Optional[int] = None
+    used: int = 0
+    pending: int = 0
+    available: Optional[int] = None
+
+class ConflictCheckRequest(BaseModel):
+    start_date: str
+    end_date: str
+    # Check these employees, or everyone in a department; defaults to the
+    # caller's own department
+    employee_ids: Optional[List[str]] = Field(None, max_length=500)
+    department: Optional[str] = None
+
+class LeaveActionRequest(BaseModel):
+    comments: Optional[str] = None
+
+class BulkLeaveActionItem(BaseModel):
+    leave_id: str
+    action: str  # "approve" or "reject"
+    comments: Optional[str] = None
+
+class BulkLeaveActionRequest(BaseModel):
+    actions: List[BulkLeaveActionItem] = Field(..., min_length=1, max_length=500)
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str
+
+class UserCreate(BaseModel):
+    username: str
+    email: EmailStr
+    password: str
+    full_name: str
+    role: str = "employee"
+    department: str
+    # Holiday calendar for working-day counts (app/data/holidays/<region>.txt)
+    region: Optional[str] = None
+
+class ApprovalToken(BaseModel):
+    token: str
+    leave_id: str
+    manager_id: str
+    action: str  # "approve" or "reject"
+    expires_at: datetime
+    is_used: bool = False
+    created_at: datetime
+
+class ForgotPasswordRequest(BaseModel):
+    email: EmailStr
+
+class ResetPasswordRequest(BaseModel):
+    email: EmailStr
+    otp: str
     new_password: str
\ No newline at end of file
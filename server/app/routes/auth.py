@@ -1,33 +1,46 @@
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
-from app.models.db import users_collection, password_resets_collection
+from app.models.db import users_collection, password_resets_collection, run_in_transaction
 from app.models.schemas import Token, UserCreate, ForgotPasswordRequest, ResetPasswordRequest
-from app.utils.auth import verify_password, get_password_hash, create_access_token, verify_token
-from bson import ObjectId
+from app.utils.auth import averify_password, aget_password_hash, create_access_token, current_user, invalidate_cached_user
+from app.utils.email import email_configured
+from app.utils.outbox import enqueue_email, outbox_worker, KIND_PASSWORD_RESET_OTP
+from app.utils.workdays import work_calendars
 from datetime import timedelta
+import logging
 import os
 from pymongo.errors import DuplicateKeyError
 from datetime import datetime, timezone, timedelta as td
 import random
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 @router.post("/register")
-def register_user(user_data: UserCreate):
+async def register_user(user_data: UserCreate):
+    # Only regions with a holiday file; the name is never used as a path otherwise
+    region = user_data.region.lower() if user_data.region else None
+    if region is not None and region not in work_calendars.regions():
+        raise HTTPException(status_code=400, detail=f"Unknown region. Expected one of: {', '.join(work_calendars.regions())}")
+
     # Create user document
     user_dict = {
         "username": user_data.username,
         "email": user_data.email,
-        "hashed_password": get_password_hash(user_data.password),
+        "hashed_password": await aget_password_hash(user_data.password),
         "full_name": user_data.full_name,
         "role": user_data.role,
         "department": user_data.department,
+        "region": region,
         "is_manager": user_data.role == "manager",
-        "is_hr": user_data.role == "hr"
+        "is_hr": user_data.role == "hr",
+        "token_version": 0
     }
 
     try:
-        result = users_collection.insert_one(user_dict)
+        result = await users_collection.insert_one(user_dict)
     except DuplicateKeyError as e:
         # Determine which unique field caused the violation
         message = str(e)
@@ -40,17 +53,13 @@ def register_user(user_data: UserCreate):
     return {"user_id": str(result.inserted_id), "message": "User registered successfully"}
 
 @router.post("/forgot")
-def forgot_password(req: ForgotPasswordRequest):
-    print(f"🔍 DEBUG: Forgot password request for email: {req.email}")
-    
-    user = users_collection.find_one({"email": req.email})
+async def forgot_password(req: ForgotPasswordRequest):
+    user = await users_collection.find_one({"email": req.email})
     if not user:
-        print(f"❌ DEBUG: User not found for email: {req.email}")
+        logger.debug("Password reset requested for unknown email %s", req.email)
         # Do not reveal whether the email exists
         return {"message": "If the email exists, an OTP has been sent"}
 
-    print(f"✅ DEBUG: User found for email: {req.email}")
-    
     # Generate a secure 6-digit OTP using secrets module
     import secrets
     import time
@@ -62,53 +71,44 @@ def forgot_password(req: ForgotPasswordRequest):
     
     expires_at = datetime.now(timezone.utc) + td(minutes=10)
 
-    print(f"🔑 DEBUG: Generated unique OTP {otp} for {req.email}")
-
-    # Store or upsert OTP with additional security
-    password_resets_collection.update_one(
-        {"email": req.email},
-        {
-            "$set": {
-                "email": req.email, 
-                "otp": otp, 
-                "expires_at": expires_at.isoformat(), 
-                "used": False,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "attempts": 0  # Track failed attempts
-            }
-        },
-        upsert=True
-    )
+    # Store or upsert OTP with additional security, queueing the email in the
+    # same transaction so the response does not wait on SMTP
+    async def store_otp_with_email(session):
+        await password_resets_collection.update_one(
+            {"email": req.email},
+            {
+                "$set": {
+                    "email": req.email, 
+                    "otp": otp, 
+                    "expires_at": expires_at,  # BSON date so the TTL index can expire it
+                    "used": False,
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "attempts": 0  # Track failed attempts
+                }
+            },
+            upsert=True,
+            session=session
+        )
+        await enqueue_email(KIND_PASSWORD_RESET_OTP, {"email": req.email, "otp": otp, "user_id": str(user["_id"])}, session=session)
 
-    # Send email
-    email_sent = False
-    try:
-        from app.utils.email import send_password_reset_otp
-        print(f"📧 DEBUG: About to send OTP email to: {req.email}")
-        send_password_reset_otp(req.email, otp)
-        email_sent = True
-        print(f"✅ DEBUG: OTP email sent successfully to {req.email}")
-    except Exception as e:
-        # Log the error but don't fail the request for security
-        print(f"❌ DEBUG: Failed to send OTP email: {str(e)}")
-        print("This could be due to missing email configuration (EMAIL_HOST, EMAIL_USER, EMAIL_PASS)")
+    await run_in_transaction(store_otp_with_email)
+    outbox_worker.notify()
+    logger.info("Password reset OTP queued for user %s", user["_id"])
 
-    if not email_sent:
+    if not email_configured():
         # In development, be more explicit about the error
-        import os
-        if not os.getenv("EMAIL_HOST") or not os.getenv("EMAIL_USER") or not os.getenv("EMAIL_PASS"):
-            print("ERROR: Email configuration missing. Please set EMAIL_HOST, EMAIL_USER, and EMAIL_PASS environment variables.")
+        logger.error("Email configuration missing. Please set EMAIL_HOST, EMAIL_USER, and EMAIL_PASS environment variables.")
     
     return {"message": "If the email exists, an OTP has been sent"}
 
 # Alternate path for clients expecting /forgot-password
 @router.post("/forgot-password")
-def forgot_password_alt(req: ForgotPasswordRequest):
-    return forgot_password(req)
+async def forgot_password_alt(req: ForgotPasswordRequest):
+    return await forgot_password(req)
 
 @router.post("/reset")
-def reset_password(req: ResetPasswordRequest):
-    record = password_resets_collection.find_one({"email": req.email})
+async def reset_password(req: ResetPasswordRequest):
+    record = await password_resets_collection.find_one({"email": req.email})
     if not record or record.get("used"):
         raise HTTPException(status_code=400, detail="Invalid or expired OTP")
 
@@ -119,7 +119,10 @@ def reset_password(req: ResetPasswordRequest):
 
     # Validate expiry
     try:
-        expires_at = datetime.fromisoformat(record["expires_at"])
+        expires_at = record["expires_at"]
+        if isinstance(expires_at, str):
+            # Records written before expires_at became a BSON date
+            expires_at = datetime.fromisoformat(expires_at)
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid or expired OTP")
 
@@ -128,20 +131,17 @@ def reset_password(req: ResetPasswordRequest):
 
     if record.get("otp") != req.otp:
         # Increment failed attempts
-        password_resets_collection.update_one(
+        await password_resets_collection.update_one(
             {"email": req.email},
             {"$inc": {"attempts": 1}}
         )
         raise HTTPException(status_code=400, detail="Invalid OTP")
 
     # Update user's password
-    user = users_collection.find_one({"email": req.email})
+    user = await users_collection.find_one({"email": req.email})
     if not user:
         raise HTTPException(status_code=400, detail="Invalid request")
 
-    print(f"🔐 DEBUG: Password reset for user: {user.get('username', 'Unknown')} ({user.get('email')})")
-    print(f"📝 DEBUG: Preserving user details - Full Name: {user.get('full_name')}, Role: {user.get('role')}, Department: {user.get('department')}")
-    
     # Store original user details for verification
     original_details = {
         "username": user.get("username"),
@@ -153,14 +153,19 @@ def reset_password(req: ResetPasswordRequest):
         "is_hr": user.get("is_hr")
     }
     
-    # ONLY update the password hash - all other details remain unchanged
-    update_result = users_collection.update_one(
+    # ONLY update the password hash - all other details remain unchanged.
+    # Bumping token_version signs out sessions issued with the old password.
+    update_result = await users_collection.update_one(
         {"_id": user["_id"]}, 
-        {"$set": {"hashed_password": get_password_hash(req.new_password)}}
+        {
+            "$set": {"hashed_password": await aget_password_hash(req.new_password)},
+            "$inc": {"token_version": 1}
+        }
     )
+    invalidate_cached_user(user["_id"])
     
     # Verify that only the password was updated
-    updated_user = users_collection.find_one({"_id": user["_id"]})
+    updated_user = await users_collection.find_one({"_id": user["_id"]})
     verification_details = {
         "username": updated_user.get("username"),
         "email": updated_user.get("email"),
@@ -173,51 +178,44 @@ def reset_password(req: ResetPasswordRequest):
     
     # Check if any non-password fields were accidentally changed
     if original_details != verification_details:
-        print(f"⚠️  WARNING: User details changed during password reset!")
-        print(f"Original: {original_details}")
-        print(f"After: {verification_details}")
-    else:
-        print(f"✅ VERIFIED: All user details preserved during password reset")
+        logger.warning("User %s details changed during password reset: %s -> %s", user["_id"], original_details, verification_details)
     
     # Mark OTP as used and reset attempts
-    password_resets_collection.update_one(
+    await password_resets_collection.update_one(
         {"email": req.email}, 
         {"$set": {"used": True, "used_at": datetime.now(timezone.utc).isoformat()}}
     )
 
-    print(f"🎉 DEBUG: Password reset completed successfully for {req.email}")
+    logger.info("Password reset completed for user %s", user["_id"])
     return {"message": "Password has been reset successfully"}
 
 # Alternate path for clients expecting /reset-password
 @router.post("/reset-password")
-def reset_password_alt(req: ResetPasswordRequest):
-    return reset_password(req)
+async def reset_password_alt(req: ResetPasswordRequest):
+    return await reset_password(req)
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends()):
+async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     # Try to find user by username or email
-    user = users_collection.find_one({
+    user = await users_collection.find_one({
         "$or": [
             {"username": form_data.username},
             {"email": form_data.username}
         ]
     })
     
-    if not user or not verify_password(form_data.password, user["hashed_password"]):
+    if not user or not await averify_password(form_data.password, user["hashed_password"]):
         raise HTTPException(status_code=401, detail="Incorrect username/email or password")
     
     access_token = create_access_token(
-        data={"sub": str(user["_id"]), "email": user["email"]},
-        expires_delta=timedelta(minutes=60*24)
+        data={},
+        expires_delta=timedelta(minutes=60*24),
+        user=user
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/me")
-def get_current_user(user_id: str = Depends(verify_token)):
-    user = users_collection.find_one({"_id": ObjectId(user_id)})
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
+async def get_current_user(user: dict = Depends(current_user)):
     # Return user data without password
     user_data = {
         "id": str(user["_id"]),
@@ -233,7 +231,7 @@ def get_current_user(user_id: str = Depends(verify_token)):
     return user_data
 
 @router.post("/test-email")
-def test_email():
+async def test_email():
     """Test endpoint to verify email configuration"""
     try:
         from app.utils.email import send_leave_action_email
@@ -248,14 +246,14 @@ def test_email():
             "reason": "Family vacation - This is a test email"
         }
         
-        send_leave_action_email(test_leave)
+        await send_leave_action_email(test_leave)
         return {"message": "Test email sent successfully"}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Email test failed: {str(e)}")
 
 @router.post("/test-otp")
-def test_otp_email():
+async def test_otp_email():
     """Test endpoint to verify OTP email configuration"""
     import os
     
@@ -276,20 +274,20 @@ def test_otp_email():
         test_email = "test@example.com"  # Change this to your email for testing
         test_otp = "123456"
         
-        send_password_reset_otp(test_email, test_otp)
+        await run_in_threadpool(send_password_reset_otp, test_email, test_otp)
         return {"message": f"Test OTP email sent successfully to {test_email}"}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"OTP email test failed: {str(e)}")
 
 @router.post("/debug/create-manager")
-def create_test_manager():
+async def create_test_manager():
     """Create a test manager for debugging"""
     try:
         test_manager = {
             "username": "testmanager",
             "email": "manager@company.com",
-            "hashed_password": get_password_hash("password123"),
+            "hashed_password": await aget_password_hash("password123"),
             "full_name": "Test Manager",
             "role": "manager",
             "department": "Management",
@@ -298,11 +296,11 @@ def create_test_manager():
         }
         
         # Check if manager already exists
-        existing = users_collection.find_one({"email": "manager@company.com"})
+        existing = await users_collection.find_one({"email": "manager@company.com"})
         if existing:
             return {"message": "Manager already exists", "email": "manager@company.com"}
         
-        result = users_collection.insert_one(test_manager)
+        result = await users_collection.insert_one(test_manager)
         return {
             "message": "Test manager created successfully",
             "manager_id": str(result.inserted_id),
@@ -313,15 +311,15 @@ def create_test_manager():
         return {"error": "Failed to create manager: " + str(e)}
 
 @router.get("/managers")
-def get_all_managers():
+async def get_all_managers():
     """Get all managers in the database"""
     try:
         # Find all managers
-        managers = list(users_collection.find({"is_manager": True}))
+        managers = await users_collection.find({"is_manager": True}).to_list()
         
         if not managers:
             # Check if there are any users with role 'manager'
-            managers = list(users_collection.find({"role": "manager"}))
+            managers = await users_collection.find({"role": "manager"}).to_list()
         
         # Convert ObjectId to string and remove sensitive data
         manager_list = []
@@ -340,7 +338,7 @@ def get_all_managers():
             manager_list.append(manager_data)
         
         # Get total user count
-        total_users = users_collection.count_documents({})
+        total_users = await users_collection.count_documents({})
         
         return {
             "managers": manager_list,
@@ -353,10 +351,10 @@ def get_all_managers():
         return {"error": f"Failed to fetch managers: {str(e)}"}
 
 @router.get("/users")
-def get_all_users():
+async def get_all_users():
     """Get all users in the database (for debugging)"""
     try:
-        users = list(users_collection.find({}))
+        users = await users_collection.find({}).to_list()
         
         user_list = []
         for user in users:
@@ -1,49 +1,56 @@
-from fastapi import APIRouter, HTTPException, Depends, Request, status, Form
-from app.models.db import leaves_collection, users_collection, tokens_collection
-from app.models.schemas import LeaveRequestCreate, LeaveRequest, LeaveActionRequest
-from app.utils.auth import verify_token, verify_password
+import asyncio
+import logging
+from fastapi import APIRouter, HTTPException, Depends, Request, status, Form, Query
+from fastapi.responses import Response, StreamingResponse
+from app.models.db import leaves_collection, users_collection, tokens_collection, run_in_transaction
+from app.models.schemas import LeaveRequestCreate, LeaveRequest, LeaveBalance, LeaveActionRequest, ConflictCheckRequest, BulkLeaveActionRequest, LEAVE_REQUEST_PROJECTION
+from app.utils.auth import verify_token, averify_password, current_user, require_manager, stream_user, create_stream_ticket, STREAM_TICKET_EXPIRE_SECONDS
 from app.utils.email import send_leave_action_email, notify_employee
-from app.utils.tokens import verify_token as verify_approval_token, use_token, revoke_tokens_for_leave
+from app.utils.pagination import Page, PageParams, paginate
+from app.utils.changes import changes_since, stamp_new, stamp_update
+from app.utils.stats import leave_stats
+from app.utils.conflicts import leave_interval, find_overlap, find_team_conflicts
+from app.utils.availability import team_calendar, CALENDAR_MAX_DAYS
+from app.utils.workdays import work_calendars, user_region
+from app.utils.balances import get_balance, get_balances, balance_update, apply_balance_updates, balances_ready, COUNTED_FIELD
+from app.utils.outbox import enqueue_leave_notification, outbox_worker
+from app.utils.tokens import verify_token as verify_approval_token, use_token, release_token
+from app.utils.events import leave_events, leave_event, EVENT_HEARTBEAT_SECONDS
+from app.utils.transitions import transition_leave, bulk_transition_leaves, LeaveTransitionError
 from bson import ObjectId
 from datetime import datetime, timezone
 from typing import Optional, List
+from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 @router.post("/submit")
-def submit_leave(leave: LeaveRequestCreate, user_id: str = Depends(verify_token)):
-    print(f"🚀 DEBUG: Leave submission started for user_id: {user_id}")
-    print(f"📝 DEBUG: Leave data received: {leave.model_dump()}")
+async def submit_leave(leave: LeaveRequestCreate, user: dict = Depends(current_user)):
+    user_id = str(user["_id"])
+    logger.debug("Leave submission by user %s: %s to %s (%s)", user_id, leave.start_date, leave.end_date, leave.leave_type)
     
     try:
-        # Get user details
-        print(f"👤 DEBUG: Looking up user with ID: {user_id}")
-        user = users_collection.find_one({"_id": ObjectId(user_id)})
-        if not user:
-            print(f"❌ DEBUG: User not found for ID: {user_id}")
-            raise HTTPException(status_code=404, detail="User not found")
-        
-        print(f"✅ DEBUG: User found: {user.get('username', user.get('email', f'User_{user_id[:8]}'))} ({user.get('email', 'No email set')})")
-        
         # Find manager by email
-        print(f"👔 DEBUG: Looking up manager with email: {leave.manager_email}")
-        manager = users_collection.find_one({"email": leave.manager_email})
+        manager = await users_collection.find_one({"email": leave.manager_email})
         if not manager:
-            print(f"❌ DEBUG: Manager not found for email: {leave.manager_email}")
             raise HTTPException(status_code=404, detail="Manager not found")
         
-        manager_id_short = str(manager["_id"])[:8]
-        manager_name = manager.get('username', manager.get('email', f'Manager_{manager_id_short}'))
-        print(f"✅ DEBUG: Manager found: {manager_name} ({manager.get('email', 'No email set')})")
-        
         # Create leave request
         leave_dict = leave.model_dump()
         
-        # Calculate number of days
-        from datetime import datetime as dt
-        start_date = dt.fromisoformat(leave.start_date)
-        end_date = dt.fromisoformat(leave.end_date)
-        days = (end_date - start_date).days + 1  # Include both start and end dates
+        # Calculate number of working days (weekends and the region's holidays excluded)
+        try:
+            start_date, end_date = leave_interval(leave.start_date, leave.end_date)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Dates must be in YYYY-MM-DD format")
+        if end_date < start_date:
+            raise HTTPException(status_code=400, detail="End date cannot be before start date")
+        region = user_region(user)
+        days = work_calendars.count(start_date.date(), end_date.date(), region)
+        if days == 0:
+            raise HTTPException(status_code=400, detail="Leave must include at least one working day")
         
         leave_dict.update({
             "employee_id": ObjectId(user_id),
@@ -54,125 +61,260 @@ def submit_leave(leave: LeaveRequestCreate, user_id: str = Depends(verify_token)
             "employee_name": user.get("full_name", user.get("username", user.get("email", f"Employee_{user_id[:8]}"))),
             "employee_email": user.get("email", ""),
             "employee_department": user.get("department", "General"),
-            "days": days  # Add calculated days field
+            "days": days,  # Add calculated days field
+            "region": region,
+            # Native dates for overlap and calendar queries
+            "start": start_date,
+            "end": end_date,
+            COUNTED_FIELD: True
         })
         
-        print(f"📅 DEBUG: Calculated {days} days for leave from {leave.start_date} to {leave.end_date}")
-        
-        print(f"💾 DEBUG: Inserting leave request into database...")
-        result = leaves_collection.insert_one(leave_dict)
-        print(f"✅ DEBUG: Leave request inserted with ID: {result.inserted_id}")
-        
-        # Try to send email to manager (optional)
-        try:
-            leave_dict["_id"] = result.inserted_id
-            print(f"📧 DEBUG: Attempting to send email notification...")
-            send_leave_action_email(leave_dict)
-            print(f"✅ DEBUG: Email notification sent successfully")
-        except Exception as e:
-            print(f"❌ DEBUG: Email notification failed: {str(e)}")
-            # Continue processing even if email fails
-        
-        print(f"🎉 DEBUG: Leave submission completed successfully")
-        return {"leave_request_id": str(result.inserted_id), "status": "pending"}
+        # One probe on (employee_id, start, end) for a pending/approved overlap
+        overlap = await find_overlap(ObjectId(user_id), start_date, end_date)
+        if overlap:
+            raise HTTPException(status_code=409, detail=f"Overlaps your {overlap['status']} leave from {overlap['start_date']} to {overlap['end_date']}")
+        
+        # Pending requests count against the balance too, so one document read
+        # suffices; not enforced until the ledger has been backfilled
+        if await balances_ready():
+            balance = await get_balance(ObjectId(user_id), start_date.year, leave.leave_type)
+            if balance["available"] is not None and days > balance["available"]:
+                raise HTTPException(status_code=400, detail=f"Insufficient {leave.leave_type} leave balance: {balance['available']} day(s) available, {days} requested")
+        
+        leave_dict["_id"] = ObjectId()
+        stamp_new(leave_dict)
+        
+        # The manager's approval email is queued in the same transaction as the
+        # leave itself and delivered by the outbox worker after we respond
+        async def insert_leave_with_email(session):
+            await leaves_collection.insert_one(leave_dict, session=session)
+            await apply_balance_updates([balance_update(leave_dict, None, "pending")], session=session)
+            await enqueue_leave_notification(leave_dict, session=session)
+        
+        await run_in_transaction(insert_leave_with_email)
+        outbox_worker.notify()
+        leave_events.publish(leave_event(leave_dict, "submitted"))
+        logger.info("Leave request %s submitted by user %s for %d day(s), approval email queued", leave_dict["_id"], user_id, days)
+        return {"leave_request_id": str(leave_dict["_id"]), "status": "pending"}
         
     except HTTPException as he:
-        print(f"❌ DEBUG: HTTP Exception in leave submission: {he.detail}")
+        logger.debug("Leave submission by user %s refused: %s", user_id, he.detail)
         raise he
     except Exception as e:
-        print(f"❌ DEBUG: Unexpected error in leave submission: {str(e)}")
-        print(f"❌ DEBUG: Error type: {type(e).__name__}")
+        logger.exception("Unexpected error in leave submission by user %s", user_id)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-@router.get("/my-requests", response_model=List[dict])
-def get_my_requests(user_id: str = Depends(verify_token)):
-    leaves = list(leaves_collection.find({"employee_id": ObjectId(user_id)}))
-    for leave in leaves:
-        leave["_id"] = str(leave["_id"])
-        leave["employee_id"] = str(leave["employee_id"])
-        leave["manager_id"] = str(leave["manager_id"])
-        if leave.get("approver_id"):
-            leave["approver_id"] = str(leave["approver_id"])
-    return leaves
+# Returning a Response skips FastAPI's response_model handling, so the list
+# routes validate and render through LeaveRequest themselves: one pass in
+# pydantic-core, ObjectIds serialized by PyObjectId
+_leave_list = TypeAdapter(List[LeaveRequest])
 
-@router.get("/pending-approvals", response_model=List[dict])
-def get_pending_approvals(user_id: str = Depends(verify_token)):
-    # Check if user is a manager
-    user = users_collection.find_one({"_id": ObjectId(user_id)})
-    if not user or not user.get("is_manager"):
-        raise HTTPException(status_code=403, detail="Access denied. Manager role required.")
-    
-    leaves = list(leaves_collection.find({
-        "manager_id": ObjectId(user_id), 
+def leave_list_response(page: Page) -> Response:
+    body = _leave_list.dump_json(_leave_list.validate_python(page.items), by_alias=True)
+    return Response(body, media_type="application/json", headers=page.headers())
+
+@router.get("/my-requests", response_model=List[LeaveRequest])
+async def get_my_requests(page: PageParams = Depends(), user_id: str = Depends(verify_token)):
+    # Newest first; older pages via the X-Next-Cursor header
+    page = await paginate(leaves_collection, {"employee_id": ObjectId(user_id)}, "created_at", page, LEAVE_REQUEST_PROJECTION)
+    return leave_list_response(page)
+
+@router.get("/pending-approvals", response_model=List[LeaveRequest])
+async def get_pending_approvals(page: PageParams = Depends(), manager: dict = Depends(require_manager)):
+    page = await paginate(leaves_collection, {
+        "manager_id": manager["_id"], 
         "status": "pending",
         "is_action_taken": False
-    }))
+    }, "created_at", page, LEAVE_REQUEST_PROJECTION)
     
-    for leave in leaves:
-        leave["_id"] = str(leave["_id"])
-        leave["employee_id"] = str(leave["employee_id"])
-        leave["manager_id"] = str(leave["manager_id"])
-        if leave.get("approver_id"):
-            leave["approver_id"] = str(leave["approver_id"])
-    return leaves
+    return leave_list_response(page)
 
-@router.get("/processed-approvals", response_model=List[dict])
-def get_processed_approvals(user_id: str = Depends(verify_token)):
-    # Check if user is a manager
-    user = users_collection.find_one({"_id": ObjectId(user_id)})
-    if not user or not user.get("is_manager"):
-        raise HTTPException(status_code=403, detail="Access denied. Manager role required.")
-    
-    leaves = list(leaves_collection.find({
-        "manager_id": ObjectId(user_id), 
+@router.get("/processed-approvals", response_model=List[LeaveRequest])
+async def get_processed_approvals(page: PageParams = Depends(), manager: dict = Depends(require_manager)):
+    page = await paginate(leaves_collection, {
+        "manager_id": manager["_id"], 
         "is_action_taken": True
-    }).sort("action_timestamp", -1))  # Sort by most recent first
+    }, "action_timestamp", page, LEAVE_REQUEST_PROJECTION)  # Sort by most recent first
     
-    for leave in leaves:
-        leave["_id"] = str(leave["_id"])
-        leave["employee_id"] = str(leave["employee_id"])
-        leave["manager_id"] = str(leave["manager_id"])
-        if leave.get("approver_id"):
-            leave["approver_id"] = str(leave["approver_id"])
-    return leaves
+    return leave_list_response(page)
 
 @router.post("/{leave_id}/approve")
-def approve_leave(leave_id: str, action_data: LeaveActionRequest, user_id: str = Depends(verify_token)):
-    return process_leave_action(leave_id, "approved", user_id, action_data.comments)
+async def approve_leave(leave_id: str, action_data: LeaveActionRequest, user_id: str = Depends(verify_token)):
+    return await process_leave_action(leave_id, "approved", user_id, action_data.comments)
 
 @router.post("/{leave_id}/reject") 
-def reject_leave(leave_id: str, action_data: LeaveActionRequest, user_id: str = Depends(verify_token)):
-    return process_leave_action(leave_id, "rejected", user_id, action_data.comments)
-
-def process_leave_action(leave_id: str, action: str, user_id: str, comments: Optional[str] = None):
-    # Find leave request
-    leave = leaves_collection.find_one({"_id": ObjectId(leave_id)})
-    if not leave:
-        raise HTTPException(status_code=404, detail="Leave request not found")
+async def reject_leave(leave_id: str, action_data: LeaveActionRequest, user_id: str = Depends(verify_token)):
+    return await process_leave_action(leave_id, "rejected", user_id, action_data.comments)
+
+@router.get("/changes", response_model=List[LeaveRequest])
+async def get_leave_changes(
+    page: PageParams = Depends(),
+    scope: str = Query("mine", pattern="^(mine|team)$", description="mine: own requests; team: requests to approve (managers)"),
+    user: dict = Depends(current_user)
+):
+    """
+    Leave requests changed since the `after` cursor, oldest change first
+
+    Call without `after` once the full list is loaded to get a starting
+    cursor, then poll with the X-Next-Cursor of each response. An empty
+    list means nothing changed.
+    """
+    if scope == "team":
+        if not user.get("is_manager"):
+            raise HTTPException(status_code=403, detail="Access denied. Manager role required.")
+        base_filter = {"manager_id": user["_id"]}
+    else:
+        base_filter = {"employee_id": user["_id"]}
+    
+    page = await changes_since(leaves_collection, base_filter, page, LEAVE_REQUEST_PROJECTION)
+    return leave_list_response(page)
+
+@router.get("/stats")
+async def get_leave_stats(
+    scope: str = Query("mine", pattern="^(mine|team)$", description="mine: own requests; team: requests to approve (managers)"),
+    year: Optional[int] = Query(None, ge=2000, le=2100, description="Year for approved-day totals (default: current)"),
+    user: dict = Depends(current_user)
+):
+    """
+    Counts by status, approved days per leave type, pending age buckets and
+    this month's decisions, computed server-side
+    """
+    if scope == "team" and not user.get("is_manager"):
+        raise HTTPException(status_code=403, detail="Access denied. Manager role required.")
     
-    if leave.get("is_action_taken"):
-        raise HTTPException(status_code=400, detail="Action already taken on this leave request")
+    return await leave_stats(str(user["_id"]), scope, year)
+
+@router.get("/balance", response_model=List[LeaveBalance])
+async def get_leave_balance(
+    year: Optional[int] = Query(None, ge=2000, le=2100, description="Default: current year"),
+    user: dict = Depends(current_user)
+):
+    """
+    The caller's entitled, used (approved), pending and available days per
+    leave type; available is null for leave types without an entitlement
+    """
+    year = year or datetime.now(timezone.utc).year
+    return await get_balances(user["_id"], year)
+
+@router.post("/conflicts")
+async def check_team_conflicts(request: ConflictCheckRequest, manager: dict = Depends(require_manager)):
+    """
+    Who already has pending or approved leave overlapping a proposed range,
+    for a list of employees or a department, in one query
+    """
+    try:
+        start, end = leave_interval(request.start_date, request.end_date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Dates must be in YYYY-MM-DD format")
+    if end < start:
+        raise HTTPException(status_code=400, detail="End date cannot be before start date")
     
-    # Verify user is the assigned manager
-    if str(leave["manager_id"]) != user_id:
-        raise HTTPException(status_code=403, detail="Only the assigned manager can process this leave request")
+    employee_ids = None
+    department = request.department
+    if request.employee_ids is not None:
+        if not all(ObjectId.is_valid(employee_id) for employee_id in request.employee_ids):
+            raise HTTPException(status_code=400, detail="Invalid employee ID")
+        employee_ids = [ObjectId(employee_id) for employee_id in request.employee_ids]
+    elif department is None:
+        department = manager.get("department")
     
-    # Update leave status
-    update_data = {
-        "status": action,
-        "is_action_taken": True,
-        "approver_id": ObjectId(user_id),
-        "action_timestamp": datetime.now(timezone.utc).isoformat(),
-        "processed_via": "dashboard"
+    conflicts = await find_team_conflicts(start, end, employee_ids, department)
+    return {
+        "start_date": request.start_date,
+        "end_date": request.end_date,
+        "employees_affected": len(conflicts),
+        "conflicts": conflicts
     }
+
+@router.get("/calendar")
+async def get_team_calendar(
+    from_date: str = Query(..., alias="from", description="YYYY-MM-DD"),
+    to_date: str = Query(..., alias="to", description="YYYY-MM-DD, inclusive"),
+    department: Optional[str] = Query(None, description="Default: the manager's department"),
+    manager: dict = Depends(require_manager)
+):
+    """
+    How many people in a department are off each day, approved and pending
+    counted separately; one entry per day from `from` to `to`
+    """
+    try:
+        start, end = leave_interval(from_date, to_date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Dates must be in YYYY-MM-DD format")
+    if end < start:
+        raise HTTPException(status_code=400, detail="End date cannot be before start date")
+    if (end - start).days + 1 > CALENDAR_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"Date range cannot exceed {CALENDAR_MAX_DAYS} days")
     
-    if comments:
-        update_data["comments"] = comments
+    department = department or manager.get("department")
+    return await team_calendar(department, start.date(), end.date())
+
+@router.post("/stream-ticket")
+async def get_stream_ticket(user: dict = Depends(current_user)):
+    """
+    A short-lived ticket for opening /leave/stream, so the access token
+    never goes in a URL
+    """
+    return {"ticket": create_stream_ticket(user), "expires_in": STREAM_TICKET_EXPIRE_SECONDS}
+
+@router.get("/stream")
+async def stream_leave_events(request: Request, user: dict = Depends(stream_user)):
+    """
+    Server-sent events for leave requests the caller submitted or manages
+
+    Sends a `leave` event ({type, leave_id, status, ...}) on every submit,
+    approval or rejection, and `resync` when events may have been missed;
+    dashboards re-fetch on either instead of polling.
+    """
+    subscriber = leave_events.subscribe(str(user["_id"]))
+    
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    yield await asyncio.wait_for(subscriber.queue.get(), timeout=EVENT_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keepalive\n\n"
+        finally:
+            leave_events.unsubscribe(subscriber)
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+
+@router.post("/bulk-action")
+async def bulk_leave_action(request: BulkLeaveActionRequest, manager: dict = Depends(require_manager)):
+    """
+    Approve/reject many leave requests at once
+
+    Each item succeeds or fails on its own; the response lists one result
+    per item in request order.
+    """
+    results = await bulk_transition_leaves(
+        [item.model_dump() for item in request.actions], str(manager["_id"])
+    )
     
-    leaves_collection.update_one({"_id": ObjectId(leave_id)}, {"$set": update_data})
+    for result in results:
+        if result["success"]:
+            # Notify employee
+            notify_employee({"_id": ObjectId(result["leave_id"])}, result["status"])
     
-    # Revoke any pending email tokens for this leave
-    revoke_tokens_for_leave(leave_id)
+    succeeded = sum(1 for result in results if result["success"])
+    return {
+        "results": results,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded
+    }
+
+async def process_leave_action(leave_id: str, action: str, user_id: str, comments: Optional[str] = None):
+    # One conditional update: only applies while the leave is pending and
+    # assigned to this manager; email tokens are revoked with it
+    leave = await transition_leave(leave_id, action, user_id, "dashboard", comments)
     
     # Notify employee
     notify_employee(leave, action)
@@ -183,47 +325,45 @@ def process_leave_action(leave_id: str, action: str, user_id: str, comments: Opt
         "comments": comments
     }
 
-def process_leave_action_with_password(leave_id: str, action: str, manager_id: str, password: str, comments: Optional[str] = None):
-    # Find leave request
-    leave = leaves_collection.find_one({"_id": ObjectId(leave_id)})
-    if not leave:
-        raise HTTPException(status_code=404, detail="Leave request not found")
-    
-    if leave.get("is_action_taken"):
-        raise HTTPException(status_code=400, detail=f"This leave request has already been {leave.get('status', 'processed')}. No further action is required.")
-    
+def already_processed_error(leave: dict) -> HTTPException:
+    return HTTPException(status_code=400, detail=f"This leave request has already been {leave.get('status', 'processed')}. No further action is required.")
+
+async def decided_leave(leave_id: str) -> Optional[dict]:
+    """
+    The leave's status fields if it has already been approved or rejected,
+    None while it is pending (or missing)
+    """
+    leave = await leaves_collection.find_one({"_id": ObjectId(leave_id)}, {"status": 1, "is_action_taken": 1})
+    if leave and (leave.get("is_action_taken") or leave.get("status") != "pending"):
+        return leave
+    return None
+
+async def process_leave_action_with_password(leave_id: str, action: str, manager_id: str, password: str, comments: Optional[str] = None):
     # Verify manager password
-    manager = users_collection.find_one({"_id": ObjectId(manager_id)})
-    if not manager or not verify_password(password, manager["hashed_password"]):
+    manager = await users_collection.find_one({"_id": ObjectId(manager_id)}, {"hashed_password": 1})
+    if not manager or not await averify_password(password, manager["hashed_password"]):
         raise HTTPException(status_code=401, detail="Invalid manager password. Please check your password and try again.")
     
-    # Verify user is the assigned manager
-    if str(leave["manager_id"]) != manager_id:
-        raise HTTPException(status_code=403, detail="Only the assigned manager can process this leave request")
-    
-    # Convert action to proper status (maintain consistency with API endpoints)
-    status = "approved" if action == "approve" else "rejected" if action == "reject" else action
-    
-    # Update leave status
-    update_data = {
-        "status": status,
-        "is_action_taken": True,
-        "approver_id": ObjectId(manager_id),
-        "action_timestamp": datetime.now(timezone.utc).isoformat(),
-        "processed_via": "email"  # Mark that this was processed via email
-    }
-    
-    if comments:
-        update_data["comments"] = comments
-    
-    leaves_collection.update_one({"_id": ObjectId(leave_id)}, {"$set": update_data})
+    return await process_email_action(leave_id, action, manager_id, comments)
+
+async def process_email_action(leave_id: str, action: str, manager_id: str, comments: Optional[str] = None, revoke_tokens: bool = True):
+    """
+    Apply an email approval/rejection for a manager whose password has
+    already been verified
+    """
+    try:
+        leave = await transition_leave(leave_id, action, manager_id, "email", comments, revoke_tokens=revoke_tokens)
+    except LeaveTransitionError as e:
+        if e.reason == "already_processed":
+            raise already_processed_error(e.leave)
+        raise
     
     # Notify employee
-    notify_employee(leave, status)
+    notify_employee(leave, leave["status"])
     
     return {
-        "status": status,
-        "message": f"Leave request {status} successfully via email.",
+        "status": leave["status"],
+        "message": f"Leave request {leave['status']} successfully via email.",
         "comments": comments
     }
 
@@ -240,7 +380,7 @@ async def approve_from_email(
     """
     try:
         # Use the password verification function
-        result = process_leave_action_with_password(leave_id, action, manager_id, password, comments)
+        result = await process_leave_action_with_password(leave_id, action, manager_id, password, comments)
         
         # Return success response for AMP email
         return {
@@ -255,7 +395,8 @@ async def approve_from_email(
             "message": str(e.detail),
             "action": action
         }
-    except Exception as e:
+    except Exception:
+        logger.exception("Email approval error for leave %s", leave_id)
         # Return generic error for unexpected issues
         return {
             "status": "error", 
@@ -277,16 +418,11 @@ async def approve_with_token(
     Enhanced security: Both token AND password required
     """
     try:
-        print(f"🔧 DEBUG - Received approval request:")
-        print(f"   Token: {token[:8]}...")
-        print(f"   Leave ID: {leave_id}")
-        print(f"   Manager ID: {manager_id}")
-        print(f"   Action: '{action}'")
-        print(f"   Password provided: {bool(password)}")
-        print(f"   Comments: '{comments}'")
+        # Never log the token or password
+        logger.debug("Email %s for leave %s by manager %s", action, leave_id, manager_id)
         
         # Verify the token first
-        token_doc = verify_approval_token(token)
+        token_doc = await verify_approval_token(token)
         if not token_doc:
             raise HTTPException(status_code=400, detail="Invalid or expired security token. Please request a new approval email.")
         
@@ -297,12 +433,7 @@ async def approve_with_token(
             raise HTTPException(status_code=400, detail="Token validation failed. Security mismatch detected.")
         
         # Now verify password (manager requirement)
-        manager = users_collection.find_one({"_id": ObjectId(manager_id)})
-        print(f"🔧 DEBUG - Password verification:")
-        print(f"   Manager found: {manager is not None}")
-        print(f"   Manager ID: {manager_id}")
-        print(f"   Received password: '{password}' (length: {len(password) if password else 0})")
-        print(f"   Manager has hashed_password: {bool(manager and 'hashed_password' in manager)}")
+        manager = await users_collection.find_one({"_id": ObjectId(manager_id)}, {"hashed_password": 1})
         
         if not manager:
             raise HTTPException(status_code=400, detail="Manager not found in database.")
@@ -310,20 +441,33 @@ async def approve_with_token(
         if not manager.get("hashed_password"):
             raise HTTPException(status_code=400, detail="Manager password not set in database.")
             
-        password_valid = verify_password(password, manager["hashed_password"])
-        print(f"   Password verification result: {password_valid}")
+        password_valid = await averify_password(password, manager["hashed_password"])
         
         if not password_valid:
+            logger.warning("Wrong password for email %s of leave %s by manager %s", action, leave_id, manager_id)
             raise HTTPException(status_code=401, detail="Invalid manager password. Please check your password and try again.")
         
-        # Process the leave action
-        result = process_leave_action_with_password(leave_id, action, manager_id, password, comments)
-        
-        # Mark token as used
-        use_token(token)
-        
-        # Revoke other tokens for this leave request
-        revoke_tokens_for_leave(leave_id)
+        # Mark token as used and revoke the leave's other token in one
+        # ledger write; the upsert is atomic, so a replayed token loses here
+        # even if the leave was reset to pending since
+        if not await use_token(token, revoke_leave=True):
+            # A leave already decided on the dashboard (or by the other
+            # button) has revoked this token; say so instead of "already used"
+            decided = await decided_leave(leave_id)
+            if decided:
+                raise already_processed_error(decided)
+            raise HTTPException(status_code=400, detail="This security token has already been used. Please request a new approval email.")
+        
+        # Process the leave action; the password was checked above
+        try:
+            result = await process_email_action(leave_id, action, manager_id, comments, revoke_tokens=False)
+        except Exception as e:
+            # Unless the leave was already decided (a plain 400 from
+            # process_email_action, whose message comes from the transition's
+            # own read), nothing was applied: give the token back
+            if isinstance(e, LeaveTransitionError) or not isinstance(e, HTTPException):
+                await release_token(token)
+            raise
         
         return {
             "success": True,
@@ -335,7 +479,7 @@ async def approve_with_token(
         # Don't catch HTTPException - let it bubble up for proper status codes
         if isinstance(e, HTTPException):
             raise e
-        print(f"Token approval error: {str(e)}")
+        logger.exception("Token approval error for leave %s", leave_id)
         return {
             "status": "error",
             "message": "An unexpected error occurred during approval",
@@ -354,7 +498,7 @@ async def redirect_reject(
     """
     try:
         # Verify the token
-        token_doc = verify_approval_token(token)
+        token_doc = await verify_approval_token(token)
         if not token_doc:
             return {
                 "status": "error",
@@ -377,8 +521,8 @@ async def redirect_reject(
             "message": "Redirecting to manager dashboard for rejection workflow"
         }
         
-    except Exception as e:
-        print(f"Redirect rejection error: {str(e)}")
+    except Exception:
+        logger.exception("Redirect rejection error for leave %s", leave_id)
         return {
             "status": "error",
             "message": "An unexpected error occurred"
@@ -402,7 +546,7 @@ async def reject_with_token(
             redirect = f"{default_frontend_url}/manager/dashboard"
         
         # Verify the token
-        token_doc = verify_approval_token(token)
+        token_doc = await verify_approval_token(token)
         if not token_doc:
             # Redirect to dashboard with error message
             return f"<html><body><script>window.location.href='{redirect}?error=invalid_token';</script></body></html>"
@@ -412,7 +556,8 @@ async def reject_with_token(
             return f"<html><body><script>window.location.href='{redirect}?error=invalid_action';</script></body></html>"
         
         # Mark token as used
-        use_token(token)
+        if not await use_token(token):
+            return f"<html><body><script>window.location.href='{redirect}?error=invalid_token';</script></body></html>"
         
         # Redirect to dashboard with leave ID for rejection
         dashboard_url = f"{redirect}?reject_leave={token_doc['leave_id']}&token_verified=true"
@@ -433,45 +578,15 @@ async def reject_with_token(
         </html>
         """
         
-    except Exception as e:
-        print(f"Token rejection error: {str(e)}")
+    except Exception:
+        logger.exception("Token rejection error")
         return f"<html><body><script>window.location.href='{redirect}?error=token_error';</script></body></html>"
 
-@router.post("/debug/fix-leave-days")
-def fix_leave_days():
-    """Fix missing days field in existing leave records"""
-    try:
-        from datetime import datetime as dt
-        leaves = list(leaves_collection.find({"days": {"$exists": False}}))
-        updated_count = 0
-        
-        for leave in leaves:
-            try:
-                start_date = dt.fromisoformat(leave['start_date'])
-                end_date = dt.fromisoformat(leave['end_date'])
-                days = (end_date - start_date).days + 1
-                
-                leaves_collection.update_one(
-                    {"_id": leave["_id"]},
-                    {"$set": {"days": days}}
-                )
-                updated_count += 1
-                print(f"Updated leave {leave['_id']} with {days} days")
-            except Exception as e:
-                print(f"Failed to update leave {leave.get('_id')}: {e}")
-        
-        return {
-            "message": f"Updated {updated_count} leave records with days field",
-            "updated_count": updated_count
-        }
-    except Exception as e:
-        return {"error": f"Failed to fix leave days: {str(e)}"}
-
 @router.get("/debug/check-leave-status/{leave_id}")
-def check_leave_status(leave_id: str):
+async def check_leave_status(leave_id: str):
     """Debug endpoint to check leave request status"""
     try:
-        leave = leaves_collection.find_one({"_id": ObjectId(leave_id)})
+        leave = await leaves_collection.find_one({"_id": ObjectId(leave_id)})
         if not leave:
             return {"error": "Leave request not found"}
         
@@ -495,10 +610,10 @@ def check_leave_status(leave_id: str):
         return {"error": f"Failed to check leave status: {str(e)}"}
 
 @router.get("/debug/list-recent-leaves")
-def list_recent_leaves():
+async def list_recent_leaves():
     """Debug endpoint to list recent leave requests"""
     try:
-        leaves = list(leaves_collection.find().sort("created_at", -1).limit(10))
+        leaves = await leaves_collection.find().sort("created_at", -1).limit(10).to_list()
         
         formatted_leaves = []
         for leave in leaves:
@@ -523,29 +638,35 @@ def list_recent_leaves():
         return {"error": f"Failed to list leaves: {str(e)}"}
 
 @router.post("/debug/reset-leave-action/{leave_id}")
-def reset_leave_action(leave_id: str):
+async def reset_leave_action(leave_id: str):
     """Reset a leave request back to pending status"""
     try:
-        leave = leaves_collection.find_one({"_id": ObjectId(leave_id)})
+        leave = await leaves_collection.find_one({"_id": ObjectId(leave_id)})
         if not leave:
             return {"error": "Leave request not found"}
         
-        # Reset the leave back to pending
-        update_result = leaves_collection.update_one(
-            {"_id": ObjectId(leave_id)},
-            {"$set": {
-                "status": "pending",
-                "is_action_taken": False
-            },
-            "$unset": {
-                "approver_id": "",
-                "action_timestamp": "",
-                "processed_via": "",
-                "comments": ""
-            }}
-        )
-        
-        if update_result.modified_count > 0:
+        # Reset the leave back to pending; the balance moves in the same
+        # transaction, so the ledger never disagrees with the status
+        async def reset_with_balance(session):
+            update_result = await leaves_collection.update_one(
+                {"_id": ObjectId(leave_id), "status": leave.get("status")},
+                stamp_update({"$set": {
+                    "status": "pending",
+                    "is_action_taken": False
+                },
+                "$unset": {
+                    "approver_id": "",
+                    "action_timestamp": "",
+                    "processed_via": "",
+                    "comments": ""
+                }}),
+                session=session
+            )
+            if update_result.modified_count > 0:
+                await apply_balance_updates([balance_update(leave, leave.get("status"), "pending")], session=session)
+            return update_result.modified_count > 0
+        
+        if await run_in_transaction(reset_with_balance):
             return {
                 "message": "Leave request reset to pending status",
                 "leave_id": leave_id,
@@ -558,7 +679,7 @@ def reset_leave_action(leave_id: str):
         return {"error": f"Failed to reset leave action: {str(e)}"}
 
 @router.post("/debug/create-test-leave")
-def create_test_leave(employee_email: str = None, manager_email: str = None):
+async def create_test_leave(employee_email: str = None, manager_email: str = None):
     """Create a test leave request to demonstrate AMP email approval - NO HARDCODED VALUES"""
     try:
         from datetime import datetime as dt, timedelta
@@ -566,23 +687,23 @@ def create_test_leave(employee_email: str = None, manager_email: str = None):
         # Dynamically get first available employee and manager if not specified
         if not employee_email:
             # Find any non-manager user as employee
-            user = users_collection.find_one({"is_manager": {"$ne": True}})
+            user = await users_collection.find_one({"is_manager": {"$ne": True}})
             if not user:
                 # If no non-managers found, use any user
-                user = users_collection.find_one({})
+                user = await users_collection.find_one({})
         else:
-            user = users_collection.find_one({"email": employee_email})
+            user = await users_collection.find_one({"email": employee_email})
         
         if not manager_email:
             # Find any manager user
-            manager = users_collection.find_one({"is_manager": True})
+            manager = await users_collection.find_one({"is_manager": True})
             if not manager:
                 # If no managers found, find any user with manager role
-                manager = users_collection.find_one({"role": "manager"})
+                manager = await users_collection.find_one({"role": "manager"})
                 if not manager:
                     return {"error": "No manager found in database. Please create a manager user first."}
         else:
-            manager = users_collection.find_one({"email": manager_email})
+            manager = await users_collection.find_one({"email": manager_email})
         
         if not user:
             return {"error": f"Employee user not found{' for email: ' + employee_email if employee_email else ''}"}
@@ -592,7 +713,8 @@ def create_test_leave(employee_email: str = None, manager_email: str = None):
         # Dynamically create test leave data
         tomorrow = dt.now() + timedelta(days=1)
         day_after = dt.now() + timedelta(days=3)
-        calculated_days = (day_after - tomorrow).days + 1
+        region = user_region(user)
+        calculated_days = work_calendars.count(tomorrow.date(), day_after.date(), region)
         
         test_leave = {
             "start_date": tomorrow.strftime("%Y-%m-%d"),
@@ -608,16 +730,19 @@ def create_test_leave(employee_email: str = None, manager_email: str = None):
             "employee_name": user.get("full_name", user.get("username", user.get("email", "Unknown Employee"))),
             "employee_email": user.get("email", ""),
             "employee_department": user.get("department", "Unknown Department"),
-            "days": calculated_days
+            "days": calculated_days,
+            "region": region,
+            COUNTED_FIELD: True
         }
+        test_leave["start"], test_leave["end"] = leave_interval(test_leave["start_date"], test_leave["end_date"])
         
-        result = leaves_collection.insert_one(test_leave)
+        result = await leaves_collection.insert_one(stamp_new(test_leave))
         test_leave["_id"] = result.inserted_id
+        await apply_balance_updates([balance_update(test_leave, None, "pending")])
         
         # Send AMP email
         try:
-            from app.utils.email import send_leave_action_email
-            send_leave_action_email(test_leave)
+            await send_leave_action_email(test_leave)
             email_sent = True
             email_error = None
         except Exception as e:
@@ -1,57 +1,206 @@
-from passlib.context import CryptContext
-from datetime import datetime, timedelta
-from jose import JWTError, jwt
-from fastapi import HTTPException, status, Depends
-from fastapi.security import OAuth2PasswordBearer
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
-
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password):
-    return pwd_context.hash(password)
-
-def create_access_token(data: dict, expires_delta: timedelta = None):
-    to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
-
-def verify_token(token: str = Depends(oauth2_scheme)):
-    print(f"🔐 DEBUG: Token verification started")
-    print(f"🔑 DEBUG: Token received: {token[:20]}..." if token else "❌ DEBUG: No token received")
-    
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        print(f"🔍 DEBUG: Decoding JWT token...")
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        print(f"👤 DEBUG: Extracted user_id from token: {user_id}")
-        
-        if user_id is None:
-            print(f"❌ DEBUG: No user_id found in token payload")
-            raise credentials_exception
-            
-        print(f"✅ DEBUG: Token verification successful for user: {user_id}")
-        return user_id
-    except JWTError as e:
-        print(f"❌ DEBUG: JWT Error during token verification: {str(e)}")
-        raise credentials_exception
-    except Exception as e:
-        print(f"❌ DEBUG: Unexpected error during token verification: {str(e)}")
-        raise credentials_exception
+from passlib.context import CryptContext
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from jose import JWTError, jwt
+from fastapi import HTTPException, status, Depends, Query
+from fastapi.security import OAuth2PasswordBearer
+from bson import ObjectId
+from app.utils.cache import TTLCache
+from app.utils.metrics import bcrypt_pending_hashes, bcrypt_rejected
+import asyncio
+import logging
+import os
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+SECRET_KEY = os.getenv("SECRET_KEY")
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24
+# EventSource can't send headers, so /leave/stream is opened with a ticket in
+# the URL. URLs end up in access and proxy logs, so a ticket is only good
+# for opening the stream, and only briefly.
+STREAM_TICKET_EXPIRE_SECONDS = int(os.getenv("STREAM_TICKET_EXPIRE_SECONDS", 60))
+STREAM_TICKET_SCOPE = "stream"
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
+
+def verify_password(plain_password, hashed_password):
+    return pwd_context.verify(plain_password, hashed_password)
+
+def get_password_hash(password):
+    return pwd_context.hash(password)
+
+# bcrypt releases the GIL while hashing, so a few threads use that many
+# cores without blocking the event loop. Requests beyond BCRYPT_MAX_PENDING
+# (running + queued) are refused with 503 instead of waiting behind a burst.
+BCRYPT_WORKERS = int(os.getenv("BCRYPT_WORKERS", os.cpu_count() or 2))
+BCRYPT_MAX_PENDING = int(os.getenv("BCRYPT_MAX_PENDING", BCRYPT_WORKERS * 8))
+
+_bcrypt_executor = ThreadPoolExecutor(max_workers=BCRYPT_WORKERS, thread_name_prefix="bcrypt")
+_bcrypt_pending = 0
+
+def bcrypt_pending() -> int:
+    return _bcrypt_pending
+
+async def _run_bcrypt(fn, *args):
+    global _bcrypt_pending
+    if _bcrypt_pending >= BCRYPT_MAX_PENDING:
+        bcrypt_rejected.inc()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please try again shortly",
+            headers={"Retry-After": "1"},
+        )
+    _bcrypt_pending += 1
+    bcrypt_pending_hashes.inc()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_bcrypt_executor, fn, *args)
+    finally:
+        _bcrypt_pending -= 1
+        bcrypt_pending_hashes.dec()
+
+async def averify_password(plain_password, hashed_password) -> bool:
+    return await _run_bcrypt(verify_password, plain_password, hashed_password)
+
+async def aget_password_hash(password) -> str:
+    return await _run_bcrypt(get_password_hash, password)
+
+def shutdown_bcrypt_pool():
+    _bcrypt_executor.shutdown(wait=False, cancel_futures=True)
+
+def create_access_token(data: dict, expires_delta: timedelta = None, user: dict = None):
+    """
+    Sign a JWT. When `user` is given, its id and token_version are embedded.
+    Role flags are deliberately left out: authorization reads the users
+    document through user_cache (see current_user), so a role change applies
+    within USER_CACHE_TTL_SECONDS and a bumped token_version at once.
+    """
+    to_encode = data.copy()
+    if user is not None:
+        to_encode.update(user_claims(user))
+    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
+    to_encode.update({"exp": expire})
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt
+
+def user_claims(user: dict) -> dict:
+    return {
+        "sub": str(user["_id"]),
+        # Bumped on password reset or role change; older tokens stop working
+        "ver": user.get("token_version", 0),
+    }
+
+def create_stream_ticket(user: dict) -> str:
+    """
+    A JWT that only opens /leave/stream: the user id and token_version,
+    valid for STREAM_TICKET_EXPIRE_SECONDS
+    """
+    return jwt.encode({
+        "sub": str(user["_id"]),
+        "ver": user.get("token_version", 0),
+        "scope": STREAM_TICKET_SCOPE,
+        "exp": datetime.utcnow() + timedelta(seconds=STREAM_TICKET_EXPIRE_SECONDS),
+    }, SECRET_KEY, algorithm=ALGORITHM)
+
+async def token_claims(token: str = Depends(oauth2_scheme)) -> dict:
+    return decode_claims(token)
+
+def decode_claims(token: str, scope: Optional[str] = None) -> dict:
+    """
+    Verify a JWT and return its claims. Access tokens carry no scope;
+    stream tickets are only accepted where scope=STREAM_TICKET_SCOPE is asked for.
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        user_id: str = payload.get("sub")
+        
+        if user_id is None:
+            logger.debug("Rejected token without a subject")
+            raise credentials_exception
+        
+        if payload.get("scope") != scope:
+            logger.debug("Rejected token with scope %s where %s was expected", payload.get("scope"), scope)
+            raise credentials_exception
+            
+        return payload
+    except JWTError as e:
+        logger.debug("Rejected token (%s)", e)
+        raise credentials_exception
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unexpected error verifying token")
+        raise credentials_exception
+
+# user_id -> user document (without hashed_password). Entries are keyed to
+# the user's token_version, so a JWT carrying a newer version forces a reload.
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 60))
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", 10000))
+user_cache = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+
+def invalidate_cached_user(user_id):
+    user_cache.invalidate(str(user_id))
+
+async def current_user(claims: dict = Depends(token_claims)) -> dict:
+    """
+    The authenticated user's document, resolved at most once per request
+
+    FastAPI caches the dependency within a request; across requests the
+    document comes from user_cache unless the token's version stamp is newer
+    than the cached one.
+    """
+    return await _resolve_user(claims)
+
+async def verify_token(user: dict = Depends(current_user)) -> str:
+    """
+    The caller's user id. Goes through current_user, so a token revoked by
+    a password reset or role change is refused here too.
+    """
+    return str(user["_id"])
+
+async def stream_user(ticket: str = Query(..., description="From POST /leave/stream-ticket; EventSource cannot send headers")) -> dict:
+    """
+    current_user for endpoints opened with EventSource, which passes a
+    stream ticket as ?ticket= instead of an Authorization header
+    """
+    return await _resolve_user(decode_claims(ticket, STREAM_TICKET_SCOPE))
+
+async def _resolve_user(claims: dict) -> dict:
+    from app.models.db import users_collection
+
+    user_id = claims["sub"]
+    token_version = claims.get("ver", 0)
+    user = user_cache.get(user_id)
+    if user is None or user.get("token_version", 0) < token_version:
+        user = await users_collection.find_one({"_id": ObjectId(user_id)}, {"hashed_password": 0})
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        user_cache.set(user_id, user)
+
+    if token_version < user.get("token_version", 0):
+        # Issued before a password reset or role change
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Session expired, please log in again",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+async def require_manager(user: dict = Depends(current_user)) -> dict:
+    """
+    The caller's user document, if it is a manager's; decided from the
+    (cached) document, not the token
+    """
+    if not user.get("is_manager"):
+        raise HTTPException(status_code=403, detail="Access denied. Manager role required.")
+    return user
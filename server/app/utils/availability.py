@@ -0,0 +1,112 @@
+import os
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Tuple
+from app.models.db import leaves_collection
+from app.utils.cache import TTLCache
+from app.utils.conflicts import ACTIVE_STATUSES, overlap_filter
+from app.utils.events import leave_events
+
+CALENDAR_CACHE_TTL_SECONDS = float(os.getenv("CALENDAR_CACHE_TTL_SECONDS", 300))
+CALENDAR_CACHE_MAX_SIZE = int(os.getenv("CALENDAR_CACHE_MAX_SIZE", 2000))
+CALENDAR_MAX_DAYS = 366
+
+# (department, "YYYY-MM") -> {"approved": [...], "pending": [...]}, one entry per day of the month
+calendar_cache = TTLCache(maxsize=CALENDAR_CACHE_MAX_SIZE, ttl=CALENDAR_CACHE_TTL_SECONDS)
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+def _next_month(day: date) -> date:
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+def _months(first: date, last: date) -> List[date]:
+    months = []
+    month = _month_start(first)
+    while month <= last:
+        months.append(month)
+        month = _next_month(month)
+    return months
+
+def _as_datetime(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+def _invalidate_for_event(event: dict):
+    department = event.get("employee_department")
+    try:
+        first = date.fromisoformat(event["start_date"])
+        last = date.fromisoformat(event["end_date"])
+    except (TypeError, ValueError):
+        # Not enough detail to narrow it down
+        if department is None:
+            calendar_cache.clear()
+        else:
+            calendar_cache.invalidate_where(lambda key: key[0] == department)
+        return
+    for month in _months(first, last):
+        calendar_cache.invalidate((department, month.strftime("%Y-%m")))
+
+leave_events.add_listener(_invalidate_for_event)
+
+def headcount_by_day(intervals: List[Tuple[date, date, str]], first: date, last: date) -> Dict[str, List[int]]:
+    """
+    People off on each day from first to last, by status
+
+    Sweep line: each interval adds +1 where it starts and -1 the day after
+    it ends, and a running sum over the days turns those endpoint deltas
+    into headcounts. O(intervals + days), however long the intervals are.
+    """
+    size = (last - first).days + 1
+    deltas = {status: [0] * (size + 1) for status in ACTIVE_STATUSES}
+    for start, end, status in intervals:
+        start, end = max(start, first), min(end, last)
+        if start > end or status not in deltas:
+            continue
+        deltas[status][(start - first).days] += 1
+        deltas[status][(end - first).days + 1] -= 1
+
+    counts = {}
+    for status, status_deltas in deltas.items():
+        running = 0
+        day_counts = []
+        for delta in status_deltas[:size]:
+            running += delta
+            day_counts.append(running)
+        counts[status] = day_counts
+    return counts
+
+async def team_calendar(department: str, first: date, last: date) -> dict:
+    """
+    Per-day headcount off for a department between first and last
+
+    Months already cached are reused; the rest come from one query on
+    department_interval_idx covering them, swept once and cached per month.
+
+    Returns:
+        {"department", "from", "to", "approved": [...], "pending": [...]}
+        where the lists hold one count per day starting at `from`
+    """
+    months = _months(first, last)
+    month_counts = {month: calendar_cache.get((department, month.strftime("%Y-%m"))) for month in months}
+    missing = [month for month in months if month_counts[month] is None]
+
+    if missing:
+        query_first = missing[0]
+        query_last = _next_month(missing[-1]) - timedelta(days=1)
+        query = {"employee_department": department, **overlap_filter(_as_datetime(query_first), _as_datetime(query_last))}
+        cursor = leaves_collection.find(query, {"_id": 0, "start": 1, "end": 1, "status": 1})
+        intervals = [(leave["start"].date(), leave["end"].date(), leave["status"]) for leave in await cursor.to_list()]
+
+        counts = headcount_by_day(intervals, query_first, query_last)
+        for month in missing:
+            offset = (month - query_first).days
+            size = (_next_month(month) - month).days
+            month_counts[month] = {status: values[offset:offset + size] for status, values in counts.items()}
+            calendar_cache.set((department, month.strftime("%Y-%m")), month_counts[month])
+
+    start_offset = (first - months[0]).days
+    size = (last - first).days + 1
+    result = {"department": department, "from": first.isoformat(), "to": last.isoformat()}
+    for status in ACTIVE_STATUSES:
+        values = [count for month in months for count in month_counts[month][status]]
+        result[status] = values[start_offset:start_offset + size]
+    return result
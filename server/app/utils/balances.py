@@ -0,0 +1,146 @@
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+from bson import ObjectId
+from pymongo import UpdateOne
+from app.models.db import balances_collection, db
+from app.utils.workdays import work_calendars
+
+def _parse_entitlements(value: str) -> Dict[str, int]:
+    entitlements = {}
+    for part in value.split(","):
+        if "=" in part:
+            leave_type, days = part.split("=", 1)
+            entitlements[leave_type.strip()] = int(days)
+    return entitlements
+
+# Days per year by leave type, e.g. "annual=25,sick=10". Types not listed
+# are tracked but not limited.
+LEAVE_ENTITLEMENTS = _parse_entitlements(os.getenv("LEAVE_ENTITLEMENTS", "annual=25"))
+
+# Set on a leave once its days are in the ledger: at submit, or by the
+# 0004_leave_balances migration for leave that predates the ledger. Only
+# counted leave moves a balance when its status or days change.
+COUNTED_FIELD = "balance_counted"
+# Submits are only checked against balances once this migration is done
+BALANCE_BACKFILL_MIGRATION = "0004_leave_balances"
+
+# Effect of a status change on (pending, used) days
+_STATUS_DAYS = {
+    "pending": (1, 0),
+    "approved": (0, 1),
+    "rejected": (0, 0),
+}
+
+def leave_days(leave: dict) -> int:
+    if leave.get("days") is not None:
+        return leave["days"]
+    start_date = datetime.fromisoformat(leave["start_date"])
+    end_date = datetime.fromisoformat(leave["end_date"])
+    return work_calendars.count(start_date.date(), end_date.date(), leave.get("region"))
+
+def balance_key(employee_id: ObjectId, leave: dict) -> dict:
+    # Leave spanning New Year counts against the year it starts in
+    return {"employee_id": employee_id, "year": int(leave["start_date"][:4]), "leave_type": leave["leave_type"]}
+
+def balance_update(leave: dict, old_status: Optional[str], new_status: str) -> Optional[UpdateOne]:
+    """
+    The $inc that moves a leave's days from old_status to new_status
+    (old_status None for a new request), or None if nothing changes or
+    the leave isn't counted yet
+    """
+    if not leave.get(COUNTED_FIELD):
+        return None
+    old_pending, old_used = _STATUS_DAYS.get(old_status, (0, 0))
+    new_pending, new_used = _STATUS_DAYS.get(new_status, (0, 0))
+    days = leave_days(leave)
+    inc = {}
+    if new_pending != old_pending:
+        inc["pending"] = (new_pending - old_pending) * days
+    if new_used != old_used:
+        inc["used"] = (new_used - old_used) * days
+    if not inc:
+        return None
+    return UpdateOne(
+        balance_key(leave["employee_id"], leave),
+        {"$inc": inc, "$setOnInsert": {"entitled": LEAVE_ENTITLEMENTS.get(leave["leave_type"])}},
+        upsert=True
+    )
+
+def balance_adjustment(leave: dict, old_days: int, new_days: int) -> Optional[UpdateOne]:
+    """
+    The $inc for a leave whose day count was recomputed in place, or None
+    if its status doesn't hold any days or it isn't counted yet
+    """
+    if not leave.get(COUNTED_FIELD):
+        return None
+    pending, used = _STATUS_DAYS.get(leave.get("status"), (0, 0))
+    inc = {}
+    if pending:
+        inc["pending"] = pending * (new_days - old_days)
+    if used:
+        inc["used"] = used * (new_days - old_days)
+    if not inc or new_days == old_days:
+        return None
+    return UpdateOne(
+        balance_key(leave["employee_id"], leave),
+        {"$inc": inc, "$setOnInsert": {"entitled": LEAVE_ENTITLEMENTS.get(leave["leave_type"])}},
+        upsert=True
+    )
+
+async def apply_balance_updates(updates: List[Optional[UpdateOne]], session=None):
+    updates = [update for update in updates if update is not None]
+    if updates:
+        await balances_collection.bulk_write(updates, ordered=False, session=session)
+
+_backfill_done = False
+
+async def balances_ready() -> bool:
+    """
+    Whether the ledger covers all leave, i.e. BALANCE_BACKFILL_MIGRATION
+    has finished; read until it has, then remembered
+    """
+    global _backfill_done
+    if not _backfill_done:
+        from app.migrations.runner import CHECKPOINT_COLLECTION
+
+        checkpoint = await db[CHECKPOINT_COLLECTION].find_one({"_id": BALANCE_BACKFILL_MIGRATION, "status": "done"}, {"_id": 1})
+        _backfill_done = checkpoint is not None
+    return _backfill_done
+
+def _with_available(balance: dict) -> dict:
+    entitled = balance.get("entitled")
+    balance["available"] = None if entitled is None else entitled - balance.get("used", 0) - balance.get("pending", 0)
+    return balance
+
+async def get_balance(employee_id: ObjectId, year: int, leave_type: str) -> dict:
+    """
+    One leave type's balance: a single indexed document read
+
+    Returns:
+        {"employee_id", "year", "leave_type", "entitled", "used", "pending",
+        "available"}; entitled and available are None when unlimited
+    """
+    key = {"employee_id": employee_id, "year": year, "leave_type": leave_type}
+    balance = await balances_collection.find_one(key, {"_id": 0})
+    if balance is None:
+        balance = {**key, "entitled": LEAVE_ENTITLEMENTS.get(leave_type), "used": 0, "pending": 0}
+    return _with_available(balance)
+
+async def get_balances(employee_id: ObjectId, year: int) -> List[dict]:
+    """
+    All of an employee's balances for a year, including entitled types
+    with nothing booked yet
+    """
+    balances = {
+        balance["leave_type"]: balance
+        for balance in await balances_collection.find(
+            {"employee_id": employee_id, "year": year}, {"_id": 0}
+        ).to_list()
+    }
+    for leave_type, entitled in LEAVE_ENTITLEMENTS.items():
+        balances.setdefault(leave_type, {
+            "employee_id": employee_id, "year": year, "leave_type": leave_type,
+            "entitled": entitled, "used": 0, "pending": 0,
+        })
+    return [_with_available(balance) for balance in sorted(balances.values(), key=lambda b: b["leave_type"])]
@@ -0,0 +1,59 @@
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from bson import ObjectId
+from app.utils.pagination import Page, PageParams, decode_cursor, encode_cursor, paginate
+
+# Writes stamp updated_at with the app server's clock before they commit, so
+# a poll could otherwise read past a write that commits a moment later.
+# Changes younger than this are held back until the next poll; it also has
+# to cover clock skew between app servers.
+CHANGES_SETTLE_SECONDS = float(os.getenv("CHANGES_SETTLE_SECONDS", 2))
+
+def stamp_new(doc: dict, now: Optional[datetime] = None) -> dict:
+    """
+    Add the change stamp to a document about to be inserted
+    """
+    doc["updated_at"] = now or datetime.now(timezone.utc)
+    doc["version"] = 1
+    return doc
+
+def stamp_update(update: dict, now: Optional[datetime] = None) -> dict:
+    """
+    Add the change stamp to an update document: updated_at for the
+    /leave/changes cursor and a per-document version that every write bumps
+    """
+    update.setdefault("$set", {})["updated_at"] = now or datetime.now(timezone.utc)
+    update.setdefault("$inc", {})["version"] = 1
+    return update
+
+async def changes_since(collection, base_filter: dict, page: PageParams, projection: Optional[dict] = None) -> Page:
+    """
+    Documents matching base_filter changed after the page.after cursor
+
+    A range scan on an index ending in (updated_at, _id), oldest change
+    first. Without a cursor nothing is returned and the cursor starts at
+    the present, for clients that just loaded the full list.
+
+    Returns:
+        Page whose next_cursor is always set: where the next poll starts.
+        Changes inside the settle window are left for that poll, so a
+        document may be returned again; clients merge by _id.
+    """
+    horizon = datetime.now(timezone.utc) - timedelta(seconds=CHANGES_SETTLE_SECONDS)
+    if not page.after:
+        return Page([], encode_cursor(horizon, ObjectId("0" * 24)))
+
+    query = dict(base_filter)
+    query["updated_at"] = {"$lte": horizon}
+    result = await paginate(collection, query, "updated_at", page, projection, descending=False)
+
+    if result.next_cursor is None:
+        if result.items:
+            last = result.items[-1]
+            result.next_cursor = encode_cursor(last["updated_at"], last["_id"])
+        else:
+            # Validates the cursor as well as passing it back
+            decode_cursor(page.after)
+            result.next_cursor = page.after
+    return result
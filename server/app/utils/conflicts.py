@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from bson import ObjectId
+from app.models.db import leaves_collection
+
+# Requests that still claim their dates
+ACTIVE_STATUSES = ["pending", "approved"]
+
+_INTERVAL_FIELDS = {
+    "_id": 1, "employee_id": 1, "employee_name": 1, "start_date": 1, "end_date": 1,
+    "leave_type": 1, "status": 1,
+}
+
+def parse_leave_date(value: str) -> datetime:
+    # "YYYY-MM-DD" -> midnight UTC, stored as a BSON date
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+def leave_interval(start_date: str, end_date: str) -> Tuple[datetime, datetime]:
+    """
+    Native (start, end) dates for a request, both days inclusive
+    """
+    return parse_leave_date(start_date), parse_leave_date(end_date)
+
+def overlap_filter(start: datetime, end: datetime) -> dict:
+    # Inclusive ranges overlap unless one ends before the other starts
+    return {"status": {"$in": ACTIVE_STATUSES}, "start": {"$lte": end}, "end": {"$gte": start}}
+
+async def find_overlap(employee_id: ObjectId, start: datetime, end: datetime) -> Optional[dict]:
+    """
+    An active request of this employee overlapping [start, end], if any;
+    one probe on employee_interval_idx
+    """
+    query = {"employee_id": employee_id, **overlap_filter(start, end)}
+    return await leaves_collection.find_one(query, _INTERVAL_FIELDS)
+
+async def find_team_conflicts(
+    start: datetime,
+    end: datetime,
+    employee_ids: Optional[List[ObjectId]] = None,
+    department: Optional[str] = None,
+) -> List[dict]:
+    """
+    Active requests overlapping [start, end] for a set of employees or a
+    whole department, in one indexed query
+
+    Returns:
+        One entry per affected employee: {"employee_id", "employee_name",
+        "leaves": [{"leave_id", "start_date", "end_date", "leave_type", "status"}]}
+    """
+    query = overlap_filter(start, end)
+    if employee_ids is not None:
+        query["employee_id"] = {"$in": employee_ids}
+    if department is not None:
+        query["employee_department"] = department
+
+    by_employee = {}
+    cursor = leaves_collection.find(query, _INTERVAL_FIELDS).sort("start", 1)
+    for leave in await cursor.to_list():
+        entry = by_employee.setdefault(leave["employee_id"], {
+            "employee_id": str(leave["employee_id"]),
+            "employee_name": leave.get("employee_name"),
+            "leaves": [],
+        })
+        entry["leaves"].append({
+            "leave_id": str(leave["_id"]),
+            "start_date": leave["start_date"],
+            "end_date": leave["end_date"],
+            "leave_type": leave.get("leave_type"),
+            "status": leave["status"],
+        })
+    return list(by_employee.values())
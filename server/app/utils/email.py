@@ -1,12 +1,17 @@
+import logging
 import os
 from email.message import EmailMessage
-import smtplib
-from jinja2 import Environment, FileSystemLoader
+from typing import Optional
+from fastapi.concurrency import run_in_threadpool
 from dotenv import load_dotenv
 from app.utils.tokens import generate_approval_token
+from app.utils.smtp import get_smtp_pool
+from app.utils.email_templates import render_leave_action_emails, render_leave_digest_email
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 EMAIL_HOST = os.getenv("EMAIL_HOST")
 EMAIL_PORT = int(os.getenv("EMAIL_PORT", 587))
 EMAIL_USER = os.getenv("EMAIL_USER")
@@ -16,114 +21,119 @@ EMAIL_PASS = os.getenv("EMAIL_PASS")
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
 
-env = Environment(loader=FileSystemLoader("app/utils/templates"))
-
-def send_leave_action_email(leave_dict):
-    try:
-        # Check if email configuration is available
-        if not all([EMAIL_HOST, EMAIL_USER, EMAIL_PASS]):
-            print("Email configuration not available, skipping email notification")
+def email_configured() -> bool:
+    return all([EMAIL_HOST, EMAIL_USER, EMAIL_PASS])
+
+async def send_leave_action_email(leave_dict):
+    """
+    Render and send the AMP + HTML approval email for a leave request.
+
+    Raises on delivery failure so the outbox can retry; callers that send
+    inline must handle errors themselves.
+    """
+    # Check if email configuration is available
+    if not email_configured():
+        logger.warning("Email configuration not available, skipping email notification")
+        return
+
+    # Validate URL configuration
+    if not BACKEND_URL or not FRONTEND_URL:
+        logger.warning("URL configuration missing, using default localhost URLs")
+        backend_url = "http://localhost:8000"
+        frontend_url = "http://localhost:5173"
+    else:
+        backend_url = BACKEND_URL
+        frontend_url = FRONTEND_URL
+
+    # For production, get fresh leave data to show current status in email
+    from app.models.db import leaves_collection
+    from bson import ObjectId
+
+    # Get the latest leave data if _id exists
+    if '_id' in leave_dict:
+        fresh_leave = await leaves_collection.find_one({"_id": ObjectId(leave_dict['_id'])})
+        if fresh_leave and fresh_leave.get("is_action_taken"):
+            # Decided (e.g. from the dashboard) before the email went out
+            logger.info("Leave request %s already %s, skipping approval email", fresh_leave["_id"], fresh_leave.get("status"))
             return
-        
-        # Validate URL configuration
-        if not BACKEND_URL or not FRONTEND_URL:
-            print("URL configuration missing, using default localhost URLs")
-            backend_url = "http://localhost:8000"
-            frontend_url = "http://localhost:5173"
-        else:
-            backend_url = BACKEND_URL
-            frontend_url = FRONTEND_URL
-        
-        print(f"Email will use URLs - Backend: {backend_url}, Frontend: {frontend_url}")
-        
-        # For production, get fresh leave data to show current status in email
-        from app.models.db import leaves_collection
-        from bson import ObjectId
-        
-        # Get the latest leave data if _id exists
-        if '_id' in leave_dict:
-            fresh_leave = leaves_collection.find_one({"_id": ObjectId(leave_dict['_id'])})
-            if fresh_leave:
-                # Update leave_dict with fresh data
-                leave_dict.update(fresh_leave)
-                leave_dict['_id'] = str(fresh_leave['_id'])
-                leave_dict['manager_id'] = str(fresh_leave['manager_id'])
-                leave_dict['employee_id'] = str(fresh_leave['employee_id'])
-        
-        # Generate one-time tokens for approval and rejection
-        leave_id = str(leave_dict['_id'])
-        manager_id = str(leave_dict['manager_id'])
-        
-        # Generate tokens (24 hours validity)
-        approval_token = generate_approval_token(leave_id, manager_id, "approve", 24)
-        rejection_token = generate_approval_token(leave_id, manager_id, "reject", 24)
-        
-        # Add tokens to leave_dict for template
-        leave_dict['approval_token'] = approval_token
-        leave_dict['rejection_token'] = rejection_token
-        
-        # Add URLs for template
-        leave_dict['backend_url'] = backend_url
-        leave_dict['frontend_url'] = frontend_url
-        
-        print(f"🔧 DEBUG - Email Template URLs:")
-        print(f"   Backend URL: {backend_url}")
-        print(f"   Frontend URL: {frontend_url}")
-        print(f"   Approval Token: {approval_token[:8]}...")
-        print(f"   Rejection Token: {rejection_token[:8]}...")
-        
-        # Render AMP email with embedded form
-        amp_template = env.get_template("leave_action.amp.html")
-        amp_content = amp_template.render(leave=leave_dict)
-        
-        # Render HTML fallback email for non-AMP clients (like Outlook)
-        html_template = env.get_template("leave_action_fallback.html")
-        html_content = html_template.render(leave=leave_dict)
-        
-        msg = EmailMessage()
-        msg["Subject"] = f"Leave Request {leave_dict.get('status', 'Approval').title()} - {leave_dict.get('employee_name', 'Employee')}"
-        msg["From"] = EMAIL_USER
-        msg["To"] = leave_dict["manager_email"]
-        
-        # Set HTML as primary content for better compatibility
-        msg.set_content("Please enable HTML to view this email properly.")
-        msg.add_alternative(html_content, subtype="html")
-        msg.add_alternative(amp_content, subtype="x-amp-html")
-        
-        with smtplib.SMTP(EMAIL_HOST, EMAIL_PORT) as server:
-            server.starttls()
-            server.login(EMAIL_USER, EMAIL_PASS)
-            server.send_message(msg)
-        
-        status_text = leave_dict.get('status', 'pending')
-        print(f"Multi-format email notification sent successfully for {status_text} leave request from {leave_dict.get('employee_name', 'Employee')}")
-        print(f"Email formats: HTML (fallback) + AMP (interactive) sent to {leave_dict['manager_email']}")
-        print(f"Generated tokens - Approval: {approval_token[:8]}..., Rejection: {rejection_token[:8]}...")
-        
-    except Exception as e:
-        # Log the error but don't fail the leave submission
-        print(f"Failed to send email notification: {str(e)}")
-        print("Leave request was still processed successfully")
+        if fresh_leave:
+            # Update leave_dict with fresh data
+            leave_dict.update(fresh_leave)
+            leave_dict['_id'] = str(fresh_leave['_id'])
+            leave_dict['manager_id'] = str(fresh_leave['manager_id'])
+            leave_dict['employee_id'] = str(fresh_leave['employee_id'])
+
+    # Generate one-time tokens for approval and rejection
+    leave_id = str(leave_dict['_id'])
+    manager_id = str(leave_dict['manager_id'])
+
+    # Generate tokens (24 hours validity)
+    approval_token = generate_approval_token(leave_id, manager_id, "approve", 24)
+    rejection_token = generate_approval_token(leave_id, manager_id, "reject", 24)
+
+    # Add tokens to leave_dict for template
+    leave_dict['approval_token'] = approval_token
+    leave_dict['rejection_token'] = rejection_token
+
+    # HTML fallback (Outlook and other non-AMP clients) + AMP with the embedded form
+    email = render_leave_action_emails([leave_dict], EMAIL_USER, backend_url, frontend_url)[0]
+
+    # smtplib is blocking; keep it off the event loop
+    await run_in_threadpool(get_smtp_pool().sendmail, email.from_addr, email.to_addrs, email.data)
+
+    logger.info("Approval email for leave request %s sent to manager %s", leave_id, manager_id)
+
+async def send_leave_digest_email(manager_id: str, leave_ids: list):
+    """
+    Send one email covering a manager's requests collected by the digest
+    window, with an approval token per request.
+
+    Requests decided in the meantime are left out; a single remaining
+    request gets the regular approval email.
+    """
+    if not email_configured():
+        logger.warning("Email configuration not available, skipping digest email")
+        return
+
+    from app.models.db import leaves_collection
+    from bson import ObjectId
+
+    leaves = await leaves_collection.find({
+        "_id": {"$in": [ObjectId(leave_id) for leave_id in leave_ids]},
+        "status": "pending",
+        "is_action_taken": False,
+    }).sort("created_at", 1).to_list()
+    if not leaves:
+        logger.info("All %d request(s) in the digest for manager %s were already processed, skipping", len(leave_ids), manager_id)
+        return
+    if len(leaves) == 1:
+        await send_leave_action_email(leaves[0])
+        return
+
+    for leave in leaves:
+        leave["_id"] = str(leave["_id"])
+        leave["manager_id"] = str(leave["manager_id"])
+        leave["employee_id"] = str(leave["employee_id"])
+        leave["approval_token"] = generate_approval_token(leave["_id"], leave["manager_id"], "approve", 24)
+        leave["rejection_token"] = generate_approval_token(leave["_id"], leave["manager_id"], "reject", 24)
+
+    email = render_leave_digest_email(leaves[0]["manager_email"], leaves, EMAIL_USER, BACKEND_URL, FRONTEND_URL)
+    await run_in_threadpool(get_smtp_pool().sendmail, email.from_addr, email.to_addrs, email.data)
+    logger.info("Digest email with %d leave request(s) sent to manager %s", len(leaves), manager_id)
 
 def notify_employee(leave, action):
     # Notify employee of status change
     pass  # Implement as needed
 
-def send_password_reset_otp(recipient_email: str, otp: str):
+def send_password_reset_otp(recipient_email: str, otp: str, user_id: Optional[str] = None):
     try:
-        print(f"📧 DEBUG: send_password_reset_otp called with recipient_email='{recipient_email}', otp='{otp}'")
-        
         if not all([EMAIL_HOST, EMAIL_USER, EMAIL_PASS]):
             missing_vars = []
             if not EMAIL_HOST: missing_vars.append("EMAIL_HOST")
             if not EMAIL_USER: missing_vars.append("EMAIL_USER") 
             if not EMAIL_PASS: missing_vars.append("EMAIL_PASS")
             
-            error_msg = f"Email configuration not available. Missing: {', '.join(missing_vars)}"
-            print(error_msg)
-            raise Exception(error_msg)
-
-        print(f"📧 DEBUG: Email config - HOST: {EMAIL_HOST}, USER: {EMAIL_USER}, PASS: {'SET' if EMAIL_PASS else 'NOT SET'}")
+            raise Exception(f"Email configuration not available. Missing: {', '.join(missing_vars)}")
 
         subject = "Your Password Reset OTP - Leave Management System"
         html_content = f"""
@@ -185,16 +195,9 @@ This is an automated message. Please do not reply to this email.
         msg.set_content(text_content.strip())
         msg.add_alternative(html_content, subtype="html")
 
-        print(f"📧 DEBUG: Email message created - From: {EMAIL_USER}, To: {recipient_email}, Subject: {subject}")
-
-        with smtplib.SMTP(EMAIL_HOST, EMAIL_PORT) as server:
-            server.starttls()
-            server.login(EMAIL_USER, EMAIL_PASS)
-            print(f"📧 DEBUG: SMTP login successful, sending message...")
-            server.send_message(msg)
-            print(f"📧 DEBUG: Message sent successfully via SMTP")
-
-        print(f"✅ Password reset OTP sent to {recipient_email}")
+        get_smtp_pool().send_message(msg)
+        logger.info("Password reset OTP sent to user %s", user_id)
     except Exception as e:
-        print(f"❌ Failed to send password reset OTP: {str(e)}")
+        # Never log the OTP itself
+        logger.error("Failed to send password reset OTP to user %s: %s", user_id, e)
         raise e
\ No newline at end of file
@@ -0,0 +1,163 @@
+import binascii
+import os
+import uuid
+from dataclasses import dataclass
+from email.header import Header
+from email.utils import formatdate, make_msgid
+from pathlib import Path
+from typing import Dict, List, Optional
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+# Compiled template bytecode, shared by workers and kept across restarts;
+# unset uses a per-user directory under the system temp dir
+EMAIL_TEMPLATE_CACHE_DIR = os.getenv("EMAIL_TEMPLATE_CACHE_DIR")
+
+LEAVE_ACTION_TEMPLATES = {"html": "leave_action_fallback.html", "x-amp-html": "leave_action.amp.html"}
+LEAVE_DIGEST_TEMPLATES = {"html": "leave_digest_fallback.html", "x-amp-html": "leave_digest.amp.html"}
+PLAIN_TEXT_NOTICE = "Please enable HTML to view this email properly."
+
+# Templates ship with the code, so nothing is re-read or stat'ed after the
+# first load (auto_reload off)
+env = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    bytecode_cache=FileSystemBytecodeCache(EMAIL_TEMPLATE_CACHE_DIR) if EMAIL_TEMPLATE_CACHE_DIR else FileSystemBytecodeCache(),
+    auto_reload=False,
+)
+
+_templates: Dict[str, Template] = {}
+
+def load_email_templates():
+    """
+    Compile every email template once (from the bytecode cache when
+    warm). Called at startup; later lookups are a dict read.
+    """
+    for name in [*LEAVE_ACTION_TEMPLATES.values(), *LEAVE_DIGEST_TEMPLATES.values()]:
+        if name not in _templates:
+            _templates[name] = env.get_template(name)
+
+def get_email_template(name: str) -> Template:
+    template = _templates.get(name)
+    if template is None:
+        load_email_templates()
+        template = _templates.get(name) or env.get_template(name)
+    return template
+
+@dataclass
+class RenderedEmail:
+    from_addr: str
+    to_addrs: List[str]
+    subject: str
+    # Complete RFC 5322 message with CRLF line endings, ready for sendmail
+    data: bytes
+
+def _header_value(value: str) -> str:
+    value = " ".join(str(value).split())  # no CR/LF smuggled into headers
+    return value if value.isascii() else Header(value, "utf-8").encode()
+
+def _quoted_printable(text: str) -> bytes:
+    # binascii's codec runs in C; the email package's content manager spends
+    # most of a send on the same job
+    encoded = binascii.b2a_qp(text.replace("\r\n", "\n").encode("utf-8"), istext=True)
+    return encoded.replace(b"\n", b"\r\n")
+
+class AlternativeSkeleton:
+    """
+    multipart/alternative message with the parts that never change encoded
+    once: boundary lines, part headers and the plain-text notice. fill()
+    only writes the per-message headers and encodes the HTML bodies.
+
+    The boundary starts with "=_", which quoted-printable output can't
+    contain, so it is safe to reuse for every message.
+    """
+    def __init__(self, subtypes: List[str], plain_text: str = PLAIN_TEXT_NOTICE):
+        self.boundary = f"=_leave_{uuid.uuid4().hex}"
+        delimiter = f"\r\n--{self.boundary}\r\n".encode("ascii")
+        self.content_type = f'Content-Type: multipart/alternative; boundary="{self.boundary}"\r\n'.encode("ascii")
+        self.plain_part = (
+            delimiter
+            + b'Content-Type: text/plain; charset="utf-8"\r\nContent-Transfer-Encoding: 7bit\r\n\r\n'
+            + plain_text.encode("ascii")
+        )
+        self.part_headers = [
+            delimiter
+            + f'Content-Type: text/{subtype}; charset="utf-8"\r\nContent-Transfer-Encoding: quoted-printable\r\n\r\n'.encode("ascii")
+            for subtype in subtypes
+        ]
+        self.closing = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+        self.msgid_domain = make_msgid().rsplit("@", 1)[1].rstrip(">")
+
+    def fill(self, from_addr: str, to_addr: str, subject: str, bodies: List[str]) -> bytes:
+        headers = (
+            f"Subject: {_header_value(subject)}\r\n"
+            f"From: {_header_value(from_addr)}\r\n"
+            f"To: {_header_value(to_addr)}\r\n"
+            f"Date: {formatdate(usegmt=True)}\r\n"
+            f"Message-ID: {make_msgid(domain=self.msgid_domain)}\r\n"
+            "MIME-Version: 1.0\r\n"
+        ).encode("ascii")
+        parts = [headers, self.content_type, self.plain_part]
+        for part_header, body in zip(self.part_headers, bodies):
+            parts.append(part_header)
+            parts.append(_quoted_printable(body))
+        parts.append(self.closing)
+        return b"".join(parts)
+
+# Both emails are HTML + AMP alternatives, so they share one skeleton
+_html_amp_skeleton: Optional[AlternativeSkeleton] = None
+
+def _skeleton() -> AlternativeSkeleton:
+    global _html_amp_skeleton
+    if _html_amp_skeleton is None:
+        _html_amp_skeleton = AlternativeSkeleton(list(LEAVE_ACTION_TEMPLATES))
+    return _html_amp_skeleton
+
+def leave_action_subject(leave: dict) -> str:
+    return f"Leave Request {leave.get('status', 'Approval').title()} - {leave.get('employee_name', 'Employee')}"
+
+def render_leave_action_emails(leaves: List[dict], from_addr: str, backend_url: str, frontend_url: str) -> List[RenderedEmail]:
+    """
+    Render the approval email (HTML fallback + AMP) for many leave requests
+    in one call, reusing the compiled templates and the MIME skeleton
+
+    Args:
+        leaves: leave documents with string ids and approval_token /
+            rejection_token already set; manager_email is the recipient
+
+    Returns:
+        One RenderedEmail per leave, in order
+    """
+    skeleton = _skeleton()
+    templates = [get_email_template(name) for name in LEAVE_ACTION_TEMPLATES.values()]
+
+    rendered = []
+    for leave in leaves:
+        context = dict(leave, backend_url=backend_url, frontend_url=frontend_url)
+        subject = leave_action_subject(leave)
+        bodies = [template.render(leave=context) for template in templates]
+        to_addr = leave["manager_email"]
+        rendered.append(RenderedEmail(
+            from_addr=from_addr,
+            to_addrs=[to_addr],
+            subject=subject,
+            data=skeleton.fill(from_addr, to_addr, subject, bodies),
+        ))
+    return rendered
+
+def render_leave_digest_email(to_addr: str, leaves: List[dict], from_addr: str, backend_url: str, frontend_url: str) -> RenderedEmail:
+    """
+    One email listing several pending requests for the same manager, each
+    with its own AMP approval form
+
+    Args:
+        leaves: as for render_leave_action_emails, oldest first
+    """
+    subject = f"{len(leaves)} Leave Requests Awaiting Approval"
+    context = {"leaves": leaves, "backend_url": backend_url, "frontend_url": frontend_url}
+    bodies = [get_email_template(name).render(**context) for name in LEAVE_DIGEST_TEMPLATES.values()]
+    return RenderedEmail(
+        from_addr=from_addr,
+        to_addrs=[to_addr],
+        subject=subject,
+        data=_skeleton().fill(from_addr, to_addr, subject, bodies),
+    )
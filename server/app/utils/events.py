@@ -0,0 +1,192 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Callable, Dict, List, Optional, Set
+from pymongo.errors import OperationFailure, PyMongoError
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# "auto" follows leave_requests through a change stream when the server
+# supports it (replica set / Atlas); "off" only fans out events published
+# by this process
+LEAVE_CHANGE_STREAM = os.getenv("LEAVE_CHANGE_STREAM", "auto").lower()
+# Events buffered per open stream before it is told to resync instead
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", 100))
+EVENT_HEARTBEAT_SECONDS = float(os.getenv("EVENT_HEARTBEAT_SECONDS", 15))
+
+EVENT_LEAVE = "leave"
+# Sent when events may have been missed; clients re-fetch their lists
+EVENT_RESYNC = "resync"
+
+# Change stream codes meaning "not supported here", as opposed to transient
+_UNSUPPORTED_CODES = {40573, 40324}
+
+_CHANGE_PIPELINE = [
+    {"$match": {"$or": [
+        {"operationType": "insert"},
+        {"operationType": "replace"},
+        {"updateDescription.updatedFields.status": {"$exists": True}},
+    ]}},
+    {"$project": {
+        "operationType": 1,
+        "fullDocument._id": 1,
+        "fullDocument.employee_id": 1,
+        "fullDocument.manager_id": 1,
+        "fullDocument.status": 1,
+        "fullDocument.employee_department": 1,
+        "fullDocument.start_date": 1,
+        "fullDocument.end_date": 1,
+    }},
+]
+
+def leave_event(leave: dict, kind: str) -> dict:
+    """
+    Event payload for a leave document (needs _id, employee_id, manager_id,
+    status; department and dates when available)
+    """
+    return {
+        "type": kind,
+        "leave_id": str(leave["_id"]),
+        "status": leave.get("status"),
+        "employee_id": str(leave.get("employee_id")),
+        "manager_id": str(leave.get("manager_id")),
+        "employee_department": leave.get("employee_department"),
+        "start_date": leave.get("start_date"),
+        "end_date": leave.get("end_date"),
+    }
+
+def format_sse(event: str, data: Optional[dict] = None) -> str:
+    return f"event: {event}\ndata: {json.dumps(data or {})}\n\n"
+
+class _Subscriber:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+
+    def push(self, message: str):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Slow reader: drop the backlog and ask it to re-fetch
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(format_sse(EVENT_RESYNC))
+
+class LeaveEventBroker:
+    """
+    Fans leave status changes out to the open /leave/stream connections of
+    this worker.
+
+    Each gunicorn worker follows leave_requests through its own change
+    stream, so a write made by any worker (or the email approval flow)
+    reaches every subscriber. Without change streams (standalone mongod)
+    routes publish their own writes, which only reach subscribers connected
+    to the same worker.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[_Subscriber]] = {}
+        self._listeners: List[Callable[[dict], None]] = []
+        self._task: Optional[asyncio.Task] = None
+        self.change_stream_active = False
+
+    def subscribe(self, user_id: str) -> _Subscriber:
+        subscriber = _Subscriber(user_id)
+        self._subscribers.setdefault(user_id, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: _Subscriber):
+        subscribers = self._subscribers.get(subscriber.user_id)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[subscriber.user_id]
+
+    def add_listener(self, callback: Callable[[dict], None]):
+        """
+        Call `callback(event)` for every leave change this worker sees,
+        e.g. to drop cached data derived from the affected users' leaves
+        """
+        self._listeners.append(callback)
+
+    def dispatch(self, event: dict):
+        for callback in self._listeners:
+            callback(event)
+        message = format_sse(EVENT_LEAVE, event)
+        for user_id in {event["employee_id"], event["manager_id"]}:
+            for subscriber in self._subscribers.get(user_id, ()):
+                subscriber.push(message)
+
+    def publish(self, event: dict):
+        """
+        Called by routes after a write. Skipped while the change stream is
+        running, since it will deliver the same change.
+        """
+        if not self.change_stream_active:
+            self.dispatch(event)
+
+    def _resync_all(self):
+        message = format_sse(EVENT_RESYNC)
+        for subscribers in self._subscribers.values():
+            for subscriber in subscribers:
+                subscriber.push(message)
+
+    def start(self):
+        if self._task is None and LEAVE_CHANGE_STREAM != "off":
+            self._task = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.change_stream_active = False
+
+    async def _watch(self):
+        from app.models.db import leaves_collection
+
+        resume_token = None
+        delay = 1
+        while True:
+            try:
+                async with await leaves_collection.watch(
+                    _CHANGE_PIPELINE, full_document="updateLookup", resume_after=resume_token
+                ) as stream:
+                    if not self.change_stream_active:
+                        self.change_stream_active = True
+                        # Anything published locally before now may be incomplete
+                        self._resync_all()
+                    delay = 1
+                    async for change in stream:
+                        resume_token = stream.resume_token
+                        leave = change.get("fullDocument")
+                        if leave:
+                            kind = "submitted" if change["operationType"] == "insert" else leave.get("status")
+                            self.dispatch(leave_event(leave, kind))
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                self.change_stream_active = False
+                if e.code in _UNSUPPORTED_CODES:
+                    logger.info("Change streams not supported by this MongoDB deployment, leave events are local to each worker")
+                    return
+                logger.error("Leave change stream error: %s", e)
+                # The resume token may have fallen off the oplog
+                resume_token = None
+            except PyMongoError as e:
+                self.change_stream_active = False
+                logger.error("Leave change stream error: %s", e)
+            # Delivery was interrupted; subscribers re-fetch once it is back
+            self._resync_all()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30)
+
+leave_events = LeaveEventBroker()
@@ -0,0 +1,120 @@
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+
+# Root level, and per-logger overrides such as
+# "app.routes.leave=DEBUG,app.utils.email=WARNING,pymongo=WARNING"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+# "text" for people, "json" (one object per line) for log collectors
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+# Records waiting for the writer thread; beyond this they are dropped rather
+# than blocking a request
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10000))
+
+# Last line of defence for values that should never have been logged:
+# password=..., "token": "...", Authorization: Bearer ...
+_SECRET_PATTERN = re.compile(
+    r"""(?i)(\b(?:password|passwd|secret|otp|token|api[_-]?key|authorization)\b["']?\s*[:=]\s*["']?)(?:bearer\s+)?[^\s"',;}&]+"""
+)
+_BEARER_PATTERN = re.compile(r"(?i)\bbearer\s+[\w.~+/-]+=*")
+
+def redact(text: str) -> str:
+    return _BEARER_PATTERN.sub("Bearer [REDACTED]", _SECRET_PATTERN.sub(r"\1[REDACTED]", text))
+
+# Attributes every LogRecord has; anything else came in through extra={...}
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        return redact(super().format(record))
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _RECORD_FIELDS})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return redact(json.dumps(entry, default=str))
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue without formatting. The stock prepare() renders the whole line
+    (and any traceback) on the calling thread; here only the message
+    arguments are merged, since the objects behind them may change once
+    the request carries on. Formatting and the write happen on the
+    listener thread.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass  # a stalled stdout must not stall requests
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def _parse_levels(value: str) -> dict:
+    levels = {}
+    for part in value.split(","):
+        if "=" in part:
+            name, level = part.split("=", 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+def configure_logging(stream=None):
+    """
+    Route all logging through a queue to one writer thread. Call once per
+    process before serving; later calls do nothing.
+
+    Application code logs with logging.getLogger(__name__) and %-style
+    arguments (logger.debug("Leave %s", leave_id)), so a disabled level
+    costs a level check and no formatting.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else TextFormatter())
+    _listener = logging.handlers.QueueListener(queue.Queue(LOG_QUEUE_SIZE), output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_QueueHandler(_listener.queue))
+    root.setLevel(LOG_LEVEL)
+    for name, level in _parse_levels(LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+
+def shutdown_logging():
+    """
+    Write out whatever is still queued and stop the writer thread
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,210 @@
+import json
+import logging
+import os
+import re
+import time
+from typing import Tuple
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import multiprocess
+from pymongo import monitoring
+
+logger = logging.getLogger(__name__)
+
+# Set (by gunicorn.conf.py) when several worker processes share one set of
+# metrics: each worker writes to files in this directory and /metrics in any
+# worker reports the sum
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+# When set, /metrics requires "Authorization: Bearer <METRICS_TOKEN>"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+# MongoDB commands slower than this are logged and counted
+MONGO_SLOW_QUERY_MS = float(os.getenv("MONGO_SLOW_QUERY_MS", 100))
+
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+
+# Long-lived responses (server-sent events) would swamp the latency buckets;
+# they still show in the in-flight gauge
+UNTIMED_ROUTES = {"/leave/stream"}
+UNMATCHED_ROUTE = "unmatched"
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "Time to complete a request, by route template",
+    ["method", "route", "status"], buckets=REQUEST_BUCKETS,
+)
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress", "Requests being handled (the route is only known once routing is done)",
+    ["method"], multiprocess_mode="livesum",
+)
+mongo_command_duration = Histogram(
+    "mongodb_command_duration_seconds", "MongoDB command round trip, by collection and command",
+    ["collection", "command"], buckets=FAST_BUCKETS,
+)
+mongo_command_failures = Counter(
+    "mongodb_command_failures_total", "MongoDB commands that returned an error",
+    ["collection", "command"],
+)
+mongo_slow_commands = Counter(
+    "mongodb_slow_commands_total", f"MongoDB commands slower than MONGO_SLOW_QUERY_MS ({MONGO_SLOW_QUERY_MS:g} ms)",
+    ["collection", "command"],
+)
+mongo_pool_checkout_wait = Histogram(
+    "mongodb_pool_checkout_seconds", "Time to check a connection out of the MongoDB pool",
+    buckets=FAST_BUCKETS,
+)
+mongo_pool_checkout_failures = Counter(
+    "mongodb_pool_checkout_failures_total", "MongoDB connection checkouts that failed",
+    ["reason"],
+)
+smtp_send_duration = Histogram(
+    "smtp_send_duration_seconds", "Time to hand one message to the SMTP server, including connection checkout and retry",
+    ["outcome"], buckets=REQUEST_BUCKETS,
+)
+smtp_rate_limit_wait = Histogram(
+    "smtp_rate_limit_wait_seconds", "Time a message waited for SMTP_RATE_LIMIT_PER_SECOND before sending",
+    buckets=REQUEST_BUCKETS,
+)
+bcrypt_pending_hashes = Gauge(
+    "bcrypt_pending", "bcrypt hashes running or queued",
+    multiprocess_mode="livesum",
+)
+bcrypt_rejected = Counter(
+    "bcrypt_rejected_total", "Password checks refused with 503 because BCRYPT_MAX_PENDING was reached",
+)
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Current metrics in the Prometheus text format
+
+    Returns:
+        (body, content type)
+    """
+    if PROMETHEUS_MULTIPROC_DIR:
+        # A fresh registry per scrape; the collector reads every worker's files
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+def route_label(scope: dict) -> str:
+    """
+    The path with each path parameter put back as its placeholder
+    ("/leave/{leave_id}/approve"), so ids in URLs don't each become a label
+    value. Call after the app has handled the request: routing is what
+    fills in scope["path_params"].
+    """
+    if "route" not in scope:
+        return UNMATCHED_ROUTE  # nothing matched; the raw path would be unbounded
+    path = scope["path"]
+    for name, value in scope.get("path_params", {}).items():
+        path = re.sub(rf"(?<=/){re.escape(str(value))}(?=/|$)", lambda _: f"{{{name}}}", path, count=1)
+    return path
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request latency per route and requests in
+    flight. Plain ASGI rather than @app.middleware("http"), so streamed
+    responses pass through untouched.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = http_requests_in_progress.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            route = route_label(scope)
+            if route not in UNTIMED_ROUTES:
+                http_request_duration.labels(method, route, str(status)).observe(time.perf_counter() - started)
+
+def _command_collection(event: monitoring.CommandStartedEvent) -> str:
+    if event.command_name == "getMore":
+        return event.command.get("collection", "-")
+    # For collection commands the first field names the collection:
+    # {"find": "leave_requests", ...}; admin commands have other values
+    value = event.command.get(event.command_name)
+    return value if isinstance(value, str) else "-"
+
+def _shape(value, depth: int = 0):
+    # The command with values replaced, so slow-query logs show which fields
+    # were queried without leaking what was in them
+    if depth > 4:
+        return "..."
+    if isinstance(value, dict):
+        return {key: _shape(item, depth + 1) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_shape(item, depth + 1) for item in value[:3]] + (["..."] if len(value) > 3 else [])
+    return "?"
+
+# Parts of a command worth showing in a slow-query log line
+_SLOW_LOG_FIELDS = ("filter", "pipeline", "sort", "updates", "deletes", "q", "hint")
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """
+    Times every MongoDB command from the driver's own measurements and logs
+    those slower than MONGO_SLOW_QUERY_MS with the shape of their query
+    """
+    def __init__(self, slow_ms: float = MONGO_SLOW_QUERY_MS):
+        self.slow_seconds = slow_ms / 1000
+        # (request_id, connection_id) -> (collection, command document)
+        self._in_flight = {}
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        self._in_flight[(event.request_id, event.connection_id)] = (_command_collection(event), event.command)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        self._finish(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        collection = self._finish(event)
+        mongo_command_failures.labels(collection, event.command_name).inc()
+
+    def _finish(self, event) -> str:
+        collection, command = self._in_flight.pop((event.request_id, event.connection_id), ("-", None))
+        seconds = event.duration_micros / 1_000_000
+        mongo_command_duration.labels(collection, event.command_name).observe(seconds)
+        if seconds >= self.slow_seconds:
+            mongo_slow_commands.labels(collection, event.command_name).inc()
+            shape = {field: _shape(command[field]) for field in _SLOW_LOG_FIELDS if command and field in command}
+            logger.warning("Slow MongoDB %s on %s: %.0f ms %s", event.command_name, collection, seconds * 1000, json.dumps(shape)[:500])
+        return collection
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """
+    Connection checkout wait: how long commands queue for one of the
+    MONGODB_MAX_POOL_SIZE connections
+    """
+    def connection_checked_out(self, event):
+        mongo_pool_checkout_wait.observe(event.duration)
+
+    def connection_check_out_failed(self, event):
+        mongo_pool_checkout_wait.observe(event.duration)
+        mongo_pool_checkout_failures.labels(str(event.reason)).inc()
+
+    # The rest of the pool's events aren't measured
+    def pool_created(self, event): pass
+    def pool_ready(self, event): pass
+    def pool_cleared(self, event): pass
+    def pool_closed(self, event): pass
+    def connection_created(self, event): pass
+    def connection_ready(self, event): pass
+    def connection_closed(self, event): pass
+    def connection_check_out_started(self, event): pass
+    def connection_checked_in(self, event): pass
@@ -0,0 +1,270 @@
+import asyncio
+import logging
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from bson import ObjectId
+from fastapi.concurrency import run_in_threadpool
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from app.models.db import outbox_collection
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL", 2))
+OUTBOX_CONCURRENCY = int(os.getenv("OUTBOX_CONCURRENCY", 4))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 8))
+OUTBOX_BASE_BACKOFF_SECONDS = float(os.getenv("OUTBOX_BASE_BACKOFF_SECONDS", 30))
+OUTBOX_MAX_BACKOFF_SECONDS = float(os.getenv("OUTBOX_MAX_BACKOFF_SECONDS", 3600))
+# A claimed message whose worker died is picked up again after this long
+OUTBOX_LEASE_SECONDS = int(os.getenv("OUTBOX_LEASE_SECONDS", 120))
+# Delivered and dead-lettered rows are kept this long for auditing, then removed by TTL
+OUTBOX_SENT_RETENTION_HOURS = int(os.getenv("OUTBOX_SENT_RETENTION_HOURS", 72))
+# When > 0, new requests are collected per manager for this long and sent
+# as one digest email instead of one email each
+EMAIL_DIGEST_WINDOW_SECONDS = float(os.getenv("EMAIL_DIGEST_WINDOW_SECONDS", 0))
+
+STATUS_PENDING = "pending"
+STATUS_SENDING = "sending"
+# Waiting to be sent again after a failed attempt. Kept apart from pending so
+# a failed digest never competes with the manager's open one for
+# outbox_open_digest_idx, which only covers pending digests
+STATUS_RETRY = "retry"
+STATUS_SENT = "sent"
+STATUS_DEAD = "dead"
+
+KIND_LEAVE_ACTION = "leave_action"
+KIND_PASSWORD_RESET_OTP = "password_reset_otp"
+KIND_LEAVE_DIGEST = "leave_digest"
+
+async def enqueue_email(kind: str, payload: dict, session=None) -> ObjectId:
+    """
+    Store an email in the outbox for background delivery
+
+    Args:
+        kind: Message type, selects the delivery handler
+        payload: Handler arguments (must be BSON-serializable)
+        session: Optional session so the row commits with the caller's write
+
+    Returns:
+        The outbox row id
+    """
+    now = datetime.now(timezone.utc)
+    message = {
+        "kind": kind,
+        "payload": payload,
+        "status": STATUS_PENDING,
+        "attempts": 0,
+        "next_attempt_at": now,
+        "created_at": now,
+    }
+    result = await outbox_collection.insert_one(message, session=session)
+    return result.inserted_id
+
+async def enqueue_leave_notification(leave: dict, session=None):
+    """
+    Queue the manager's approval email for a new request: on its own, or
+    added to the manager's open digest when EMAIL_DIGEST_WINDOW_SECONDS is set
+    """
+    if EMAIL_DIGEST_WINDOW_SECONDS <= 0:
+        await enqueue_email(KIND_LEAVE_ACTION, {"leave_id": str(leave["_id"])}, session=session)
+        return
+
+    # The first request opens the digest and fixes when it goes out; later
+    # ones join it until a worker claims it
+    now = datetime.now(timezone.utc)
+    digest = {"kind": KIND_LEAVE_DIGEST, "status": STATUS_PENDING, "payload.manager_id": str(leave["manager_id"])}
+    update = {
+        "$addToSet": {"payload.leave_ids": str(leave["_id"])},
+        "$setOnInsert": {
+            "attempts": 0,
+            "next_attempt_at": now + timedelta(seconds=EMAIL_DIGEST_WINDOW_SECONDS),
+            "created_at": now,
+        },
+    }
+    try:
+        await outbox_collection.update_one(digest, update, upsert=True, session=session)
+    except DuplicateKeyError:
+        # Another submit opened the digest between our match and our insert
+        # (outbox_open_digest_idx let only one in); this time we join it.
+        # Inside a transaction the same race is a write conflict, which
+        # with_transaction retries on its own.
+        await outbox_collection.update_one(digest, update, upsert=True, session=session)
+
+def backoff_delay(attempts: int) -> float:
+    """
+    Exponential backoff with +/-20% jitter, capped at OUTBOX_MAX_BACKOFF_SECONDS
+    """
+    delay = min(OUTBOX_BASE_BACKOFF_SECONDS * (2 ** max(attempts - 1, 0)), OUTBOX_MAX_BACKOFF_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+async def claim_next() -> Optional[dict]:
+    """
+    Atomically claim the oldest due message, including ones whose lease expired
+    """
+    now = datetime.now(timezone.utc)
+    return await outbox_collection.find_one_and_update(
+        {
+            "$or": [
+                {"status": STATUS_PENDING, "next_attempt_at": {"$lte": now}},
+                {"status": STATUS_RETRY, "next_attempt_at": {"$lte": now}},
+                {"status": STATUS_SENDING, "next_attempt_at": {"$lte": now}},
+            ]
+        },
+        {
+            "$set": {
+                "status": STATUS_SENDING,
+                # While sending, next_attempt_at doubles as the lease deadline
+                "next_attempt_at": now + timedelta(seconds=OUTBOX_LEASE_SECONDS),
+                "claimed_at": now,
+            },
+            "$inc": {"attempts": 1},
+        },
+        sort=[("next_attempt_at", 1)],
+        return_document=ReturnDocument.AFTER,
+    )
+
+async def mark_sent(message: dict):
+    now = datetime.now(timezone.utc)
+    await outbox_collection.update_one(
+        {"_id": message["_id"], "status": STATUS_SENDING},
+        {
+            "$set": {
+                "status": STATUS_SENT,
+                "sent_at": now,
+                "expires_at": now + timedelta(hours=OUTBOX_SENT_RETENTION_HOURS),
+            },
+            # Never keep one-time secrets around after delivery
+            "$unset": {"payload.otp": "", "last_error": ""},
+        },
+    )
+
+async def mark_failed(message: dict, error: Exception):
+    now = datetime.now(timezone.utc)
+    attempts = message.get("attempts", 1)
+    if attempts >= OUTBOX_MAX_ATTEMPTS:
+        update = {
+            "$set": {
+                "status": STATUS_DEAD,
+                "dead_at": now,
+                "last_error": str(error),
+                # Kept for inspection as long as delivered rows, then removed by TTL
+                "expires_at": now + timedelta(hours=OUTBOX_SENT_RETENTION_HOURS),
+            },
+            # As in mark_sent: the OTP is useless once delivery has stopped
+            "$unset": {"payload.otp": ""},
+        }
+        logger.error("Outbox message %s (%s) dead-lettered after %d attempts: %s", message["_id"], message["kind"], attempts, error)
+    else:
+        update = {"$set": {
+            "status": STATUS_RETRY,
+            "next_attempt_at": now + timedelta(seconds=backoff_delay(attempts)),
+            "last_error": str(error),
+        }}
+        logger.warning("Outbox message %s (%s) attempt %d failed, will retry: %s", message["_id"], message["kind"], attempts, error)
+    await outbox_collection.update_one({"_id": message["_id"], "status": STATUS_SENDING}, update)
+
+async def _deliver_leave_action(payload: dict):
+    from app.utils.email import send_leave_action_email
+
+    # Re-reads the leave and skips it if it was decided before delivery
+    await send_leave_action_email({"_id": payload["leave_id"]})
+
+async def _deliver_leave_digest(payload: dict):
+    from app.utils.email import send_leave_digest_email
+
+    await send_leave_digest_email(payload["manager_id"], payload["leave_ids"])
+
+async def _deliver_password_reset_otp(payload: dict):
+    from app.utils.email import send_password_reset_otp
+
+    await run_in_threadpool(send_password_reset_otp, payload["email"], payload["otp"], payload.get("user_id"))
+
+HANDLERS = {
+    KIND_LEAVE_ACTION: _deliver_leave_action,
+    KIND_PASSWORD_RESET_OTP: _deliver_password_reset_otp,
+    KIND_LEAVE_DIGEST: _deliver_leave_digest,
+}
+
+async def deliver(message: dict):
+    try:
+        handler = HANDLERS.get(message["kind"])
+        if handler is None:
+            raise ValueError(f"Unknown outbox message kind: {message['kind']}")
+        await handler(message.get("payload", {}))
+    except Exception as e:
+        await mark_failed(message, e)
+    else:
+        await mark_sent(message)
+
+class OutboxWorker:
+    """
+    Drains the outbox in the background of each app worker.
+
+    Every process polls, so rows written by another gunicorn worker are
+    picked up within OUTBOX_POLL_INTERVAL; rows written in this process are
+    delivered immediately via notify().
+    """
+
+    def __init__(self, concurrency: int = OUTBOX_CONCURRENCY, poll_interval: float = OUTBOX_POLL_INTERVAL):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(concurrency)
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: set = set()
+
+    def notify(self):
+        self._wakeup.set()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        # Let in-flight sends finish; anything unfinished is re-claimed after its lease
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def _run(self):
+        from app.utils.email import email_configured
+
+        if not email_configured():
+            logger.warning("Email configuration not available, outbox delivery is paused")
+            return
+        while True:
+            try:
+                await self._slots.acquire()
+                self._wakeup.clear()
+                message = await claim_next()
+                if message is None:
+                    self._slots.release()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                task = asyncio.create_task(deliver(message))
+                self._inflight.add(task)
+                task.add_done_callback(self._on_done)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._slots.release()
+                logger.exception("Outbox worker error")
+                await asyncio.sleep(self.poll_interval)
+
+    def _on_done(self, task: asyncio.Task):
+        self._inflight.discard(task)
+        self._slots.release()
+
+outbox_worker = OutboxWorker()
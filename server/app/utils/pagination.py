@@ -0,0 +1,110 @@
+import base64
+import os
+from typing import Optional, Tuple, List
+from bson import ObjectId, json_util
+from fastapi import HTTPException, Query
+
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", 100))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 500))
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+def encode_cursor(sort_value, _id: ObjectId) -> str:
+    """
+    Opaque cursor for the position just after (sort_value, _id)
+    """
+    raw = json_util.dumps([sort_value, _id]).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def decode_cursor(cursor: str) -> Tuple[object, ObjectId]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, _id = json_util.loads(raw)
+        if not isinstance(_id, ObjectId):
+            raise ValueError("cursor id is not an ObjectId")
+        return sort_value, _id
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+class PageParams:
+    """
+    Query parameters shared by every paginated list endpoint
+    """
+
+    def __init__(
+        self,
+        after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        include_total: bool = Query(False, description="Also return X-Total-Count (costs a count query)"),
+    ):
+        self.after = after
+        self.limit = limit
+        self.include_total = include_total
+
+class Page:
+    def __init__(self, items: List[dict], next_cursor: Optional[str] = None, total: Optional[int] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.total = total
+
+    def headers(self) -> dict:
+        headers = {}
+        if self.next_cursor:
+            headers[NEXT_CURSOR_HEADER] = self.next_cursor
+        if self.total is not None:
+            headers[TOTAL_COUNT_HEADER] = str(self.total)
+        return headers
+
+async def paginate(
+    collection,
+    base_filter: dict,
+    sort_field: str,
+    page: PageParams,
+    projection: Optional[dict] = None,
+    descending: bool = True,
+) -> Page:
+    """
+    Fetch one page ordered by (sort_field, _id) using keyset pagination
+
+    The next page starts strictly after the last document returned, so each
+    page is a single range scan on an index ending in (sort_field, _id)
+    regardless of how deep the caller has paged. Routes send the next
+    cursor and optional total as response headers (Page.headers()) so the
+    body stays a plain list.
+
+    Args:
+        collection: Collection to query
+        base_filter: Filter identifying the caller's documents
+        sort_field: Field to order by; must be stored on every matching document
+        page: Pagination query parameters
+        projection: Fields to fetch (must include sort_field)
+        descending: Newest first (default) or oldest first
+
+    Returns:
+        Page with up to page.limit documents
+    """
+    query = dict(base_filter)
+    if page.after:
+        sort_value, last_id = decode_cursor(page.after)
+        op = "$lt" if descending else "$gt"
+        query["$or"] = [
+            {sort_field: {op: sort_value}},
+            {sort_field: sort_value, "_id": {op: last_id}},
+        ]
+
+    direction = -1 if descending else 1
+    cursor = collection.find(query, projection).sort([(sort_field, direction), ("_id", direction)]).limit(page.limit + 1)
+    docs = await cursor.to_list()
+
+    next_cursor = None
+    if len(docs) > page.limit:
+        docs = docs[:page.limit]
+        last = docs[-1]
+        next_cursor = encode_cursor(last.get(sort_field), last["_id"])
+
+    total = None
+    if page.include_total:
+        total = await collection.count_documents(base_filter)
+
+    return Page(docs, next_cursor, total)
@@ -0,0 +1,27 @@
+from decimal import Decimal
+from typing import Any
+import orjson
+from bson import ObjectId
+from bson.decimal128 import Decimal128
+from fastapi.responses import JSONResponse
+
+def _default(value: Any):
+    # orjson handles datetime/date/UUID natively; only BSON types need help
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, Decimal128):
+        return str(value.to_decimal())
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+class MongoJSONResponse(JSONResponse):
+    """
+    JSON response rendered by orjson that understands BSON types.
+
+    Route handlers can return Mongo documents as-is: ObjectIds become strings
+    and datetimes ISO 8601 during the single serialization pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
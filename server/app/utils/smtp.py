@@ -0,0 +1,250 @@
+import os
+import queue
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+from typing import Callable, List, Optional
+from dotenv import load_dotenv
+from app.utils.metrics import smtp_rate_limit_wait, smtp_send_duration
+
+load_dotenv()
+
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", 4))
+# Providers commonly cap messages per session; recycle before hitting it
+SMTP_MAX_MESSAGES_PER_CONNECTION = int(os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", 100))
+# Idle connections are probed with NOOP before reuse after this many seconds
+SMTP_KEEPALIVE_SECONDS = float(os.getenv("SMTP_KEEPALIVE_SECONDS", 30))
+# ...and closed instead of probed after this many (servers drop them anyway)
+SMTP_MAX_IDLE_SECONDS = float(os.getenv("SMTP_MAX_IDLE_SECONDS", 240))
+SMTP_TIMEOUT_SECONDS = float(os.getenv("SMTP_TIMEOUT_SECONDS", 30))
+# Off only for local servers without TLS, such as the bench SMTP sink
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "true").lower() == "true"
+# Sustained send rate and burst allowance; 0 disables rate limiting
+SMTP_RATE_LIMIT_PER_SECOND = float(os.getenv("SMTP_RATE_LIMIT_PER_SECOND", 5))
+SMTP_RATE_LIMIT_BURST = int(os.getenv("SMTP_RATE_LIMIT_BURST", 10))
+
+# Errors after which the connection cannot be trusted for another message.
+# SMTPException subclasses OSError, so these must be matched before it.
+CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)
+
+class RateLimiter:
+    """
+    Thread-safe token bucket. acquire() blocks until a send is allowed.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+class _PooledConnection:
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.messages_sent = 0
+        self.last_used = time.monotonic()
+
+    def close(self):
+        try:
+            self.smtp.quit()
+        except Exception:
+            try:
+                self.smtp.close()
+            except Exception:
+                pass
+
+class SMTPConnectionPool:
+    """
+    Bounded pool of authenticated SMTP sessions shared by all sender threads.
+
+    Connections are opened lazily, reused across messages, probed with NOOP
+    after sitting idle, recycled after max_messages and replaced
+    transparently when the server drops them.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        size: int = SMTP_POOL_SIZE,
+        max_messages: int = SMTP_MAX_MESSAGES_PER_CONNECTION,
+        keepalive_seconds: float = SMTP_KEEPALIVE_SECONDS,
+        max_idle_seconds: float = SMTP_MAX_IDLE_SECONDS,
+        timeout: float = SMTP_TIMEOUT_SECONDS,
+        starttls: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.size = size
+        self.max_messages = max_messages
+        self.keepalive_seconds = keepalive_seconds
+        self.max_idle_seconds = max_idle_seconds
+        self.timeout = timeout
+        self.starttls = starttls
+        self.rate_limiter = rate_limiter
+        self._idle: "queue.LifoQueue[_PooledConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._closed = False
+
+    def _connect(self) -> _PooledConnection:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            smtp.ehlo()
+            if self.starttls:
+                smtp.starttls()
+                smtp.ehlo()
+            if self.user and self.password:
+                smtp.login(self.user, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        return _PooledConnection(smtp)
+
+    def _is_usable(self, conn: _PooledConnection) -> bool:
+        idle = time.monotonic() - conn.last_used
+        if idle >= self.max_idle_seconds:
+            return False
+        if idle >= self.keepalive_seconds:
+            try:
+                code, _ = conn.smtp.noop()
+                return code == 250
+            except Exception:
+                return False
+        return True
+
+    def _checkout(self) -> _PooledConnection:
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError("Timed out waiting for a free SMTP connection")
+        try:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect()
+                if self._is_usable(conn):
+                    return conn
+                conn.close()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _checkin(self, conn: _PooledConnection, broken: bool = False):
+        try:
+            if broken or self._closed or conn.messages_sent >= self.max_messages:
+                conn.close()
+            else:
+                conn.last_used = time.monotonic()
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def send_message(self, msg: EmailMessage):
+        """
+        Send one message over a pooled connection, reconnecting once if the
+        server dropped the session since it was last used.
+        """
+        self._send(lambda smtp: smtp.send_message(msg))
+
+    def sendmail(self, from_addr: str, to_addrs: List[str], data: bytes):
+        """
+        Like send_message, for a message already serialized (CRLF line
+        endings), e.g. from app.utils.email_templates
+        """
+        self._send(lambda smtp: smtp.sendmail(from_addr, to_addrs, data))
+
+    def _send(self, send: Callable[[smtplib.SMTP], object]):
+        if self.rate_limiter:
+            waited = time.monotonic()
+            self.rate_limiter.acquire()
+            smtp_rate_limit_wait.observe(time.monotonic() - waited)
+        started = time.monotonic()
+        outcome = "failed"
+        try:
+            self._send_with_retry(send)
+            outcome = "sent"
+        finally:
+            smtp_send_duration.labels(outcome).observe(time.monotonic() - started)
+
+    def _send_with_retry(self, send: Callable[[smtplib.SMTP], object]):
+        for attempt in range(2):
+            conn = self._checkout()
+            try:
+                send(conn.smtp)
+            except CONNECTION_ERRORS:
+                self._checkin(conn, broken=True)
+                if attempt == 1:
+                    raise
+                continue
+            except smtplib.SMTPException:
+                # Message-level rejection; the session itself is still fine
+                self._checkin(conn)
+                raise
+            except OSError:
+                # Socket error or timeout; the session state is unknown
+                self._checkin(conn, broken=True)
+                if attempt == 1:
+                    raise
+                continue
+            conn.messages_sent += 1
+            self._checkin(conn)
+            return
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+_pool: Optional[SMTPConnectionPool] = None
+_pool_lock = threading.Lock()
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """
+    Process-wide pool built from EMAIL_HOST/EMAIL_PORT/EMAIL_USER/EMAIL_PASS
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                rate_limiter = None
+                if SMTP_RATE_LIMIT_PER_SECOND > 0:
+                    rate_limiter = RateLimiter(SMTP_RATE_LIMIT_PER_SECOND, SMTP_RATE_LIMIT_BURST)
+                _pool = SMTPConnectionPool(
+                    os.getenv("EMAIL_HOST"),
+                    int(os.getenv("EMAIL_PORT", 587)),
+                    os.getenv("EMAIL_USER"),
+                    os.getenv("EMAIL_PASS"),
+                    starttls=SMTP_STARTTLS,
+                    rate_limiter=rate_limiter,
+                )
+    return _pool
+
+def close_smtp_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
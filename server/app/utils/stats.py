@@ -0,0 +1,102 @@
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from bson import ObjectId
+from app.models.db import leaves_collection
+from app.utils.cache import TTLCache
+from app.utils.events import leave_events
+
+# Entries are dropped as soon as a write touching the user is seen (locally,
+# or from any worker while change streams run); the TTL bounds staleness
+# otherwise
+STATS_CACHE_TTL_SECONDS = float(os.getenv("STATS_CACHE_TTL_SECONDS", 60))
+STATS_CACHE_MAX_SIZE = int(os.getenv("STATS_CACHE_MAX_SIZE", 10000))
+stats_cache = TTLCache(maxsize=STATS_CACHE_MAX_SIZE, ttl=STATS_CACHE_TTL_SECONDS)
+
+# Pending requests by age: (label, minimum age in days), oldest first
+PENDING_AGE_BUCKETS = [("over_7_days", 7), ("3_to_7_days", 3), ("under_3_days", 0)]
+
+_SCOPE_FIELDS = {"mine": "employee_id", "team": "manager_id"}
+
+def _invalidate_for_event(event: dict):
+    for user_id in (event["employee_id"], event["manager_id"]):
+        stats_cache.invalidate_where(lambda key: key[0] == user_id)
+
+leave_events.add_listener(_invalidate_for_event)
+
+def _pipeline(field: str, user_id: ObjectId, year: int, now: datetime) -> list:
+    # created_at, action_timestamp and start_date are ISO strings in one
+    # format, so the bucket boundaries are plain string comparisons
+    age_branches = [
+        {"case": {"$lte": ["$created_at", (now - timedelta(days=days)).isoformat()]}, "then": label}
+        for label, days in PENDING_AGE_BUCKETS[:-1]
+    ]
+    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0).isoformat()
+    return [
+        {"$match": {field: user_id}},
+        {"$group": {
+            "_id": {
+                "status": "$status",
+                "leave_type": "$leave_type",
+                "in_year": {"$and": [
+                    {"$gte": ["$start_date", f"{year}-01-01"]},
+                    {"$lte": ["$start_date", f"{year}-12-31"]},
+                ]},
+                "age": {"$cond": [
+                    {"$eq": ["$status", "pending"]},
+                    {"$switch": {"branches": age_branches, "default": PENDING_AGE_BUCKETS[-1][0]}},
+                    None,
+                ]},
+                "this_month": {"$gte": [{"$ifNull": ["$action_timestamp", ""]}, month_start]},
+            },
+            "count": {"$sum": 1},
+            "days": {"$sum": {"$ifNull": ["$days", 0]}},
+        }},
+    ]
+
+async def leave_stats(user_id: str, scope: str = "mine", year: Optional[int] = None) -> dict:
+    """
+    Dashboard figures for a user's own requests ("mine") or the requests
+    they approve ("team"), from one $group over the scope's index prefix
+
+    Returns:
+        {"scope", "year", "total", "by_status", "approved_days",
+        "approved_days_by_type", "pending_age", "processed_this_month"}
+        where approved days count approved leave starting in `year`
+    """
+    now = datetime.now(timezone.utc)
+    year = year or now.year
+    cache_key = (user_id, scope, year)
+    cached = stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    cursor = await leaves_collection.aggregate(_pipeline(_SCOPE_FIELDS[scope], ObjectId(user_id), year, now))
+
+    stats = {
+        "scope": scope,
+        "year": year,
+        "total": 0,
+        "by_status": {"pending": 0, "approved": 0, "rejected": 0},
+        "approved_days": 0,
+        "approved_days_by_type": {},
+        "pending_age": {label: 0 for label, _ in PENDING_AGE_BUCKETS},
+        "processed_this_month": {"approved": 0, "rejected": 0},
+    }
+    async for row in cursor:
+        key = row["_id"]
+        status = key.get("status") or "unknown"
+        stats["total"] += row["count"]
+        stats["by_status"][status] = stats["by_status"].get(status, 0) + row["count"]
+        if status == "approved" and key.get("in_year"):
+            leave_type = key.get("leave_type") or "other"
+            by_type = stats["approved_days_by_type"]
+            by_type[leave_type] = by_type.get(leave_type, 0) + row["days"]
+            stats["approved_days"] += row["days"]
+        if key.get("age"):
+            stats["pending_age"][key["age"]] += row["count"]
+        if status in stats["processed_this_month"] and key.get("this_month"):
+            stats["processed_this_month"][status] += row["count"]
+
+    stats_cache.set(cache_key, stats)
+    return stats
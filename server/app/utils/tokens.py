@@ -1,96 +1,265 @@
-import secrets
-from datetime import datetime, timedelta, timezone
-from app.models.db import tokens_collection
-from bson import ObjectId
-from typing import Optional
-
-def generate_approval_token(leave_id: str, manager_id: str, action: str = "approve", hours_valid: int = 24) -> str:
-    """
-    Generate a unique one-time token for leave approval/rejection
-    
-    Args:
-        leave_id: The leave request ID
-        manager_id: The manager's user ID
-        action: "approve" or "reject"
-        hours_valid: How many hours the token is valid (default 24)
-    
-    Returns:
-        The generated token string
-    """
-    token = secrets.token_urlsafe(32)
-    expires_at = datetime.now(timezone.utc) + timedelta(hours=hours_valid)
-    
-    token_doc = {
-        "token": token,
-        "leave_id": leave_id,
-        "manager_id": manager_id,
-        "action": action,
-        "expires_at": expires_at,
-        "is_used": False,
-        "created_at": datetime.now(timezone.utc)
-    }
-    
-    tokens_collection.insert_one(token_doc)
-    return token
-
-def verify_token(token: str) -> Optional[dict]:
-    """
-    Verify if a token is valid and not expired
-    
-    Args:
-        token: The token to verify
-    
-    Returns:
-        Token document if valid, None otherwise
-    """
-    token_doc = tokens_collection.find_one({
-        "token": token,
-        "is_used": False,
-        "expires_at": {"$gt": datetime.now(timezone.utc)}
-    })
-    
-    return token_doc
-
-def use_token(token: str) -> bool:
-    """
-    Mark a token as used
-    
-    Args:
-        token: The token to mark as used
-    
-    Returns:
-        True if token was successfully marked as used, False otherwise
-    """
-    result = tokens_collection.update_one(
-        {"token": token, "is_used": False},
-        {"$set": {"is_used": True, "used_at": datetime.now(timezone.utc)}}
-    )
-    
-    return result.modified_count > 0
-
-def cleanup_expired_tokens():
-    """
-    Remove expired tokens from the database
-    This should be called periodically (e.g., via a cron job)
-    """
-    result = tokens_collection.delete_many({
-        "expires_at": {"$lt": datetime.now(timezone.utc)}
-    })
-    
-    print(f"Cleaned up {result.deleted_count} expired tokens")
-    return result.deleted_count
-
-def revoke_tokens_for_leave(leave_id: str):
-    """
-    Revoke all tokens for a specific leave request
-    Useful when leave is processed through other means
-    
-    Args:
-        leave_id: The leave request ID
-    """
-    result = tokens_collection.update_many(
-        {"leave_id": leave_id, "is_used": False},
-        {"$set": {"is_used": True, "revoked_at": datetime.now(timezone.utc)}}
-    )
-    
-    return result.modified_count
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import struct
+from datetime import datetime, timedelta, timezone
+from app.models.db import tokens_collection, used_tokens_collection
+from bson import ObjectId
+from pymongo import UpdateOne
+from typing import List, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Approval tokens are signed rather than stored: the payload carries
+# leave_id, manager_id, action and expiry, and the HMAC proves we issued it.
+# Only *used* tokens are written, to a small TTL-expired ledger.
+_SECRET = os.getenv("APPROVAL_TOKEN_SECRET") or os.getenv("SECRET_KEY")
+
+if not _SECRET:
+    # An empty key would let anyone mint valid approve/reject tokens
+    raise ValueError("APPROVAL_TOKEN_SECRET or SECRET_KEY environment variable must be set!")
+
+# Derive a dedicated key so approval tokens never share a key with JWTs
+_SIGNING_KEY = hashlib.sha256(b"leave-approval-token:" + _SECRET.encode()).digest()
+
+# Upper bound on token lifetime; ledger entries outlive any token they cover
+APPROVAL_TOKEN_MAX_HOURS = 72
+
+_ACTIONS = ("approve", "reject")
+# version(1) | leave_id(12) | manager_id(12) | action(1) | expires_at epoch(4) | nonce(4)
+_PAYLOAD = struct.Struct(">B12s12sBI4s")
+_VERSION = 1
+_SIGNATURE_BYTES = 16
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(_SIGNING_KEY, payload, hashlib.sha256).digest()[:_SIGNATURE_BYTES]
+
+def _ledger_key(leave_id: str, action: str) -> str:
+    return f"{leave_id}:{action}"
+
+def generate_approval_token(leave_id: str, manager_id: str, action: str = "approve", hours_valid: int = 24) -> str:
+    """
+    Generate a signed one-time token for leave approval/rejection
+
+    No database write is needed; the token is self-describing.
+
+    Args:
+        leave_id: The leave request ID
+        manager_id: The manager's user ID
+        action: "approve" or "reject"
+        hours_valid: How many hours the token is valid (default 24, max APPROVAL_TOKEN_MAX_HOURS)
+
+    Returns:
+        The generated token string
+    """
+    hours_valid = min(hours_valid, APPROVAL_TOKEN_MAX_HOURS)
+    expires_at = int((datetime.now(timezone.utc) + timedelta(hours=hours_valid)).timestamp())
+    payload = _PAYLOAD.pack(
+        _VERSION,
+        ObjectId(leave_id).binary,
+        ObjectId(manager_id).binary,
+        _ACTIONS.index(action),
+        expires_at,
+        secrets.token_bytes(4),
+    )
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+def decode_token(token: str) -> Optional[dict]:
+    """
+    Check a signed token's signature and expiry without touching the database
+
+    Args:
+        token: The token to decode
+
+    Returns:
+        Token claims if the signature is valid and not expired, None otherwise
+    """
+    try:
+        encoded_payload, encoded_signature = token.split(".")
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+        if not hmac.compare_digest(signature, _sign(payload)):
+            return None
+        version, leave_id, manager_id, action, expires_at, _ = _PAYLOAD.unpack(payload)
+    except (ValueError, struct.error):
+        return None
+
+    if version != _VERSION or action >= len(_ACTIONS):
+        return None
+    expires_at = datetime.fromtimestamp(expires_at, tz=timezone.utc)
+    if expires_at <= datetime.now(timezone.utc):
+        return None
+
+    return {
+        "leave_id": str(ObjectId(leave_id)),
+        "manager_id": str(ObjectId(manager_id)),
+        "action": _ACTIONS[action],
+        "expires_at": expires_at,
+    }
+
+def _is_legacy_token(token: str) -> bool:
+    # Random tokens issued before signing was introduced have no "." separator
+    return "." not in token
+
+async def verify_token(token: str) -> Optional[dict]:
+    """
+    Verify if a token is valid and not expired
+
+    Signed tokens are verified on the CPU. Legacy random tokens from emails
+    sent before the switch are still looked up in approval_tokens until they
+    expire.
+
+    Args:
+        token: The token to verify
+
+    Returns:
+        Token claims if valid, None otherwise
+    """
+    if not _is_legacy_token(token):
+        return decode_token(token)
+
+    token_doc = await tokens_collection.find_one({
+        "token": token,
+        "is_used": False,
+        "expires_at": {"$gt": datetime.now(timezone.utc)}
+    })
+
+    return token_doc
+
+async def use_token(token: str, revoke_leave: bool = False) -> bool:
+    """
+    Mark a token as used
+
+    One atomic upsert into the used-token ledger: whoever inserts the entry
+    first wins, every later attempt sees the existing entry.
+
+    Args:
+        token: The token to mark as used
+        revoke_leave: Also revoke the leave's other token, in the same
+            round trip for signed tokens
+
+    Returns:
+        True if token was successfully marked as used, False otherwise
+    """
+    if _is_legacy_token(token):
+        result = await tokens_collection.update_one(
+            {"token": token, "is_used": False},
+            {"$set": {"is_used": True, "used_at": datetime.now(timezone.utc)}}
+        )
+        if result.modified_count and revoke_leave:
+            token_doc = await tokens_collection.find_one({"token": token}, {"leave_id": 1})
+            await revoke_tokens_for_leave(token_doc["leave_id"])
+        return result.modified_count > 0
+
+    claims = decode_token(token)
+    if not claims:
+        return False
+
+    now = datetime.now(timezone.utc)
+    requests = [UpdateOne(
+        {"_id": _ledger_key(claims["leave_id"], claims["action"])},
+        {"$setOnInsert": {"reason": "used", "used_at": now, "expires_at": claims["expires_at"]}},
+        upsert=True
+    )]
+    if revoke_leave:
+        expires_at = now + timedelta(hours=APPROVAL_TOKEN_MAX_HOURS)
+        requests.extend(
+            UpdateOne(
+                {"_id": _ledger_key(claims["leave_id"], action)},
+                {"$setOnInsert": {"reason": "revoked", "used_at": now, "expires_at": expires_at}},
+                upsert=True
+            )
+            for action in _ACTIONS if action != claims["action"]
+        )
+
+    result = await used_tokens_collection.bulk_write(requests, ordered=False)
+
+    # upserted_ids is keyed by request index; ours is the first request
+    return 0 in result.upserted_ids
+
+async def release_token(token: str):
+    """
+    Undo use_token(token, revoke_leave=True) when the action it guarded
+    could not be applied, so the links in the email work again
+
+    Only call this while the leave is still pending: the leave's own state
+    is what stops a released token from deciding it twice.
+
+    Args:
+        token: The token that was marked as used
+    """
+    if _is_legacy_token(token):
+        await tokens_collection.update_one(
+            {"token": token},
+            {"$set": {"is_used": False}, "$unset": {"used_at": ""}}
+        )
+        return
+
+    claims = decode_token(token)
+    if claims:
+        await used_tokens_collection.delete_many(
+            {"_id": {"$in": [_ledger_key(claims["leave_id"], action) for action in _ACTIONS]}}
+        )
+
+async def revoke_tokens_for_leave(leave_id: str):
+    """
+    Revoke all tokens for a specific leave request
+    Useful when leave is processed through other means
+
+    Writes ledger entries for both actions in a single round trip. Legacy
+    tokens need no revocation: once the leave is no longer pending they
+    cannot change it.
+
+    Args:
+        leave_id: The leave request ID
+
+    Returns:
+        Number of tokens newly revoked
+    """
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(hours=APPROVAL_TOKEN_MAX_HOURS)
+    result = await used_tokens_collection.bulk_write([
+        UpdateOne(
+            {"_id": _ledger_key(leave_id, action)},
+            {"$setOnInsert": {"reason": "revoked", "used_at": now, "expires_at": expires_at}},
+            upsert=True
+        )
+        for action in _ACTIONS
+    ], ordered=False)
+
+    return result.upserted_count
+
+async def revoke_tokens_for_leaves(leave_ids: List[str]) -> int:
+    """
+    Revoke the tokens of many leave requests in a single round trip
+
+    Args:
+        leave_ids: The leave request IDs
+
+    Returns:
+        Number of tokens newly revoked
+    """
+    if not leave_ids:
+        return 0
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(hours=APPROVAL_TOKEN_MAX_HOURS)
+    result = await used_tokens_collection.bulk_write([
+        UpdateOne(
+            {"_id": _ledger_key(leave_id, action)},
+            {"$setOnInsert": {"reason": "revoked", "used_at": now, "expires_at": expires_at}},
+            upsert=True
+        )
+        for leave_id in leave_ids
+        for action in _ACTIONS
+    ], ordered=False)
+
+    return result.upserted_count
@@ -0,0 +1,212 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+from bson import ObjectId
+from fastapi import HTTPException
+from pymongo import ReturnDocument, UpdateOne
+from app.models.db import leaves_collection, run_in_transaction
+from app.utils.tokens import revoke_tokens_for_leave, revoke_tokens_for_leaves
+from app.utils.events import leave_events, leave_event
+from app.utils.changes import stamp_update
+from app.utils.balances import balance_update, apply_balance_updates, COUNTED_FIELD
+
+# Accepts both the email actions and the dashboard statuses
+ACTION_STATUS = {
+    "approve": "approved",
+    "reject": "rejected",
+    "approved": "approved",
+    "rejected": "rejected",
+}
+
+_ERRORS = {
+    "invalid_action": (400, "Invalid action. Must be 'approve' or 'reject'"),
+    "invalid_id": (400, "Invalid leave request ID"),
+    "duplicate": (400, "Leave request appears more than once in this batch"),
+    "not_found": (404, "Leave request not found"),
+    "not_manager": (403, "Only the assigned manager can process this leave request"),
+    "already_processed": (400, "Action already taken on this leave request"),
+}
+
+def _update_for(status: str, manager_oid: ObjectId, processed_via: str, comments: Optional[str], now: str) -> dict:
+    update_data = {
+        "status": status,
+        "is_action_taken": True,
+        "approver_id": manager_oid,
+        "action_timestamp": now,
+        "processed_via": processed_via,
+    }
+    if comments:
+        update_data["comments"] = comments
+    return update_data
+
+def _pending_filter(leave_oid: ObjectId, manager_oid: ObjectId) -> dict:
+    return {"_id": leave_oid, "manager_id": manager_oid, "status": "pending", "is_action_taken": False}
+
+def _failure_reason(current: Optional[dict], manager_oid: ObjectId) -> str:
+    if current is None:
+        return "not_found"
+    if current.get("manager_id") != manager_oid:
+        return "not_manager"
+    return "already_processed"
+
+class LeaveTransitionError(HTTPException):
+    """
+    A transition that did not apply. `reason` is one of the _ERRORS keys and
+    `leave` holds the current status fields when the leave exists.
+    """
+
+    def __init__(self, reason: str, leave: Optional[dict] = None):
+        status_code, detail = _ERRORS[reason]
+        super().__init__(status_code=status_code, detail=detail)
+        self.reason = reason
+        self.leave = leave
+
+async def transition_leave(
+    leave_id: str,
+    action: str,
+    manager_id: str,
+    processed_via: str,
+    comments: Optional[str] = None,
+    revoke_tokens: bool = True,
+) -> dict:
+    """
+    Move a pending leave to approved/rejected in one conditional update
+
+    The filter only matches a leave that is still pending and assigned to
+    this manager, so of two concurrent approvers exactly one wins. The
+    current state is read back only when nothing matched, to say why.
+
+    Args:
+        leave_id: The leave request ID
+        action: "approve"/"reject" or "approved"/"rejected"
+        manager_id: The acting manager's user ID
+        processed_via: "dashboard" or "email"
+        comments: Optional manager comments
+        revoke_tokens: Revoke the leave's email tokens afterwards; callers
+            that already wrote the ledger entries pass False
+
+    Returns:
+        The updated leave document
+
+    Raises:
+        LeaveTransitionError: If the leave is missing, assigned to another
+            manager or no longer pending
+    """
+    status = ACTION_STATUS.get(action)
+    if status is None:
+        raise LeaveTransitionError("invalid_action")
+
+    leave_oid = ObjectId(leave_id)
+    manager_oid = ObjectId(manager_id)
+    update_data = _update_for(status, manager_oid, processed_via, comments, datetime.now(timezone.utc).isoformat())
+
+    # The leave balance moves with the status, in the same transaction
+    async def apply(session):
+        leave = await leaves_collection.find_one_and_update(
+            _pending_filter(leave_oid, manager_oid),
+            stamp_update({"$set": update_data}),
+            return_document=ReturnDocument.AFTER,
+            session=session,
+        )
+        if leave is not None:
+            await apply_balance_updates([balance_update(leave, "pending", status)], session=session)
+        return leave
+
+    leave = await run_in_transaction(apply)
+    if leave is None:
+        current = await leaves_collection.find_one(
+            {"_id": leave_oid}, {"status": 1, "is_action_taken": 1, "manager_id": 1}
+        )
+        raise LeaveTransitionError(_failure_reason(current, manager_oid), current)
+
+    if revoke_tokens:
+        await revoke_tokens_for_leave(leave_id)
+    leave_events.publish(leave_event(leave, status))
+
+    return leave
+
+async def bulk_transition_leaves(items: List[dict], manager_id: str, processed_via: str = "dashboard") -> List[dict]:
+    """
+    Apply many approvals/rejections with a constant number of round trips
+
+    Every item becomes the same conditional update transition_leave()
+    uses, all sent in one unordered bulk_write and tagged with a batch id.
+    One read of the touched leaves then tells, per item, whether this
+    batch applied it (the tag matches) or why not, and the applied ones'
+    leave balances are adjusted in one more write, all in one transaction.
+    Tokens of every applied leave are then revoked in a single write.
+
+    Args:
+        items: Dicts with leave_id, action and optional comments
+        manager_id: The acting manager's user ID
+        processed_via: Recorded on each updated leave
+
+    Returns:
+        One result per item, in input order: {"leave_id", "action",
+        "success", "status"} on success, or {"leave_id", "action",
+        "success", "status_code", "error"} on failure
+    """
+    manager_oid = ObjectId(manager_id)
+    batch_id = ObjectId()
+    stamped_at = datetime.now(timezone.utc)
+    now = stamped_at.isoformat()
+
+    results: List[dict] = []
+    requests = []
+    seen = set()
+    for item in items:
+        result = {"leave_id": item["leave_id"], "action": item["action"], "success": False}
+        results.append(result)
+        status = ACTION_STATUS.get(item["action"])
+        if status is None:
+            result["reason"] = "invalid_action"
+            continue
+        if not ObjectId.is_valid(item["leave_id"]):
+            result["reason"] = "invalid_id"
+            continue
+        leave_oid = ObjectId(item["leave_id"])
+        if leave_oid in seen:
+            result["reason"] = "duplicate"
+            continue
+        seen.add(leave_oid)
+        result["_oid"] = leave_oid
+        result["status"] = status
+        update_data = _update_for(status, manager_oid, processed_via, item.get("comments"), now)
+        update_data["action_batch_id"] = batch_id
+        requests.append(UpdateOne(_pending_filter(leave_oid, manager_oid), stamp_update({"$set": update_data}, stamped_at)))
+
+    async def apply(session):
+        await leaves_collection.bulk_write(requests, ordered=False, session=session)
+        cursor = leaves_collection.find(
+            {"_id": {"$in": list(seen)}},
+            {"status": 1, "is_action_taken": 1, "manager_id": 1, "employee_id": 1, "action_batch_id": 1,
+             "leave_type": 1, "start_date": 1, "end_date": 1, "days": 1, "region": 1, "employee_department": 1, COUNTED_FIELD: 1},
+            session=session,
+        )
+        current = await cursor.to_list()
+        await apply_balance_updates([
+            balance_update(leave, "pending", leave["status"])
+            for leave in current if leave.get("action_batch_id") == batch_id
+        ], session=session)
+        return current
+
+    current_by_id = {}
+    if requests:
+        current_by_id = {leave["_id"]: leave for leave in await run_in_transaction(apply)}
+
+    applied = []
+    for result in results:
+        leave_oid = result.pop("_oid", None)
+        if leave_oid is not None:
+            current = current_by_id.get(leave_oid)
+            if current is not None and current.get("action_batch_id") == batch_id:
+                result["success"] = True
+                applied.append(result["leave_id"])
+                leave_events.publish(leave_event(current, current["status"]))
+                continue
+            result["reason"] = _failure_reason(current, manager_oid)
+            result.pop("status")
+        result["status_code"], result["error"] = _ERRORS[result.pop("reason")]
+
+    await revoke_tokens_for_leaves(applied)
+
+    return results
@@ -0,0 +1,101 @@
+import logging
+import os
+import re
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# One file per region: app/data/holidays/<region>.txt, a YYYY-MM-DD date per
+# line followed by an optional name; blank lines and # comments are ignored
+HOLIDAYS_DIR = Path(os.getenv("HOLIDAYS_DIR", Path(__file__).resolve().parent.parent / "data" / "holidays"))
+DEFAULT_HOLIDAY_REGION = os.getenv("HOLIDAY_REGION", "us")
+# numpy weekmask, Monday first: "1111100" or "Mon Tue Wed Thu Fri"
+WORK_WEEKMASK = os.getenv("WORK_WEEKMASK", "1111100")
+
+# Region names double as file names, so only plain slugs are looked up
+_REGION_NAME = re.compile(r"[a-z0-9_-]+")
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+def _to_days(values: Sequence[date]) -> np.ndarray:
+    # date/datetime -> datetime64[D] via toordinal(); much faster than letting
+    # numpy convert the objects, and it ignores tzinfo (dates are UTC midnight)
+    ordinals = np.fromiter((value.toordinal() for value in values), dtype=np.int64, count=len(values))
+    return (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+def load_holidays(path: Path) -> List[date]:
+    holidays = []
+    for number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        try:
+            holidays.append(date.fromisoformat(line.split(None, 1)[0]))
+        except ValueError:
+            # One bad line shouldn't fail every day count in the region
+            logger.warning("Skipping malformed holiday line %s:%d: %r", path, number, line)
+    return holidays
+
+class WorkCalendars:
+    """
+    busdaycalendar per region, compiled from its holiday file on first use
+
+    A compiled calendar holds the holidays as a sorted array with the
+    weekends already removed, so busday_count is a binary search per date
+    rather than a walk over the days.
+    """
+    def __init__(self, directory: Path = HOLIDAYS_DIR, weekmask: str = WORK_WEEKMASK, default_region: str = DEFAULT_HOLIDAY_REGION):
+        self.directory = directory
+        self.weekmask = weekmask
+        self.default_region = default_region
+        self._calendars: Dict[str, np.busdaycalendar] = {}
+
+    def regions(self) -> List[str]:
+        return sorted(path.stem for path in self.directory.glob("*.txt"))
+
+    def resolve(self, region: Optional[str]) -> str:
+        # Regions without a holiday file fall back to the default one
+        region = (region or self.default_region).lower()
+        if region in self._calendars or (_REGION_NAME.fullmatch(region) and (self.directory / f"{region}.txt").is_file()):
+            return region
+        return self.default_region
+
+    def calendar(self, region: Optional[str] = None) -> np.busdaycalendar:
+        region = self.resolve(region)
+        calendar = self._calendars.get(region)
+        if calendar is None:
+            path = self.directory / f"{region}.txt"
+            holidays = load_holidays(path) if path.is_file() else []
+            calendar = np.busdaycalendar(weekmask=self.weekmask, holidays=np.array(holidays, dtype="datetime64[D]"))
+            self._calendars[region] = calendar
+        return calendar
+
+    def reload(self):
+        """Drop compiled calendars so edited holiday files are read again"""
+        self._calendars.clear()
+
+    def count(self, start: date, end: date, region: Optional[str] = None) -> int:
+        """
+        Working days from start to end, both inclusive
+        """
+        return int(np.busday_count(start, end + timedelta(days=1), busdaycal=self.calendar(region)))
+
+    def count_many(self, starts: Sequence[date], ends: Sequence[date], region: Optional[str] = None) -> np.ndarray:
+        """
+        Working days for many inclusive (start, end) pairs in one region, in
+        a single vectorized busday_count; dates or datetimes (date part used)
+
+        Returns:
+            int64 array, one count per pair
+        """
+        start_days = _to_days(starts)
+        end_days = _to_days(ends) + np.timedelta64(1, "D")
+        return np.busday_count(start_days, end_days, busdaycal=self.calendar(region))
+
+work_calendars = WorkCalendars()
+
+def user_region(user: dict) -> str:
+    return work_calendars.resolve(user.get("region"))
@@ -0,0 +1,167 @@
+"""
+Email path throughput: approval emails and password reset OTPs sent at a
+fixed concurrency against an SMTP server (normally bench.smtp_sink).
+
+Reports messages/sec and p50/p99 latency per message kind, and for approval
+emails the time spent in each stage: token generation, template render,
+MIME build and SMTP delivery.
+
+Usage (from server/, after pip install -r requirements-bench.txt):
+    python -m bench.email_bench --sink                        # in-process sink, 1000 messages, concurrency 8
+    python -m bench.email_bench --sink --starttls --messages 5000 --concurrency 16
+    python -m bench.email_bench --port 2525                    # a sink or server already running
+    python -m bench.email_bench --sink --with-db               # also send_leave_action_email end to end (needs MONGODB_URI)
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List
+from bench.stats import percentile
+
+async def run_concurrently(count: int, concurrency: int, send: Callable[[int], Awaitable[Dict[str, float]]]) -> dict:
+    """
+    Call send(i) for i in range(count) from `concurrency` workers
+
+    Returns:
+        {"seconds", "latencies", "stages"} where latencies holds each call's
+        wall time and stages the per-stage seconds send() reported
+    """
+    latencies: List[float] = []
+    stages: Dict[str, List[float]] = {}
+    next_index = iter(range(count))
+
+    async def worker():
+        for index in next_index:
+            started = time.perf_counter()
+            timings = await send(index)
+            latencies.append(time.perf_counter() - started)
+            for stage, seconds in (timings or {}).items():
+                stages.setdefault(stage, []).append(seconds)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return {"seconds": time.perf_counter() - started, "latencies": sorted(latencies), "stages": stages}
+
+def report(name: str, result: dict):
+    latencies = result["latencies"]
+    rate = len(latencies) / result["seconds"] if result["seconds"] else 0
+    print(f"\n{name}: {len(latencies)} messages in {result['seconds']:.2f}s, {rate:.1f} msg/s")
+    print(f"  latency  p50 {percentile(latencies, 50) * 1000:7.2f} ms   p99 {percentile(latencies, 99) * 1000:7.2f} ms")
+    for stage, values in result["stages"].items():
+        values = sorted(values)
+        mean = sum(values) / len(values)
+        print(f"  {stage:<8} mean {mean * 1000:7.3f} ms   p50 {percentile(values, 50) * 1000:7.3f} ms   p99 {percentile(values, 99) * 1000:7.3f} ms")
+
+def sample_leave(index: int) -> dict:
+    from bson import ObjectId
+
+    return {
+        "_id": str(ObjectId()),
+        "manager_id": str(ObjectId()),
+        "employee_id": str(ObjectId()),
+        "employee_name": f"Bench Employee {index}",
+        "employee_department": "Engineering",
+        "employee_email": f"employee{index}@example.com",
+        "manager_email": "manager@example.com",
+        "leave_type": "annual",
+        "start_date": "2026-03-02",
+        "end_date": "2026-03-06",
+        "days": 5,
+        "reason": "Family trip, planned well in advance",
+        "status": "pending",
+        "is_action_taken": False,
+    }
+
+async def _main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure email rendering and delivery throughput")
+    parser.add_argument("--messages", type=int, default=1000, help="messages per kind")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--sink", action="store_true", help="start bench.smtp_sink in this process (messages discarded)")
+    parser.add_argument("--starttls", action="store_true", help="use STARTTLS (with --sink: self-signed certificate)")
+    parser.add_argument("--with-db", action="store_true", help="also run send_leave_action_email end to end; it reads each leave from MONGODB_URI")
+    args = parser.parse_args(argv)
+
+    # Settings are read at import time, so they must be in place first.
+    # The rate limit is off and the pool matches the concurrency, so SMTP
+    # throughput is what gets measured.
+    os.environ.update({
+        "EMAIL_HOST": args.host,
+        "EMAIL_PORT": str(args.port),
+        "SMTP_STARTTLS": "true" if args.starttls else "false",
+    })
+    os.environ.setdefault("EMAIL_USER", "bench@example.com")
+    os.environ.setdefault("EMAIL_PASS", "bench")
+    os.environ.setdefault("SMTP_RATE_LIMIT_PER_SECOND", "0")
+    os.environ.setdefault("SMTP_POOL_SIZE", str(args.concurrency))
+    # db.py needs a URI to import; the client connects lazily, so only --with-db uses it
+    os.environ.setdefault("MONGODB_URI", "mongodb://127.0.0.1:27017/leave_bench")
+    # Approval tokens refuse to sign without a secret
+    os.environ.setdefault("SECRET_KEY", "bench-secret-key")
+
+    from fastapi.concurrency import run_in_threadpool
+    from app.utils.email import send_leave_action_email, send_password_reset_otp, BACKEND_URL, FRONTEND_URL, EMAIL_USER
+    from app.utils.email_templates import AlternativeSkeleton, LEAVE_ACTION_TEMPLATES, get_email_template, leave_action_subject, load_email_templates
+    from app.utils.smtp import close_smtp_pool, get_smtp_pool
+    from app.utils.tokens import generate_approval_token
+
+    controller = None
+    if args.sink:
+        from bench.smtp_sink import self_signed_context, start_sink
+
+        controller = start_sink(args.host, args.port, None, self_signed_context(args.host) if args.starttls else None)
+
+    load_email_templates()
+    templates = [get_email_template(name) for name in LEAVE_ACTION_TEMPLATES.values()]
+    skeleton = AlternativeSkeleton(list(LEAVE_ACTION_TEMPLATES))
+    pool = get_smtp_pool()
+
+    # The same steps as send_leave_action_email, minus its database read,
+    # timed one by one
+    async def send_staged(index: int) -> Dict[str, float]:
+        leave = sample_leave(index)
+        t0 = time.perf_counter()
+        leave["approval_token"] = generate_approval_token(leave["_id"], leave["manager_id"], "approve", 24)
+        leave["rejection_token"] = generate_approval_token(leave["_id"], leave["manager_id"], "reject", 24)
+        t1 = time.perf_counter()
+        context = dict(leave, backend_url=BACKEND_URL, frontend_url=FRONTEND_URL)
+        bodies = [template.render(leave=context) for template in templates]
+        t2 = time.perf_counter()
+        data = skeleton.fill(EMAIL_USER, leave["manager_email"], leave_action_subject(leave), bodies)
+        t3 = time.perf_counter()
+        await run_in_threadpool(pool.sendmail, EMAIL_USER, [leave["manager_email"]], data)
+        t4 = time.perf_counter()
+        return {"tokens": t1 - t0, "render": t2 - t1, "mime": t3 - t2, "smtp": t4 - t3}
+
+    async def send_otp(index: int) -> Dict[str, float]:
+        await run_in_threadpool(send_password_reset_otp, f"employee{index}@example.com", f"{index % 1000000:06d}")
+        return {}
+
+    async def send_end_to_end(index: int) -> Dict[str, float]:
+        await send_leave_action_email(sample_leave(index))
+        return {}
+
+    print(f"Sending to {args.host}:{args.port}{' (STARTTLS)' if args.starttls else ''}, "
+          f"{args.messages} messages per kind at concurrency {args.concurrency}")
+    try:
+        # Warm the pool so connection setup isn't charged to the first messages
+        await run_concurrently(args.concurrency, args.concurrency, send_staged)
+
+        report("leave_action (stages)", await run_concurrently(args.messages, args.concurrency, send_staged))
+        report("password_reset_otp", await run_concurrently(args.messages, args.concurrency, send_otp))
+        if args.with_db:
+            end_to_end = await run_concurrently(args.messages, args.concurrency, send_end_to_end)
+            report("leave_action (send_leave_action_email)", end_to_end)
+        if controller is not None:
+            print(f"\nSink received {controller.handler.received} message(s), {controller.handler.bytes / 1024:.0f} KiB")
+        return 0
+    finally:
+        close_smtp_pool()
+        if controller is not None:
+            controller.stop()
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main()))
@@ -0,0 +1,386 @@
+"""
+End-to-end HTTP load test: seeds a bench database (bench.seed), then drives
+the API with a weighted mix of employee, manager and email-approval traffic
+for a fixed time and reports requests/sec and latency percentiles per route.
+
+By default the app from app.main runs in this process (through its ASGI
+interface, lifespan included), so one command needs nothing but a mongod.
+With --url the same traffic goes to a server that is already running; it
+must use the same MONGODB_URI and SECRET_KEY, since users and pending
+requests are read from the database and email approval tokens are minted
+here.
+
+The outbox worker is disabled in-process; approval emails stay queued and
+their cost is measured by bench.email_bench instead.
+
+Results can be saved as a baseline under bench/baselines/ and committed, so
+a later run (--compare) shows regressions as a diff between commits.
+
+Usage (from server/, with a local mongod):
+    python -m bench.load_test                                  # seed, 60s at concurrency 32
+    python -m bench.load_test --duration 120 --concurrency 64
+    python -m bench.load_test --save-baseline main             # writes bench/baselines/main.json
+    python -m bench.load_test --compare main --fail-on-regression
+    python -m bench.load_test --url http://127.0.0.1:8000 --no-seed
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import Counter, deque
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BASELINES_DIR = Path(__file__).resolve().parent / "baselines"
+DEFAULT_MONGODB_URI = "mongodb://127.0.0.1:27017/leave_bench"
+
+# Scenario weights; each scenario is one or more requests by one user
+MIX = {
+    "employee_dashboard": 40,
+    "submit_leave": 10,
+    "manager_dashboard": 30,
+    "email_approval": 10,
+    "login": 10,
+}
+
+# Submissions start here, one working day per week, so they never overlap
+# the seeded history or each other and stay within the annual entitlement
+SUBMIT_FROM_YEAR = 2030
+SUBMITS_PER_YEAR = 20
+
+class RouteStats:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+
+    def summary(self, seconds: float) -> dict:
+        from bench.stats import percentile
+
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        errors = sum(n for status, n in self.statuses.items() if not str(status).startswith("2"))
+        return {
+            "requests": count,
+            "errors": errors,
+            "rps": round(count / seconds, 2) if seconds else 0,
+            "mean_ms": round(sum(latencies) / count * 1000, 2) if count else 0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p90_ms": round(percentile(latencies, 90) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            "max_ms": round(latencies[-1] * 1000, 2) if count else 0,
+            "statuses": {str(status): n for status, n in sorted(self.statuses.items(), key=lambda item: str(item[0]))},
+        }
+
+class LoadTest:
+    """
+    Virtual users sharing one HTTP client. Employees and managers are taken
+    from the seeded database and logged in once before the clock starts;
+    each manager's pending queue is consumed by dashboard and email
+    approvals and refilled by submissions.
+    """
+    def __init__(self, client, rng: random.Random, record: bool = True):
+        self.client = client
+        self.rng = rng
+        self.stats: Dict[str, RouteStats] = {}
+        self.record = record
+        self.employees: List[dict] = []
+        self.managers: Dict[str, dict] = {}
+
+    async def call(self, route: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+            status = response.status_code
+        except Exception as e:  # timeouts, dropped connections: counted, not fatal
+            response, status = None, type(e).__name__
+        if self.record:
+            stats = self.stats.setdefault(route, RouteStats())
+            stats.latencies.append(time.perf_counter() - started)
+            stats.statuses[status] += 1
+        return response
+
+    async def load_population(self, database, users: int):
+        """
+        Read the seeded users and pending queues, then log in `users`
+        employees (sampled) and every manager
+        """
+        from bench.seed import BENCH_PASSWORD
+
+        managers = await database["users"].find({"role": "manager"}).to_list()
+        employees = await database["users"].find({"role": "employee"}).to_list()
+        if not managers or not employees:
+            raise RuntimeError(f"No bench users in {database.name}; run without --no-seed or python -m bench.seed first")
+        self.employees = self.rng.sample(employees, min(users, len(employees)))
+        by_department = {manager["department"]: manager for manager in managers}
+
+        queues: Dict[str, deque] = {str(manager["_id"]): deque() for manager in managers}
+        cursor = database["leave_requests"].find({"status": "pending"}, {"manager_id": 1}).sort("created_at", 1)
+        async for leave in cursor:
+            queues.setdefault(str(leave["manager_id"]), deque()).append(str(leave["_id"]))
+
+        # Carry on after earlier runs' submissions instead of colliding with them
+        employee_ids = [employee["_id"] for employee in self.employees]
+        submitted = await (await database["leave_requests"].aggregate([
+            {"$match": {"employee_id": {"$in": employee_ids}, "start_date": {"$gte": f"{SUBMIT_FROM_YEAR}-01-01"}}},
+            {"$group": {"_id": "$employee_id", "count": {"$sum": 1}}},
+        ])).to_list()
+        next_slot = {row["_id"]: row["count"] for row in submitted}
+
+        async def login(user: dict) -> str:
+            response = await self.client.post("/auth/login", data={"username": user["username"], "password": BENCH_PASSWORD})
+            response.raise_for_status()
+            return response.json()["access_token"]
+
+        tokens = await asyncio.gather(*(login(user) for user in [*self.employees, *managers]))
+        for employee, token in zip(self.employees, tokens):
+            employee["headers"] = {"Authorization": f"Bearer {token}"}
+            employee["manager"] = by_department[employee["department"]]
+            employee["next_slot"] = next_slot.get(employee["_id"], 0)
+        for manager, token in zip(managers, tokens[len(self.employees):]):
+            manager["headers"] = {"Authorization": f"Bearer {token}"}
+            manager["queue"] = queues[str(manager["_id"])]
+            self.managers[str(manager["_id"])] = manager
+
+    def _next_pending(self, manager: dict) -> Optional[str]:
+        try:
+            return manager["queue"].popleft()
+        except IndexError:
+            return None
+
+    async def employee_dashboard(self):
+        employee = self.rng.choice(self.employees)
+        headers = employee["headers"]
+        await self.call("GET /leave/my-requests", "GET", "/leave/my-requests", headers=headers, params={"limit": 20})
+        await self.call("GET /leave/stats", "GET", "/leave/stats", headers=headers)
+        await self.call("GET /leave/balance", "GET", "/leave/balance", headers=headers)
+
+    async def submit_leave(self):
+        employee = self.rng.choice(self.employees)
+        slot = employee["next_slot"]
+        employee["next_slot"] += 1
+        year = SUBMIT_FROM_YEAR + slot // SUBMITS_PER_YEAR
+        first_monday = date(year, 1, 1) + timedelta(days=(7 - date(year, 1, 1).weekday()) % 7)
+        day = first_monday + timedelta(weeks=slot % SUBMITS_PER_YEAR)
+        response = await self.call("POST /leave/submit", "POST", "/leave/submit", headers=employee["headers"], json={
+            "start_date": day.isoformat(),
+            "end_date": day.isoformat(),
+            "leave_type": "annual",
+            "reason": "Load test",
+            "manager_email": employee["manager"]["email"],
+        })
+        if response is not None and response.status_code == 200:
+            employee["manager"]["queue"].append(response.json()["leave_request_id"])
+
+    async def manager_dashboard(self):
+        manager = self.rng.choice(list(self.managers.values()))
+        headers = manager["headers"]
+        await self.call("GET /leave/pending-approvals", "GET", "/leave/pending-approvals", headers=headers, params={"limit": 20})
+        await self.call("GET /leave/stats?scope=team", "GET", "/leave/stats", headers=headers, params={"scope": "team"})
+        leave_id = self._next_pending(manager)
+        if leave_id is not None:
+            action = "approve" if self.rng.random() < 0.8 else "reject"
+            await self.call(f"POST /leave/{{id}}/{action}", "POST", f"/leave/{leave_id}/{action}", headers=headers, json={"comments": "Load test"})
+
+    async def email_approval(self):
+        from app.utils.tokens import generate_approval_token
+        from bench.seed import BENCH_PASSWORD
+
+        manager = self.rng.choice(list(self.managers.values()))
+        leave_id = self._next_pending(manager)
+        if leave_id is None:
+            return
+        manager_id = str(manager["_id"])
+        await self.call("POST /leave/approve-with-token", "POST", "/leave/approve-with-token", data={
+            "token": generate_approval_token(leave_id, manager_id, "approve", 24),
+            "leave_id": leave_id,
+            "manager_id": manager_id,
+            "password": BENCH_PASSWORD,
+            "action": "approve",
+            "comments": "",
+        })
+
+    async def login(self):
+        from bench.seed import BENCH_PASSWORD
+
+        employee = self.rng.choice(self.employees)
+        await self.call("POST /auth/login", "POST", "/auth/login", data={"username": employee["username"], "password": BENCH_PASSWORD})
+
+    async def run(self, seconds: float, concurrency: int) -> float:
+        scenarios = [getattr(self, name) for name in MIX]
+        weights = list(MIX.values())
+        deadline = time.perf_counter() + seconds
+
+        async def user():
+            while time.perf_counter() < deadline:
+                await self.rng.choices(scenarios, weights=weights)[0]()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        return time.perf_counter() - started
+
+def git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True).stdout.strip()
+        return result.stdout.strip() + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_results(results: dict):
+    print(f"\n{'route':<32} {'reqs':>7} {'err':>5} {'req/s':>8} {'mean':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}  (ms)")
+    for route, row in [*results["routes"].items(), ("total", results["total"])]:
+        print(f"{route:<32} {row['requests']:>7} {row['errors']:>5} {row['rps']:>8.1f} {row['mean_ms']:>8.1f} "
+              f"{row['p50_ms']:>8.1f} {row['p90_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['max_ms']:>8.1f}")
+    failing = {route: row["statuses"] for route, row in results["routes"].items() if row["errors"]}
+    for route, statuses in failing.items():
+        print(f"  {route}: {statuses}")
+
+def compare(baseline: dict, results: dict, threshold: float) -> List[str]:
+    """
+    Print current vs baseline per route and return the routes whose
+    throughput fell or p99 latency rose by more than `threshold` percent
+    """
+    def change(old: float, new: float) -> float:
+        return (new - old) / old * 100 if old else 0.0
+
+    print(f"\nCompared with baseline {baseline['name']} ({baseline.get('commit') or 'unknown commit'}), threshold {threshold:g}%")
+    print(f"{'route':<32} {'req/s: baseline -> now':>29} {'p99 ms: baseline -> now':>29}")
+    regressions = []
+    rows = {**results["routes"], "total": results["total"]}
+    old_rows = {**baseline["routes"], "total": baseline["total"]}
+    for route, row in rows.items():
+        old = old_rows.get(route)
+        if old is None:
+            print(f"{route:<32} (new)")
+            continue
+        rps_change = change(old["rps"], row["rps"])
+        p99_change = change(old["p99_ms"], row["p99_ms"])
+        regressed = rps_change < -threshold or p99_change > threshold
+        if regressed:
+            regressions.append(route)
+        print(f"{route:<32} {old['rps']:>8.1f} -> {row['rps']:>8.1f} {rps_change:>+7.1f}% "
+              f"{old['p99_ms']:>8.1f} -> {row['p99_ms']:>8.1f} {p99_change:>+7.1f}%{'  REGRESSION' if regressed else ''}")
+    for route in old_rows.keys() - rows.keys():
+        print(f"{route:<32} (missing from this run)")
+    return regressions
+
+async def _main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Seed a bench database and load test the API")
+    parser.add_argument("--mongodb-uri", default=os.getenv("BENCH_MONGODB_URI", DEFAULT_MONGODB_URI),
+                        help="database to seed and read users from; its name must end in _bench")
+    parser.add_argument("--url", help="base URL of a running server (default: run app.main in this process)")
+    parser.add_argument("--duration", type=float, default=60, help="seconds of measured traffic")
+    parser.add_argument("--warmup", type=float, default=5, help="seconds of unmeasured traffic first")
+    parser.add_argument("--concurrency", type=int, default=32, help="virtual users")
+    parser.add_argument("--users", type=int, default=200, help="employees logged in and picked from")
+    parser.add_argument("--no-seed", action="store_true", help="reuse the data already in the database")
+    parser.add_argument("--managers", type=int, default=20)
+    parser.add_argument("--employees-per-manager", type=int, default=40)
+    parser.add_argument("--history-per-employee", type=int, default=20)
+    parser.add_argument("--pending-per-manager", type=int, default=500)
+    parser.add_argument("--save-baseline", metavar="NAME", help="write results to bench/baselines/NAME.json")
+    parser.add_argument("--compare", metavar="NAME", help="diff results against bench/baselines/NAME.json")
+    parser.add_argument("--threshold", type=float, default=15, help="percent change flagged as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 if --compare finds a regression")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        path = BASELINES_DIR / f"{args.compare}.json"
+        if not path.exists():
+            print(f"No baseline at {path}")
+            return 2
+        baseline = json.loads(path.read_text())
+
+    # Settings are read at import time, so they must be in place first.
+    # .env is loaded here so a --url server and this process share SECRET_KEY.
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    os.environ["MONGODB_URI"] = args.mongodb_uri
+    os.environ.setdefault("SECRET_KEY", "bench-secret-key")
+    os.environ["OUTBOX_WORKER_ENABLED"] = "false"
+    os.environ["INDEXES_ON_STARTUP"] = "off"  # the seed applies them
+    # Keep the app's per-request log lines out of the report
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    import httpx
+    from app.models.db import db, close_db
+    from bench.seed import seed
+
+    if not db.name.endswith("_bench"):
+        print(f"Refusing to use database {db.name!r}: bench database names must end in _bench")
+        return 2
+    if not args.no_seed:
+        counts = await seed(db, args.managers, args.employees_per_manager, args.history_per_employee, args.pending_per_manager)
+        print(f"Seeded {db.name} in {counts.pop('seconds'):.1f}s: " + ", ".join(f"{count} {name}" for name, count in counts.items()))
+
+    lifespan = contextlib.nullcontext()
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=30, limits=httpx.Limits(max_connections=args.concurrency))
+    else:
+        from app.main import app
+
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=30)
+        lifespan = app.router.lifespan_context(app)
+
+    try:
+        async with client, lifespan:
+            test = LoadTest(client, random.Random(1), record=False)
+            await test.load_population(db, args.users)
+            print(f"Target {args.url or 'app.main (in process)'}: {len(test.employees)} employees and "
+                  f"{len(test.managers)} managers logged in; {args.concurrency} virtual users, "
+                  f"{args.warmup:g}s warmup + {args.duration:g}s")
+            if args.warmup > 0:
+                await test.run(args.warmup, args.concurrency)
+            test.record = True
+            seconds = await test.run(args.duration, args.concurrency)
+    finally:
+        await close_db()
+
+    total = RouteStats()
+    for stats in test.stats.values():
+        total.latencies.extend(stats.latencies)
+        total.statuses.update(stats.statuses)
+    results = {
+        "name": args.save_baseline,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "config": {
+            "target": "url" if args.url else "in-process",
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "users": args.users,
+            "managers": args.managers,
+            "employees_per_manager": args.employees_per_manager,
+            "history_per_employee": args.history_per_employee,
+            "pending_per_manager": args.pending_per_manager,
+            "mix": MIX,
+        },
+        "routes": {route: test.stats[route].summary(seconds) for route in sorted(test.stats)},
+        "total": total.summary(seconds),
+    }
+    print_results(results)
+
+    if args.save_baseline:
+        BASELINES_DIR.mkdir(exist_ok=True)
+        path = BASELINES_DIR / f"{args.save_baseline}.json"
+        path.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nSaved baseline {path}")
+
+    if baseline is not None:
+        if baseline.get("config") != results["config"]:
+            print("\nNote: the baseline was recorded with different settings; the comparison may not be meaningful")
+        regressions = compare(baseline, results, args.threshold)
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main()))
@@ -0,0 +1,223 @@
+"""
+Seed a throwaway database with realistic volumes for bench.load_test.
+
+Managers each lead a department of employees; every employee has a couple
+of years of decided leave history, and every manager a queue of pending
+requests to work through. Balances are written to match, as the app would
+have kept them. Everyone's password is BENCH_PASSWORD.
+
+The seed is deterministic (fixed random seed), so two runs against the same
+settings produce the same data and their load test results are comparable.
+
+Usage (from server/):
+    MONGODB_URI=mongodb://127.0.0.1:27017/leave_bench python -m bench.seed
+    MONGODB_URI=... python -m bench.seed --managers 50 --employees-per-manager 40
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from typing import Dict, List, Tuple
+from bson import ObjectId
+
+BENCH_PASSWORD = "bench-password"
+# Only databases named like this are ever dropped
+BENCH_DB_SUFFIX = "_bench"
+SEED = 20240101
+
+SEEDED_COLLECTIONS = [
+    "users", "leave_requests", "leave_balances", "email_outbox",
+    "approval_tokens", "used_approval_tokens", "password_resets", "migrations",
+]
+
+# Decided history: (leave type, weight, longest request in calendar days)
+HISTORY_TYPES = [("annual", 6, 10), ("sick", 3, 3), ("personal", 1, 2)]
+HISTORY_STATUSES = [("approved", 8), ("rejected", 2)]
+HISTORY_YEARS = (2024, 2025)
+# Pending requests sit in a year nobody submits into during the load test
+PENDING_YEAR = 2028
+
+REASONS = [
+    "Family trip, planned well in advance",
+    "Doctor's appointment",
+    "Moving house",
+    "Wedding in the family",
+    "Feeling unwell",
+    "School holidays",
+]
+
+BATCH = 5000
+
+def _weighted(rng: random.Random, choices: List[Tuple]) -> Tuple:
+    return rng.choices(choices, weights=[choice[1] for choice in choices])[0]
+
+def _weekday_in(rng: random.Random, year: int) -> date:
+    day = date(year, 1, 1) + timedelta(days=rng.randrange(365))
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    return day
+
+def _user(index: str, role: str, department: str, hashed_password: str) -> dict:
+    return {
+        "_id": ObjectId(),
+        "username": f"{role}{index}",
+        "email": f"{role}{index}@bench.example.com",
+        "hashed_password": hashed_password,
+        "full_name": f"Bench {role.title()} {index}",
+        "role": role,
+        "department": department,
+        "region": None,
+        "is_manager": role == "manager",
+        "is_hr": False,
+        "token_version": 0,
+    }
+
+def _leave(rng: random.Random, employee: dict, manager: dict, leave_type: str, start: date, end: date, status: str, count_days) -> dict:
+    created = datetime.combine(start - timedelta(days=rng.randint(3, 40)), dtime(9), tzinfo=timezone.utc)
+    leave = {
+        "_id": ObjectId(),
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "leave_type": leave_type,
+        "reason": rng.choice(REASONS),
+        "manager_email": manager["email"],
+        "employee_id": employee["_id"],
+        "manager_id": manager["_id"],
+        "status": status,
+        "is_action_taken": status != "pending",
+        "created_at": created.isoformat(),
+        "employee_name": employee["full_name"],
+        "employee_email": employee["email"],
+        "employee_department": employee["department"],
+        "days": count_days(start, end),
+        "region": None,
+        "start": datetime.combine(start, dtime(), tzinfo=timezone.utc),
+        "end": datetime.combine(end, dtime(), tzinfo=timezone.utc),
+        "updated_at": created,
+        "version": 1,
+    }
+    if status != "pending":
+        decided = created + timedelta(days=rng.randint(0, 2), hours=rng.randint(0, 8))
+        leave.update({
+            "approver_id": manager["_id"],
+            "action_timestamp": decided.isoformat(),
+            "processed_via": "dashboard",
+            "updated_at": decided,
+            "version": 2,
+        })
+    return leave
+
+def build_dataset(managers: int, employees_per_manager: int, history_per_employee: int, pending_per_manager: int, hashed_password: str) -> dict:
+    """
+    Generate the seed documents in memory
+
+    Returns:
+        {"users", "leaves", "balances"} lists ready for insert_many
+    """
+    from app.utils.balances import COUNTED_FIELD, LEAVE_ENTITLEMENTS
+    from app.utils.workdays import work_calendars
+
+    rng = random.Random(SEED)
+    count_days = lambda start, end: work_calendars.count(start, end, None)
+    users, leaves = [], []
+    for m in range(managers):
+        department = f"Department {m}"
+        manager = _user(str(m), "manager", department, hashed_password)
+        team = [_user(f"{m}_{e}", "employee", department, hashed_password) for e in range(employees_per_manager)]
+        users.append(manager)
+        users.extend(team)
+
+        for employee in team:
+            for _ in range(history_per_employee):
+                leave_type, _, longest = _weighted(rng, HISTORY_TYPES)
+                start = _weekday_in(rng, rng.choice(HISTORY_YEARS))
+                end = start + timedelta(days=rng.randrange(longest))
+                leaves.append(_leave(rng, employee, manager, leave_type, start, end, _weighted(rng, HISTORY_STATUSES)[0], count_days))
+        for _ in range(pending_per_manager):
+            leave_type, _, longest = _weighted(rng, HISTORY_TYPES)
+            start = _weekday_in(rng, PENDING_YEAR)
+            end = start + timedelta(days=rng.randrange(longest))
+            leaves.append(_leave(rng, rng.choice(team), manager, leave_type, start, end, "pending", count_days))
+
+    # Same arithmetic as balance_update, summed up front
+    totals: Dict[tuple, Dict[str, int]] = {}
+    for leave in leaves:
+        leave[COUNTED_FIELD] = leave["status"] != "rejected"
+        if not leave[COUNTED_FIELD]:
+            continue
+        key = (leave["employee_id"], int(leave["start_date"][:4]), leave["leave_type"])
+        entry = totals.setdefault(key, {"pending": 0, "used": 0})
+        entry["pending" if leave["status"] == "pending" else "used"] += leave["days"]
+    balances = [
+        {"employee_id": employee_id, "year": year, "leave_type": leave_type,
+         "entitled": LEAVE_ENTITLEMENTS.get(leave_type), **entry}
+        for (employee_id, year, leave_type), entry in totals.items()
+    ]
+    return {"users": users, "leaves": leaves, "balances": balances}
+
+async def seed(database, managers: int = 20, employees_per_manager: int = 40, history_per_employee: int = 20, pending_per_manager: int = 500) -> dict:
+    """
+    Drop the bench collections and load a fresh dataset
+
+    Args:
+        database: an AsyncDatabase whose name ends in BENCH_DB_SUFFIX
+
+    Returns:
+        Document counts per collection and the seconds taken
+    """
+    if not database.name.endswith(BENCH_DB_SUFFIX):
+        raise ValueError(f"Refusing to seed {database.name!r}: bench database names must end in {BENCH_DB_SUFFIX!r}")
+
+    from app.migrations.runner import CHECKPOINT_COLLECTION
+    from app.migrations.versions import MIGRATIONS
+    from app.models.indexes import ensure_indexes
+    from app.utils.auth import get_password_hash
+
+    started = time.perf_counter()
+    for name in SEEDED_COLLECTIONS:
+        await database[name].drop()
+    await ensure_indexes(database)
+
+    # One hash for everyone; bcrypt per user would dominate the seed time
+    dataset = build_dataset(managers, employees_per_manager, history_per_employee, pending_per_manager, get_password_hash(BENCH_PASSWORD))
+    counts = {}
+    for collection, key in [("users", "users"), ("leave_requests", "leaves"), ("leave_balances", "balances")]:
+        documents = dataset[key]
+        for offset in range(0, len(documents), BATCH):
+            await database[collection].insert_many(documents[offset:offset + BATCH], ordered=False)
+        counts[collection] = len(documents)
+    # The data is written in its migrated shape, balances included, so the
+    # app treats every migration (and with it the balance check) as done
+    finished_at = datetime.now(timezone.utc)
+    await database[CHECKPOINT_COLLECTION].insert_many([
+        {"_id": migration.name, "status": "done", "finished_at": finished_at, "scanned": 0, "modified": 0, "skipped": 0}
+        for migration in MIGRATIONS
+    ])
+    counts["seconds"] = time.perf_counter() - started
+    return counts
+
+async def _main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Seed a bench database (name must end in _bench) for bench.load_test")
+    parser.add_argument("--managers", type=int, default=20)
+    parser.add_argument("--employees-per-manager", type=int, default=40)
+    parser.add_argument("--history-per-employee", type=int, default=20, help="decided requests per employee over 2024-2025")
+    parser.add_argument("--pending-per-manager", type=int, default=500, help="requests waiting in each manager's queue")
+    args = parser.parse_args(argv)
+
+    from app.models.db import db, close_db
+
+    try:
+        counts = await seed(db, args.managers, args.employees_per_manager, args.history_per_employee, args.pending_per_manager)
+    except ValueError as e:
+        print(e)
+        return 2
+    finally:
+        await close_db()
+    print(f"Seeded {db.name} in {counts.pop('seconds'):.1f}s: "
+          + ", ".join(f"{count} {name}" for name, count in counts.items()))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main()))
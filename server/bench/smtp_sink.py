@@ -0,0 +1,122 @@
+"""
+Local SMTP sink for measuring the email path without a mail provider.
+
+Accepts any AUTH login, optionally offers STARTTLS, and stores every
+message in a maildir (or drops it with --discard).
+
+Usage (from server/):
+    python -m bench.smtp_sink                          # 127.0.0.1:8025, maildir ./bench-mail
+    python -m bench.smtp_sink --starttls               # with a throwaway self-signed certificate
+    python -m bench.smtp_sink --tls-cert c.pem --tls-key k.pem
+
+Then point the app at it:
+    EMAIL_HOST=127.0.0.1 EMAIL_PORT=8025 EMAIL_USER=bench@example.com EMAIL_PASS=x SMTP_STARTTLS=false
+"""
+import argparse
+import logging
+import mailbox
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+# aiosmtpd logs this itself on every successful AUTH
+logging.getLogger("mail.log").addFilter(lambda record: "login_data is deprecated" not in record.getMessage())
+
+class SinkHandler:
+    def __init__(self, maildir: Optional[Path] = None):
+        self.maildir = mailbox.Maildir(maildir, create=True) if maildir else None
+        self.received = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.maildir is not None:
+            self.maildir.add(envelope.original_content or envelope.content)
+        with self._lock:
+            self.received += 1
+            self.bytes += len(envelope.original_content or envelope.content)
+        return "250 Message accepted for delivery"
+
+def _accept_any_login(server, session, envelope, mechanism, auth_data):
+    return AuthResult(success=True)
+
+def self_signed_context(hostname: str) -> ssl.SSLContext:
+    """
+    Server TLS context from a certificate made on the spot with openssl.
+    smtplib's starttls() does not verify certificates, so the app accepts it.
+    """
+    directory = Path(tempfile.mkdtemp(prefix="smtp-sink-"))
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", f"/CN={hostname}", "-keyout", str(key), "-out", str(cert)],
+        check=True, capture_output=True,
+    )
+    return tls_context(cert, key)
+
+def tls_context(cert: Path, key: Path) -> ssl.SSLContext:
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert, key)
+    return context
+
+def start_sink(
+    host: str = "127.0.0.1",
+    port: int = 8025,
+    maildir: Optional[Path] = None,
+    context: Optional[ssl.SSLContext] = None,
+) -> Controller:
+    """
+    Start the sink on a background thread; stop it with controller.stop().
+    The handler (controller.handler) counts what it received.
+    """
+    controller = Controller(
+        SinkHandler(maildir),
+        hostname=host,
+        port=port,
+        tls_context=context,
+        authenticator=_accept_any_login,
+        # Allow AUTH on a plain connection when there is no TLS to upgrade to
+        auth_require_tls=context is not None,
+    )
+    controller.start()
+    return controller
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a local SMTP sink that stores messages in a maildir")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--maildir", type=Path, default=Path("bench-mail"))
+    parser.add_argument("--discard", action="store_true", help="count messages without storing them")
+    parser.add_argument("--starttls", action="store_true", help="offer STARTTLS with a self-signed certificate")
+    parser.add_argument("--tls-cert", type=Path, help="certificate for STARTTLS (PEM)")
+    parser.add_argument("--tls-key", type=Path, help="private key for STARTTLS (PEM)")
+    args = parser.parse_args(argv)
+
+    context = None
+    if args.tls_cert and args.tls_key:
+        context = tls_context(args.tls_cert, args.tls_key)
+    elif args.starttls:
+        context = self_signed_context(args.host)
+
+    controller = start_sink(args.host, args.port, None if args.discard else args.maildir, context)
+    print(f"SMTP sink listening on {args.host}:{args.port}"
+          f"{' with STARTTLS' if context else ''}, "
+          f"{'discarding messages' if args.discard else f'maildir {args.maildir}'}")
+    try:
+        while True:
+            time.sleep(5)
+            handler = controller.handler
+            print(f"{handler.received} message(s), {handler.bytes / 1024:.0f} KiB received")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        controller.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+from typing import List
+
+def percentile(values: List[float], q: float) -> float:
+    # Nearest rank; values must be sorted
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, int(round(q / 100 * len(values) + 0.5)) - 1))]
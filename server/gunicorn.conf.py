@@ -0,0 +1,27 @@
+"""
+Gunicorn hooks for the Procfile's multi-worker setup.
+
+Each worker is its own process with its own metrics, so they are written to
+files in PROMETHEUS_MULTIPROC_DIR and /metrics (served by any one worker)
+sums them. The directory must be set before workers import
+prometheus_client and emptied before they start.
+"""
+import os
+import shutil
+import tempfile
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "leave-api-metrics"))
+# Also here, for commands that load the app without starting the server (--check-config)
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+def on_starting(server):
+    # Files left by a previous run would be added to this one's totals
+    directory = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+
+def child_exit(server, worker):
+    # Drop the exited worker's live gauges (in-flight requests, bcrypt queue)
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
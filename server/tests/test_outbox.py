@@ -0,0 +1,66 @@
+"""
+Outbox delivery against a real MongoDB
+
+The database named in MONGODB_URI must end in _test; its outbox is dropped
+before each run. Tests are skipped when no server answers.
+
+Usage (from server/):
+    MONGODB_URI=mongodb://127.0.0.1:27017/leave_test python -m pytest tests
+"""
+import asyncio
+import os
+from datetime import datetime, timezone
+import pytest
+from bson import ObjectId
+
+os.environ.setdefault("MONGODB_URI", "mongodb://127.0.0.1:27017/leave_test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+from pymongo.errors import ServerSelectionTimeoutError
+from app.models.db import db, close_db
+from app.models.indexes import ensure_indexes
+from app.utils import outbox
+
+# Only databases named like this are ever dropped
+TEST_DB_SUFFIX = "_test"
+
+async def _fresh_outbox():
+    if not db.name.endswith(TEST_DB_SUFFIX):
+        pytest.skip(f"{db.name!r} is not a test database: its name must end in {TEST_DB_SUFFIX!r}")
+    try:
+        await db.command("ping")
+    except ServerSelectionTimeoutError:
+        pytest.skip("No MongoDB server at MONGODB_URI")
+    await outbox.outbox_collection.drop()
+    await ensure_indexes(db)
+
+async def _make_due(query: dict):
+    await outbox.outbox_collection.update_many(query, {"$set": {"next_attempt_at": datetime.now(timezone.utc)}})
+
+def test_failed_digest_retries_beside_the_open_one(monkeypatch):
+    monkeypatch.setattr(outbox, "EMAIL_DIGEST_WINDOW_SECONDS", 60)
+    manager_id = ObjectId()
+
+    async def scenario():
+        await _fresh_outbox()
+        await outbox.enqueue_leave_notification({"_id": ObjectId(), "manager_id": manager_id})
+        await _make_due({})
+        failed = await outbox.claim_next()
+        # Submitted while the first digest was being sent, so it opens another
+        await outbox.enqueue_leave_notification({"_id": ObjectId(), "manager_id": manager_id})
+
+        await outbox.mark_failed(failed, RuntimeError("smtp down"))
+
+        retried = await outbox.outbox_collection.find_one({"_id": failed["_id"]})
+        assert retried["status"] == outbox.STATUS_RETRY
+        opened = await outbox.outbox_collection.find_one({"status": outbox.STATUS_PENDING})
+        assert opened["_id"] != failed["_id"] and len(opened["payload"]["leave_ids"]) == 1
+
+        # The open digest's window hasn't passed; the failed one goes out again
+        await _make_due({"_id": failed["_id"]})
+        assert (await outbox.claim_next())["_id"] == failed["_id"]
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        asyncio.run(close_db())